@@ -20,7 +20,7 @@
      Created abstract decorator for object methods.
 '''
 
-from inspect import stack
+import sys
 
 __author__ = 'Vladimir Roncevic'
 __copyright__ = 'Copyright 2017, https://vroncevic.github.io/ats_utilities'
@@ -58,7 +58,7 @@ class AbstractMethod:
             :exceptions: None
         '''
         self.method_name = method_to_abstract.__name__
-        self.method_class_name = stack()[1][3]
+        self.method_class_name = sys._getframe(1).f_code.co_name
         self.method_type = type(method_to_abstract)
         self.method = method_to_abstract
 
@@ -18,14 +18,16 @@
  Info
      Defined class ATSChecker with attribute(s) and method(s).
      Created API fo checking parameters for object methods and functions.
+     Decorator checked (module decorator) is available from package.
 '''
 
 import sys
-from inspect import stack
 from collections import OrderedDict
 
 try:
     from ats_utilities.final import ATSFinal
+    from ats_utilities.checker.level import ATSValidationLevel
+    from ats_utilities.checker.fast_check import ATSFastCheck
 except ImportError as ats_error_message:
     MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
     sys.exit(MESSAGE)  # Force close python ATS ##############################
@@ -40,18 +42,16 @@ __email__ = 'elektron.ronca@gmail.com'
 __status__ = 'Updated'
 
 
-class ATSChecker:
+class ATSChecker(ATSValidationLevel, ATSFastCheck):
     '''
         Defined class ATSChecker with attribute(s) and method(s).
         Created API fo checking parameters for object methods and functions.
+        Validation level (ATSValidationLevel) and checking in one pass
+        (ATSFastCheck) are inherited, usage report is prepared on failure.
         It defines:
 
             :attributes:
                 | __metaclass__ - setting class ATSChecker as final.
-                | NO_ERROR - no error, error id (0).
-                | TYPE_ERROR - type param error id (1).
-                | VALUE_ERROR - value param error id (2).
-                | FORMAT_ERROR - wrong format error id (3).
                 | __start_message - start segment of usage message.
                 | __list_of_params - list of parameters for method/function.
                 | __error_type - list of mapped errors.
@@ -65,11 +65,11 @@ class ATSChecker:
                 | check_values - check parameters (values) for method/function.
                 | priority_error - set priority error id (TYPE_ERROR).
                 | check_params - check parameters for method/function.
+                | report_params - check parameters and prepare usage report.
                 | __str__ - dunder method for object ATSChecker.
     '''
 
     __metaclass__ = ATSFinal
-    NO_ERROR, TYPE_ERROR, VALUE_ERROR, FORMAT_ERROR = 0, 1, 2, 3
 
     def __init__(self):
         '''
@@ -218,14 +218,42 @@ class ATSChecker:
     def check_params(self, params_description):
         '''
             Check parameters for method/function.
+            Usage message is prepared only if checking fails and
+            validation level is full.
 
             :param params_description: parameters description.
             :type params_description: <list>
+            :return: usage message | None, status (0 | 1 | 2 | 3).
+            :rtype: <str> | <NoneType>, <int>
+            :exceptions: None
+        '''
+        validation_level = ATSChecker.get_validation_level()
+        if validation_level == ATSChecker.OFF:
+            return None, ATSChecker.NO_ERROR
+        if ATSChecker.fast_check(params_description):
+            return None, ATSChecker.NO_ERROR
+        if validation_level == ATSChecker.FAILURES_ONLY:
+            return ATSChecker.failure_status(params_description)
+        caller = sys._getframe(1).f_code
+        return self.report_params(
+            params_description, caller.co_filename, caller.co_name
+        )
+
+    def report_params(self, params_description, module, func):
+        '''
+            Check parameters and prepare usage report for method/function.
+
+            :param params_description: parameters description.
+            :type params_description: <list>
+            :param module: module path of checked method/function.
+            :type module: <str>
+            :param func: name of checked method/function.
+            :type func: <str>
             :return: usage message, status (0 | 1 | 2 | 3).
             :rtype: <str>, <int>
             :exceptions: None
         '''
-        func, module, error_id = stack()[1][3], stack()[1][1], 0
+        error_id = 0
         param_error_message, header = None, '\nmod: {0}\n  def: {1}()'
         self.__start_message = header.format(module, func)
         fail_any_check = any([
@@ -255,3 +283,11 @@ class ATSChecker:
             str(self.__list_of_params), str(self.__error_type),
             str(self.__error_type_index), str(self.__error_value_index)
         )
+
+
+# decorator checked uses class ATSChecker, import it after class definition
+try:
+    from ats_utilities.checker.decorator import checked
+except ImportError as ats_error_message:
+    MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
+    sys.exit(MESSAGE)  # Force close python ATS ##############################
@@ -0,0 +1,155 @@
+# -*- coding: UTF-8 -*-
+
+'''
+ Module
+     decorator.py
+ Copyright
+     Copyright (C) 2017 Vladimir Roncevic <elektron.ronca@gmail.com>
+     ats_utilities is free software: you can redistribute it and/or modify it
+     under the terms of the GNU General Public License as published by the
+     Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+     ats_utilities is distributed in the hope that it will be useful, but
+     WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+     See the GNU General Public License for more details.
+     You should have received a copy of the GNU General Public License along
+     with this program. If not, see <http://www.gnu.org/licenses/>.
+ Info
+     Defined decorator checked for checking parameters by signature.
+'''
+
+import sys
+from functools import wraps
+
+try:
+    from ats_utilities.checker import ATSChecker
+    from ats_utilities.exceptions.ats_type_error import ATSTypeError
+    from ats_utilities.exceptions.ats_bad_call_error import ATSBadCallError
+    from ats_utilities.exceptions.ats_parameter_error import ATSParameterError
+except ImportError as ats_error_message:
+    MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
+    sys.exit(MESSAGE)  # Force close python ATS ##############################
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = 'Copyright 2017, https://vroncevic.github.io/ats_utilities'
+__credits__ = ['Vladimir Roncevic']
+__license__ = 'https://github.com/vroncevic/ats_utilities/blob/dev/LICENSE'
+__version__ = '1.8.8'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+
+def checked(*params_specs):
+    '''
+        Decorator for checking parameters of method/function.
+        Parameter specifications ('type:name') are resolved against
+        signature of decorated method/function once, at decoration time.
+        Checking follows process-wide validation level of ATSChecker.
+
+        :param params_specs: parameters specifications.
+        :type params_specs: <tuple>
+        :return: decorator for method/function.
+        :rtype: <function>
+        :exceptions: ATSParameterError
+    '''
+    def decorator(func):
+        '''
+            Prepare checking plan and wrap method/function.
+
+            :param func: method/function for checking.
+            :type func: <function>
+            :return: wrapped method/function.
+            :rtype: <function>
+            :exceptions: ATSParameterError
+        '''
+        code, missing = func.__code__, object()
+        arg_names = code.co_varnames[:code.co_argcount]
+        var_args = None
+        if code.co_flags & 0x04:
+            var_args = code.co_varnames[code.co_argcount]
+        defaults = func.__defaults__ or ()
+        first_default, plan = len(arg_names) - len(defaults), []
+        for param_spec in params_specs:
+            expected_type = ATSChecker.compile_param(param_spec)
+            param_name = param_spec.split(':')[-1]
+            if expected_type is None:
+                raise ATSParameterError(
+                    '{0} [{1}]'.format('wrong param format', param_spec)
+                )
+            if param_name == var_args:
+                plan.append((param_spec, expected_type, None, -1, missing))
+            elif param_name in arg_names:
+                index = arg_names.index(param_name)
+                default = missing
+                if index >= first_default:
+                    default = defaults[index - first_default]
+                plan.append(
+                    (param_spec, expected_type, param_name, index, default)
+                )
+            else:
+                raise ATSParameterError(
+                    '{0} [{1}] {2}()'.format(
+                        'not expected param', param_spec, func.__name__
+                    )
+                )
+        plan, value_types = tuple(plan), ATSChecker.VALUE_TYPES
+        module, var_args_index = code.co_filename, code.co_argcount
+
+        @wraps(func)
+        def checked_func(*args, **kwargs):
+            '''
+                Check parameters and call method/function.
+
+                :param args: positional arguments.
+                :type args: <tuple>
+                :param kwargs: keyword arguments.
+                :type kwargs: <dict>
+                :return: result of method/function.
+                :rtype: <Python object(s)>
+                :exceptions: ATSTypeError | ATSBadCallError
+            '''
+            validation_level = ATSChecker.get_validation_level()
+            if validation_level == ATSChecker.OFF:
+                return func(*args, **kwargs)
+            args_count, params_ok = len(args), True
+            for _, expected_type, param_name, index, default in plan:
+                if index < 0:
+                    inst = args[var_args_index:]
+                elif index < args_count:
+                    inst = args[index]
+                else:
+                    inst = kwargs.get(param_name, default)
+                    if inst is missing:
+                        return func(*args, **kwargs)
+                if type(inst).__name__ != expected_type:
+                    params_ok = False
+                    break
+                if isinstance(inst, value_types) and not inst:
+                    params_ok = False
+                    break
+            if not params_ok:
+                params = []
+                for param_spec, _, param_name, index, default in plan:
+                    if index < 0:
+                        params.append((param_spec, args[var_args_index:]))
+                    elif index < args_count:
+                        params.append((param_spec, args[index]))
+                    else:
+                        params.append(
+                            (param_spec, kwargs.get(param_name, default))
+                        )
+                if validation_level == ATSChecker.FAILURES_ONLY:
+                    error, status = ATSChecker.failure_status(params)
+                else:
+                    error, status = ATSChecker().report_params(
+                        params, module, func.__name__
+                    )
+                if status == ATSChecker.TYPE_ERROR:
+                    raise ATSTypeError(error)
+                if status == ATSChecker.VALUE_ERROR:
+                    raise ATSBadCallError(error)
+            return func(*args, **kwargs)
+        return checked_func
+    return decorator
@@ -0,0 +1,140 @@
+# -*- coding: UTF-8 -*-
+
+'''
+ Module
+     fast_check.py
+ Copyright
+     Copyright (C) 2017 Vladimir Roncevic <elektron.ronca@gmail.com>
+     ats_utilities is free software: you can redistribute it and/or modify it
+     under the terms of the GNU General Public License as published by the
+     Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+     ats_utilities is distributed in the hope that it will be useful, but
+     WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+     See the GNU General Public License for more details.
+     You should have received a copy of the GNU General Public License along
+     with this program. If not, see <http://www.gnu.org/licenses/>.
+ Info
+     Defined class ATSFastCheck with attribute(s) and method(s).
+     Created API for checking parameters in one pass (without report).
+'''
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = 'Copyright 2017, https://vroncevic.github.io/ats_utilities'
+__credits__ = ['Vladimir Roncevic']
+__license__ = 'https://github.com/vroncevic/ats_utilities/blob/dev/LICENSE'
+__version__ = '1.8.8'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+
+class ATSFastCheck(object):
+    '''
+        Defined class ATSFastCheck with attribute(s) and method(s).
+        Created API for checking parameters in one pass (without report).
+        Parameter specifications ('type:name') are compiled once.
+        It defines:
+
+            :attributes:
+                | NO_ERROR - no error, error id (0).
+                | TYPE_ERROR - type param error id (1).
+                | VALUE_ERROR - value param error id (2).
+                | FORMAT_ERROR - wrong format error id (3).
+                | VALUE_TYPES - types checked for empty value.
+                | __VALIDATORS - cache of compiled parameter specifications.
+            :methods:
+                | compile_param - compile parameter specification.
+                | fast_check - check parameters in one pass (no report).
+                | failure_status - error id for parameters (no report).
+    '''
+
+    NO_ERROR, TYPE_ERROR, VALUE_ERROR, FORMAT_ERROR = 0, 1, 2, 3
+    VALUE_TYPES = (dict, list, tuple, set, frozenset, bytearray, bytes)
+    __VALIDATORS = {}
+
+    @staticmethod
+    def compile_param(param_spec):
+        '''
+            Compile parameter specification ('type:name') once.
+
+            :param param_spec: parameter specification.
+            :type param_spec: <str>
+            :return: expected type name | None (wrong format).
+            :rtype: <str> | <NoneType>
+            :exceptions: None
+        '''
+        validators = ATSFastCheck.__VALIDATORS
+        if param_spec in validators:
+            return validators[param_spec]
+        expected_type, param_typ_name = None, param_spec.split(':')
+        if len(param_typ_name) == 2:
+            expected_type = param_typ_name[0]
+        validators[param_spec] = expected_type
+        return expected_type
+
+    @staticmethod
+    def fast_check(params_description):
+        '''
+            Check parameters in one pass without usage report.
+
+            :param params_description: parameters description.
+            :type params_description: <list>
+            :return: boolean status, True (all params ok) | False.
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        if not params_description:
+            return False
+        validators = ATSFastCheck.__VALIDATORS
+        value_types = ATSFastCheck.VALUE_TYPES
+        try:
+            for param_spec, inst in params_description:
+                expected_type = validators.get(param_spec)
+                if expected_type is None:
+                    expected_type = ATSFastCheck.compile_param(param_spec)
+                    if expected_type is None:
+                        return False
+                if type(inst).__name__ != expected_type or inst is None:
+                    return False
+                if isinstance(inst, value_types) and not inst:
+                    return False
+        except (AttributeError, TypeError, ValueError):
+            return False
+        return True
+
+    @staticmethod
+    def failure_status(params_description):
+        '''
+            Error id for parameters without usage report.
+
+            :param params_description: parameters description.
+            :type params_description: <list>
+            :return: short message | None, status (0 | 1 | 2 | 3).
+            :rtype: <str> | <NoneType>, <int>
+            :exceptions: None
+        '''
+        format_error = 'format wrong during checking params'
+        if not params_description:
+            return format_error, ATSFastCheck.FORMAT_ERROR
+        failed_spec, error_id = None, ATSFastCheck.NO_ERROR
+        try:
+            for param_spec, inst in params_description:
+                expected_type = ATSFastCheck.compile_param(param_spec)
+                if expected_type is None:
+                    return format_error, ATSFastCheck.FORMAT_ERROR
+                if type(inst).__name__ != expected_type:
+                    failed_spec, error_id = param_spec, ATSFastCheck.TYPE_ERROR
+                    break
+                if error_id == ATSFastCheck.NO_ERROR:
+                    if isinstance(inst, ATSFastCheck.VALUE_TYPES) and not inst:
+                        failed_spec = param_spec
+                        error_id = ATSFastCheck.VALUE_ERROR
+        except (AttributeError, TypeError, ValueError):
+            return format_error, ATSFastCheck.FORMAT_ERROR
+        if error_id == ATSFastCheck.TYPE_ERROR:
+            return '{0} {1}'.format(failed_spec, 'wrong type'), error_id
+        if error_id == ATSFastCheck.VALUE_ERROR:
+            return '{0} {1}'.format(failed_spec, 'wrong value'), error_id
+        return None, error_id
@@ -0,0 +1,94 @@
+# -*- coding: UTF-8 -*-
+
+'''
+ Module
+     level.py
+ Copyright
+     Copyright (C) 2017 Vladimir Roncevic <elektron.ronca@gmail.com>
+     ats_utilities is free software: you can redistribute it and/or modify it
+     under the terms of the GNU General Public License as published by the
+     Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+     ats_utilities is distributed in the hope that it will be useful, but
+     WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+     See the GNU General Public License for more details.
+     You should have received a copy of the GNU General Public License along
+     with this program. If not, see <http://www.gnu.org/licenses/>.
+ Info
+     Defined class ATSValidationLevel with attribute(s) and method(s).
+     Created API for process-wide validation level of checking.
+'''
+
+import sys
+from os import environ
+
+try:
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+except ImportError as ats_error_message:
+    MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
+    sys.exit(MESSAGE)  # Force close python ATS ##############################
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = 'Copyright 2017, https://vroncevic.github.io/ats_utilities'
+__credits__ = ['Vladimir Roncevic']
+__license__ = 'https://github.com/vroncevic/ats_utilities/blob/dev/LICENSE'
+__version__ = '1.8.8'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+
+class ATSValidationLevel(object):
+    '''
+        Defined class ATSValidationLevel with attribute(s) and method(s).
+        Created API for process-wide validation level of checking.
+        Level is loaded from environment variable once, at import time.
+        It defines:
+
+            :attributes:
+                | FULL - validation level with usage report (full).
+                | FAILURES_ONLY - validation level without usage report.
+                | OFF - validation level with disabled checking (off).
+                | VALIDATION_LEVELS - supported validation levels.
+                | VALIDATION_LEVEL_ENV - environment variable for level.
+                | __validation_level - process-wide validation level.
+            :methods:
+                | set_validation_level - set process-wide validation level.
+                | get_validation_level - get process-wide validation level.
+    '''
+
+    FULL, FAILURES_ONLY, OFF = 'full', 'failures-only', 'off'
+    VALIDATION_LEVELS = (FULL, FAILURES_ONLY, OFF)
+    VALIDATION_LEVEL_ENV = 'ATS_VALIDATION_LEVEL'
+    __validation_level = environ.get(VALIDATION_LEVEL_ENV, FULL).lower()
+    if __validation_level not in VALIDATION_LEVELS:
+        __validation_level = FULL
+
+    @staticmethod
+    def set_validation_level(validation_level):
+        '''
+            Set process-wide validation level.
+
+            :param validation_level: 'full' | 'failures-only' | 'off'.
+            :type validation_level: <str>
+            :exceptions: ATSValueError
+        '''
+        if validation_level not in ATSValidationLevel.VALIDATION_LEVELS:
+            raise ATSValueError(
+                '{0} [{1}]'.format(
+                    'not supported validation level', validation_level
+                )
+            )
+        ATSValidationLevel.__validation_level = validation_level
+
+    @staticmethod
+    def get_validation_level():
+        '''
+            Get process-wide validation level.
+
+            :return: 'full' | 'failures-only' | 'off'.
+            :rtype: <str>
+            :exceptions: None
+        '''
+        return ATSValidationLevel.__validation_level
@@ -17,4 +17,30 @@
      with this program. If not, see <http://www.gnu.org/licenses/>.
  Info
      Defined package ats_utilities.cli.
+     CLI classes are resolved lazily on first access (PEP 562).
 '''
+
+import sys
+
+try:
+    from ats_utilities.lazy import LazyAttributes
+except ImportError as ats_error_message:
+    MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
+    sys.exit(MESSAGE)  # Force close python ATS ##############################
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = 'Copyright 2017, https://vroncevic.github.io/ats_utilities'
+__credits__ = ['Vladimir Roncevic']
+__license__ = 'https://github.com/vroncevic/ats_utilities/blob/dev/LICENSE'
+__version__ = '1.8.8'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+__getattr__ = LazyAttributes(__name__, {
+    'CfgCLI': 'ats_utilities.cli.cfg_cli',
+    'IniCLI': 'ats_utilities.cli.ini_cli',
+    'JsonCLI': 'ats_utilities.cli.json_cli',
+    'XmlCLI': 'ats_utilities.cli.xml_cli',
+    'YamlCLI': 'ats_utilities.cli.yaml_cli'
+})
@@ -24,12 +24,10 @@ import sys
 
 try:
     from ats_utilities import VerboseRoot
-    from ats_utilities.checker import ATSChecker
+    from ats_utilities.checker import checked
     from ats_utilities.config_io.cfg import CfgBase
     from ats_utilities.abstract import AbstractMethod
     from ats_utilities.console_io.verbose import verbose_message
-    from ats_utilities.exceptions.ats_type_error import ATSTypeError
-    from ats_utilities.exceptions.ats_bad_call_error import ATSBadCallError
 except ImportError as ats_error_message:
     MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
     sys.exit(MESSAGE)  # Force close python ATS ##############################
@@ -63,6 +61,7 @@ class CfgCLI(CfgBase):
 
     __metaclass__ = VerboseRoot
 
+    @checked('str:informations_file')
     def __init__(self, informations_file, verbose=False):
         '''
             Initial constructor.
@@ -73,14 +72,6 @@ class CfgCLI(CfgBase):
             :type verbose: <bool>
             :exceptions: ATSTypeError | ATSBadCallError
         '''
-        checker, error, status = ATSChecker(), None, False
-        error, status = checker.check_params([
-            ('str:informations_file', informations_file)
-        ])
-        if status == ATSChecker.TYPE_ERROR:
-            raise ATSTypeError(error)
-        if status == ATSChecker.VALUE_ERROR:
-            raise ATSBadCallError(error)
         CfgBase.__init__(self, informations_file, verbose=verbose)
         self.__verbose = verbose
         verbose_message(CfgCLI.VERBOSE, verbose, 'init ATS cfg cli')
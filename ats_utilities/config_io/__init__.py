@@ -18,18 +18,21 @@
  Info
      Defined class ConfigFile with attribute(s) and method(s).
      Created API for information/configuration context manager.
+     Optional APIs (bulk, async, cache, converter, layered, snapshot,
+     watcher) are resolved lazily on first access (PEP 562).
 '''
 
 import sys
+from io import BytesIO
+from mmap import mmap, ACCESS_READ
 
 try:
     from ats_utilities import VerboseRoot
-    from ats_utilities.checker import ATSChecker
+    from ats_utilities.checker import checked
+    from ats_utilities.lazy import LazyAttributes
     from ats_utilities.console_io.error import error_message
     from ats_utilities.config_io.base_check import FileChecking
     from ats_utilities.console_io.verbose import verbose_message
-    from ats_utilities.exceptions.ats_type_error import ATSTypeError
-    from ats_utilities.exceptions.ats_bad_call_error import ATSBadCallError
 except ImportError as ats_error_message:
     MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
     sys.exit(MESSAGE)  # Force close python ATS ##############################
@@ -43,6 +46,23 @@ __maintainer__ = 'Vladimir Roncevic'
 __email__ = 'elektron.ronca@gmail.com'
 __status__ = 'Updated'
 
+__getattr__ = LazyAttributes(__name__, {
+    'AsyncConfigFile': 'ats_utilities.config_io.async_file',
+    'AsyncExecutor': 'ats_utilities.config_io.async_io',
+    'AsyncReadConfig': 'ats_utilities.config_io.async_read',
+    'AsyncWriteConfig': 'ats_utilities.config_io.async_write',
+    'BulkResult': 'ats_utilities.config_io.bulk_read',
+    'ConfigCache': 'ats_utilities.config_io.config_cache',
+    'ConfigSnapshot': 'ats_utilities.config_io.snapshot',
+    'ConfigWatcher': 'ats_utilities.config_io.watcher',
+    'LayeredConfig': 'ats_utilities.config_io.layered',
+    'convert_file': 'ats_utilities.config_io.converter',
+    'convert_tree': 'ats_utilities.config_io.converter',
+    'PathMetadataCache': 'ats_utilities.config_io.path_cache',
+    'iter_many': 'ats_utilities.config_io.bulk_read',
+    'read_many': 'ats_utilities.config_io.bulk_read'
+})
+
 
 class ConfigFile(FileChecking):
     '''
@@ -52,11 +72,15 @@ class ConfigFile(FileChecking):
 
             :attributes:
                 | __metaclass__ - setting verbose root for ConfigFile.
+                | READ_MODES - file modes supported in mapped mode.
                 | __verbose - enable/disable verbose option.
                 | __file_path - configuration file name.
                 | __file_mode - file mode.
                 | __file_format - file format.
                 | __file - file object.
+                | __mapped - memory-mapped (zero-copy) read mode.
+                | __map - memory map of file content.
+                | __mapped_mode_ok - file mode is supported in mapped mode.
             :methods:
                 | __init__ - initial constructor.
                 | __enter__ - open configuration file in mode.
@@ -65,10 +89,17 @@ class ConfigFile(FileChecking):
     '''
 
     __metaclass__ = VerboseRoot
+    READ_MODES = ['r', 'b', 't']
 
-    def __init__(self, file_path, file_mode, file_format, verbose=False):
+    @checked('str:file_path', 'str:file_mode', 'str:file_format')
+    def __init__(
+        self, file_path, file_mode, file_format, verbose=False, mapped=False
+    ):
         '''
             Initial constructor.
+            In mapped mode file is opened read only (binary) and content
+            is exposed as memory map (buffer protocol, read, readline,
+            find, slicing) instead of copying into text object.
 
             :param file_path: configuration file name.
             :type file_path: <str>
@@ -78,29 +109,32 @@ class ConfigFile(FileChecking):
             :type file_format: <str>
             :param verbose: enable/disable verbose option.
             :type verbose: <bool>
+            :param mapped: enable/disable memory-mapped read mode.
+            :type mapped: <bool>
             :exceptions: ATSTypeError | ATSBadCallError
         '''
-        checker, error, status = ATSChecker(), None, False
-        error, status = checker.check_params([
-            ('str:file_path', file_path), ('str:file_mode', file_mode),
-            ('str:file_format', file_format)
-        ])
-        if status == ATSChecker.TYPE_ERROR:
-            raise ATSTypeError(error)
-        if status == ATSChecker.VALUE_ERROR:
-            raise ATSBadCallError(error)
         FileChecking.__init__(self, verbose=verbose)
         self.__verbose = verbose
         self.__file = None
+        self.__map = None
+        self.__mapped = mapped
+        self.__mapped_mode_ok = True
         self.__file_path = None
         self.__file_mode = None
         self.__file_format = None
         self.check_path(file_path=file_path, verbose=verbose)
         self.check_mode(file_mode=file_mode, verbose=verbose)
+        if mapped and not set(file_mode) <= set(ConfigFile.READ_MODES):
+            error_message(
+                ConfigFile.VERBOSE, '{0} [{1}]'.format(
+                    'not supported mode for mapped file', file_mode
+                )
+            )
+            self.__mapped_mode_ok = False
         self.check_format(
             file_path=file_path, file_format=file_format, verbose=verbose
         )
-        if self.is_file_ok():
+        if self.is_file_ok() and self.__mapped_mode_ok:
             self.__file_path = file_path
             self.__file_mode = file_mode
             self.__file_format = file_format
@@ -110,11 +144,21 @@ class ConfigFile(FileChecking):
         '''
             Open configuration file in mode.
 
-            :return: file object | None.
-            :rtype: <file> | <NoneType>
+            :return: file object | memory map (mapped mode) | None.
+            :rtype: <file> | <mmap> | <NoneType>
             :exceptions: None
         '''
-        if self.is_file_ok():
+        file_ok = self.is_file_ok() and self.__mapped_mode_ok
+        if file_ok and self.__mapped:
+            self.__file = open(self.__file_path, 'rb')
+            try:
+                self.__map = mmap(
+                    self.__file.fileno(), 0, access=ACCESS_READ
+                )
+            except ValueError:
+                self.__map = BytesIO(b'')
+            return self.__map
+        if file_ok:
             self.__file = open(self.__file_path, self.__file_mode)
         else:
             error_message(ConfigFile.VERBOSE, 'check file', self.__file_path)
@@ -127,6 +171,9 @@ class ConfigFile(FileChecking):
 
             :exceptions: None
         '''
+        if self.__map is not None:
+            self.__map.close()
+            self.__map = None
         try:
             self.__file.close()
         except AttributeError:
@@ -0,0 +1,224 @@
+# -*- coding: UTF-8 -*-
+
+'''
+ Module
+     async_file.py
+ Copyright
+     Copyright (C) 2017 Vladimir Roncevic <elektron.ronca@gmail.com>
+     ats_utilities is free software: you can redistribute it and/or modify it
+     under the terms of the GNU General Public License as published by the
+     Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+     ats_utilities is distributed in the hope that it will be useful, but
+     WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+     See the GNU General Public License for more details.
+     You should have received a copy of the GNU General Public License along
+     with this program. If not, see <http://www.gnu.org/licenses/>.
+ Info
+     Defined classes AsyncFile and AsyncConfigFile with attribute(s) and
+     method(s).
+     Created API for asyncio configuration file (Python 3 only).
+'''
+
+import sys
+
+try:
+    from asyncio import CancelledError, ensure_future, shield
+    from ats_utilities.final import ATSFinal
+    from ats_utilities.config_io import ConfigFile
+    from ats_utilities.config_io.async_io import AsyncExecutor
+except ImportError as ats_error_message:
+    MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
+    sys.exit(MESSAGE)  # Force close python ATS ##############################
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = 'Copyright 2017, https://vroncevic.github.io/ats_utilities'
+__credits__ = ['Vladimir Roncevic']
+__license__ = 'https://github.com/vroncevic/ats_utilities/blob/dev/LICENSE'
+__version__ = '1.8.8'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+
+class AsyncFile:
+    '''
+        Defined class AsyncFile with attribute(s) and method(s).
+        Created API for awaitable operations on opened configuration file.
+        It defines:
+
+            :attributes:
+                | __metaclass__ - setting class AsyncFile as final.
+                | __file - file object | memory map of file.
+            :methods:
+                | __init__ - initial constructor.
+                | read - read content of file.
+                | readline - read line of file.
+                | write - write content to file.
+                | __str__ - dunder method for AsyncFile.
+    '''
+
+    __metaclass__ = ATSFinal
+
+    def __init__(self, file_object):
+        '''
+            Initial constructor.
+
+            :param file_object: file object | memory map of file.
+            :type file_object: <file> | <mmap>
+            :exceptions: None
+        '''
+        self.__file = file_object
+
+    async def read(self, size=-1):
+        '''
+            Read content of file.
+
+            :param size: number of characters/bytes (-1 for all).
+            :type size: <int>
+            :return: content of file.
+            :rtype: <str> | <bytes>
+            :exceptions: None
+        '''
+        return await AsyncExecutor.run(self.__file.read, size)
+
+    async def readline(self):
+        '''
+            Read line of file.
+
+            :return: line of file.
+            :rtype: <str> | <bytes>
+            :exceptions: None
+        '''
+        return await AsyncExecutor.run(self.__file.readline)
+
+    async def write(self, content):
+        '''
+            Write content to file.
+
+            :param content: content for file.
+            :type content: <str>
+            :return: number of written characters.
+            :rtype: <int>
+            :exceptions: None
+        '''
+        return await AsyncExecutor.run(self.__file.write, content)
+
+    def __str__(self):
+        '''
+            Dunder method for AsyncFile.
+
+            :return: object in a human-readable format.
+            :rtype: <str>
+            :exceptions: None
+        '''
+        return '{0} ({1})'.format(self.__class__.__name__, self.__file)
+
+
+class AsyncConfigFile:
+    '''
+        Defined class AsyncConfigFile with attribute(s) and method(s).
+        Created API for asyncio configuration context manager.
+        File checks and open/close of ConfigFile run off event loop,
+        file opened by cancelled enter is closed in background.
+        It defines:
+
+            :attributes:
+                | __metaclass__ - setting class AsyncConfigFile as final.
+                | __arguments - arguments for ConfigFile.
+                | __config_file - ConfigFile context manager | None.
+            :methods:
+                | __init__ - initial constructor.
+                | __aenter__ - open configuration file off event loop.
+                | __aexit__ - close configuration file off event loop.
+                | __enter - create and enter ConfigFile (blocking).
+                | __close_opened - close file opened by cancelled enter.
+                | __str__ - dunder method for AsyncConfigFile.
+    '''
+
+    __metaclass__ = ATSFinal
+
+    def __init__(
+        self, file_path, file_mode, file_format, verbose=False, mapped=False
+    ):
+        '''
+            Initial constructor.
+
+            :param file_path: configuration file name.
+            :type file_path: <str>
+            :param file_mode: open configuration file in mode.
+            :type file_mode: <str>
+            :param file_format: file format.
+            :type file_format: <str>
+            :param verbose: enable/disable verbose option.
+            :type verbose: <bool>
+            :param mapped: enable/disable memory-mapped read mode.
+            :type mapped: <bool>
+            :exceptions: None
+        '''
+        self.__arguments = (file_path, file_mode, file_format, verbose, mapped)
+        self.__config_file = None
+
+    async def __aenter__(self):
+        '''
+            Open configuration file off event loop.
+
+            :return: awaitable file | None.
+            :rtype: <AsyncFile> | <NoneType>
+            :exceptions: ATSTypeError | ATSBadCallError
+        '''
+        opening = ensure_future(AsyncExecutor.run(self.__enter))
+        try:
+            file_object = await shield(opening)
+        except CancelledError:
+            opening.add_done_callback(self.__close_opened)
+            raise
+        return AsyncFile(file_object) if file_object is not None else None
+
+    async def __aexit__(self, *args):
+        '''
+            Close configuration file off event loop.
+
+            :exceptions: None
+        '''
+        if self.__config_file is not None:
+            await AsyncExecutor.run(self.__config_file.__exit__, *args)
+
+    def __enter(self):
+        '''
+            Create and enter ConfigFile (blocking).
+
+            :return: file object | memory map | None.
+            :rtype: <file> | <mmap> | <NoneType>
+            :exceptions: ATSTypeError | ATSBadCallError
+        '''
+        file_path, file_mode, file_format, verbose, mapped = self.__arguments
+        self.__config_file = ConfigFile(
+            file_path, file_mode, file_format, verbose=verbose, mapped=mapped
+        )
+        return self.__config_file.__enter__()
+
+    def __close_opened(self, opening):
+        '''
+            Close file opened by cancelled enter (done callback).
+
+            :param opening: finished opening of configuration file.
+            :type opening: <asyncio.Future>
+            :exceptions: None
+        '''
+        if not opening.cancelled() and opening.exception() is None:
+            AsyncExecutor.run(self.__config_file.__exit__)
+
+    def __str__(self):
+        '''
+            Dunder method for AsyncConfigFile.
+
+            :return: object in a human-readable format.
+            :rtype: <str>
+            :exceptions: None
+        '''
+        return '{0} ({1}, {2})'.format(
+            self.__class__.__name__, str(self.__arguments),
+            str(self.__config_file)
+        )
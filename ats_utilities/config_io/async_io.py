@@ -0,0 +1,133 @@
+# -*- coding: UTF-8 -*-
+
+'''
+ Module
+     async_io.py
+ Copyright
+     Copyright (C) 2017 Vladimir Roncevic <elektron.ronca@gmail.com>
+     ats_utilities is free software: you can redistribute it and/or modify it
+     under the terms of the GNU General Public License as published by the
+     Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+     ats_utilities is distributed in the hope that it will be useful, but
+     WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+     See the GNU General Public License for more details.
+     You should have received a copy of the GNU General Public License along
+     with this program. If not, see <http://www.gnu.org/licenses/>.
+ Info
+     Defined class AsyncExecutor with attribute(s) and method(s).
+     Created API for asyncio configuration I/O (Python 3 only).
+'''
+
+import sys
+from functools import partial
+from threading import Lock
+
+try:
+    from concurrent.futures import ThreadPoolExecutor
+    from ats_utilities.final import ATSFinal
+except ImportError as ats_error_message:
+    MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
+    sys.exit(MESSAGE)  # Force close python ATS ##############################
+
+try:
+    from asyncio import get_running_loop
+except ImportError:
+    from asyncio import get_event_loop as get_running_loop
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = 'Copyright 2017, https://vroncevic.github.io/ats_utilities'
+__credits__ = ['Vladimir Roncevic']
+__license__ = 'https://github.com/vroncevic/ats_utilities/blob/dev/LICENSE'
+__version__ = '1.8.8'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+
+class AsyncExecutor:
+    '''
+        Defined class AsyncExecutor with attribute(s) and method(s).
+        Created API for bounded executor of blocking configuration I/O.
+        It defines:
+
+            :attributes:
+                | __metaclass__ - setting class AsyncExecutor as final.
+                | MAX_WORKERS - default max number of worker threads.
+                | __max_workers - max number of worker threads.
+                | __executor - shared thread pool executor | None.
+                | __lock - lock for creating executor.
+            :methods:
+                | configure - setup max number of worker threads.
+                | executor - shared thread pool executor.
+                | run - run blocking function off event loop.
+                | shutdown - shutdown shared executor.
+    '''
+
+    __metaclass__ = ATSFinal
+    MAX_WORKERS = 4
+    __max_workers = MAX_WORKERS
+    __executor = None
+    __lock = Lock()
+
+    @staticmethod
+    def configure(max_workers):
+        '''
+            Setup max number of worker threads (executor is recreated).
+
+            :param max_workers: max number of worker threads.
+            :type max_workers: <int>
+            :exceptions: None
+        '''
+        AsyncExecutor.shutdown()
+        AsyncExecutor.__max_workers = max_workers
+
+    @staticmethod
+    def executor():
+        '''
+            Shared thread pool executor.
+
+            :return: shared thread pool executor.
+            :rtype: <ThreadPoolExecutor>
+            :exceptions: None
+        '''
+        with AsyncExecutor.__lock:
+            if AsyncExecutor.__executor is None:
+                AsyncExecutor.__executor = ThreadPoolExecutor(
+                    max_workers=AsyncExecutor.__max_workers
+                )
+            return AsyncExecutor.__executor
+
+    @staticmethod
+    def run(function, *args, **kwargs):
+        '''
+            Run blocking function off event loop.
+
+            :param function: blocking function.
+            :type function: <function>
+            :param args: positional arguments of function.
+            :type args: <tuple>
+            :param kwargs: keyword arguments of function.
+            :type kwargs: <dict>
+            :return: awaitable result of function.
+            :rtype: <asyncio.Future>
+            :exceptions: None
+        '''
+        return get_running_loop().run_in_executor(
+            AsyncExecutor.executor(), partial(function, *args, **kwargs)
+        )
+
+    @staticmethod
+    def shutdown(wait=True):
+        '''
+            Shutdown shared executor.
+
+            :param wait: wait for running functions.
+            :type wait: <bool>
+            :exceptions: None
+        '''
+        with AsyncExecutor.__lock:
+            executor, AsyncExecutor.__executor = AsyncExecutor.__executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
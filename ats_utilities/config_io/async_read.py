@@ -0,0 +1,114 @@
+# -*- coding: UTF-8 -*-
+
+'''
+ Module
+     async_read.py
+ Copyright
+     Copyright (C) 2017 Vladimir Roncevic <elektron.ronca@gmail.com>
+     ats_utilities is free software: you can redistribute it and/or modify it
+     under the terms of the GNU General Public License as published by the
+     Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+     ats_utilities is distributed in the hope that it will be useful, but
+     WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+     See the GNU General Public License for more details.
+     You should have received a copy of the GNU General Public License along
+     with this program. If not, see <http://www.gnu.org/licenses/>.
+ Info
+     Defined class AsyncReadConfig with attribute(s) and method(s).
+     Created API for asyncio reading of configuration (Python 3 only).
+'''
+
+import sys
+from os.path import abspath
+
+try:
+    from asyncio import ensure_future, shield
+    from ats_utilities.final import ATSFinal
+    from ats_utilities.config_io.async_io import AsyncExecutor
+except ImportError as ats_error_message:
+    MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
+    sys.exit(MESSAGE)  # Force close python ATS ##############################
+
+try:
+    from asyncio import get_running_loop
+except ImportError:
+    from asyncio import get_event_loop as get_running_loop
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = 'Copyright 2017, https://vroncevic.github.io/ats_utilities'
+__credits__ = ['Vladimir Roncevic']
+__license__ = 'https://github.com/vroncevic/ats_utilities/blob/dev/LICENSE'
+__version__ = '1.8.8'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+
+class AsyncReadConfig:
+    '''
+        Defined class AsyncReadConfig with attribute(s) and method(s).
+        Created API for asyncio reading of configuration (any reader).
+        Reading and parsing run off event loop, concurrent awaits for
+        same file and reader share one parse (single-flight). Cancelled
+        await does not cancel parse shared with other awaits.
+        It defines:
+
+            :attributes:
+                | __metaclass__ - setting class AsyncReadConfig as final.
+                | __reader - reader of configuration (BaseReadConfig).
+                | __in_flight - shared parses by (loop, path, reader, mode).
+            :methods:
+                | __init__ - initial constructor.
+                | read_configuration - read configuration off event loop.
+                | __str__ - dunder method for AsyncReadConfig.
+    '''
+
+    __metaclass__ = ATSFinal
+    __in_flight = {}
+
+    def __init__(self, reader):
+        '''
+            Initial constructor.
+
+            :param reader: reader of configuration (Json2Object, ...).
+            :type reader: <BaseReadConfig>
+            :exceptions: None
+        '''
+        self.__reader = reader
+
+    async def read_configuration(self, verbose=False):
+        '''
+            Read configuration off event loop.
+
+            :param verbose: enable/disable verbose option.
+            :type verbose: <bool>
+            :return: configuration object | None.
+            :rtype: <Python object(s)> | <NoneType>
+            :exceptions: None
+        '''
+        in_flight = AsyncReadConfig.__in_flight
+        file_path = self.__reader.file_path
+        key = (
+            get_running_loop(), abspath(file_path) if file_path else None,
+            self.__reader.__class__.__name__, self.__reader.parser_key()
+        )
+        parse = in_flight.get(key)
+        if parse is None:
+            parse = ensure_future(AsyncExecutor.run(
+                self.__reader.read_configuration, verbose
+            ))
+            in_flight[key] = parse
+            parse.add_done_callback(lambda _: in_flight.pop(key, None))
+        return await shield(parse)
+
+    def __str__(self):
+        '''
+            Dunder method for AsyncReadConfig.
+
+            :return: object in a human-readable format.
+            :rtype: <str>
+            :exceptions: None
+        '''
+        return '{0} ({1})'.format(self.__class__.__name__, self.__reader)
@@ -0,0 +1,94 @@
+# -*- coding: UTF-8 -*-
+
+'''
+ Module
+     async_write.py
+ Copyright
+     Copyright (C) 2017 Vladimir Roncevic <elektron.ronca@gmail.com>
+     ats_utilities is free software: you can redistribute it and/or modify it
+     under the terms of the GNU General Public License as published by the
+     Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+     ats_utilities is distributed in the hope that it will be useful, but
+     WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+     See the GNU General Public License for more details.
+     You should have received a copy of the GNU General Public License along
+     with this program. If not, see <http://www.gnu.org/licenses/>.
+ Info
+     Defined class AsyncWriteConfig with attribute(s) and method(s).
+     Created API for asyncio writing of configuration (Python 3 only).
+'''
+
+import sys
+
+try:
+    from ats_utilities.final import ATSFinal
+    from ats_utilities.config_io.async_io import AsyncExecutor
+except ImportError as ats_error_message:
+    MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
+    sys.exit(MESSAGE)  # Force close python ATS ##############################
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = 'Copyright 2017, https://vroncevic.github.io/ats_utilities'
+__credits__ = ['Vladimir Roncevic']
+__license__ = 'https://github.com/vroncevic/ats_utilities/blob/dev/LICENSE'
+__version__ = '1.8.8'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+
+class AsyncWriteConfig:
+    '''
+        Defined class AsyncWriteConfig with attribute(s) and method(s).
+        Created API for asyncio writing of configuration (any writer).
+        Serialization and atomic write run off event loop.
+        It defines:
+
+            :attributes:
+                | __metaclass__ - setting class AsyncWriteConfig as final.
+                | __writer - writer of configuration (BaseWriteConfig).
+            :methods:
+                | __init__ - initial constructor.
+                | write_configuration - write configuration off event loop.
+                | __str__ - dunder method for AsyncWriteConfig.
+    '''
+
+    __metaclass__ = ATSFinal
+
+    def __init__(self, writer):
+        '''
+            Initial constructor.
+
+            :param writer: writer of configuration (Object2Json, ...).
+            :type writer: <BaseWriteConfig>
+            :exceptions: None
+        '''
+        self.__writer = writer
+
+    async def write_configuration(self, configuration, verbose=False):
+        '''
+            Write configuration off event loop.
+
+            :param configuration: configuration object.
+            :type configuration: <Python object(s)>
+            :param verbose: enable/disable verbose option.
+            :type verbose: <bool>
+            :return: status, 0 (failed) | 1 (written) | 2 (skipped).
+            :rtype: <int>
+            :exceptions: None
+        '''
+        return await AsyncExecutor.run(
+            self.__writer.write_configuration, configuration, verbose
+        )
+
+    def __str__(self):
+        '''
+            Dunder method for AsyncWriteConfig.
+
+            :return: object in a human-readable format.
+            :rtype: <str>
+            :exceptions: None
+        '''
+        return '{0} ({1})'.format(self.__class__.__name__, self.__writer)
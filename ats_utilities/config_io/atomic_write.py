@@ -0,0 +1,224 @@
+# -*- coding: UTF-8 -*-
+
+'''
+ Module
+     atomic_write.py
+ Copyright
+     Copyright (C) 2017 Vladimir Roncevic <elektron.ronca@gmail.com>
+     ats_utilities is free software: you can redistribute it and/or modify it
+     under the terms of the GNU General Public License as published by the
+     Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+     ats_utilities is distributed in the hope that it will be useful, but
+     WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+     See the GNU General Public License for more details.
+     You should have received a copy of the GNU General Public License along
+     with this program. If not, see <http://www.gnu.org/licenses/>.
+ Info
+     Defined class AtomicWrite with attribute(s) and method(s).
+     Created API for atomic replace of files and digests of content.
+'''
+
+import sys
+from stat import S_IMODE
+from threading import Lock
+from locale import getpreferredencoding
+from os.path import basename, dirname
+from os import O_RDONLY, chmod, close, fdopen, fsync, remove, stat
+from os import open as open_descriptor
+
+try:
+    from ats_utilities.final import ATSFinal
+    from ats_utilities.config_io.config_cache import ConfigCache
+except ImportError as ats_error_message:
+    MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
+    sys.exit(MESSAGE)  # Force close python ATS ##############################
+
+try:
+    from os import replace
+except ImportError:
+    from os import rename as replace
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = 'Copyright 2017, https://vroncevic.github.io/ats_utilities'
+__credits__ = ['Vladimir Roncevic']
+__license__ = 'https://github.com/vroncevic/ats_utilities/blob/dev/LICENSE'
+__version__ = '1.8.8'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+
+class AtomicWrite:
+    '''
+        Defined class AtomicWrite with attribute(s) and method(s).
+        Created API for atomic replace of files and digests of content.
+        Content is written to temporary file in directory of target file
+        and replaced into place, crash never leaves truncated file.
+        Content with same digest as file on disk is not written at all.
+        It defines:
+
+            :attributes:
+                | __metaclass__ - setting class AtomicWrite as final.
+                | CHUNK_SIZE - size of chunk for reading file on disk.
+                | __digests - digests of files (path: signature, digest).
+                | __lock - lock for digests of files.
+            :methods:
+                | new_digest - new hash object (blake2b | sha256).
+                | digest - digest of content (chunks).
+                | disk_digest - digest of file on disk (cached by stat).
+                | write - write content to file (atomic replace).
+    '''
+
+    __metaclass__ = ATSFinal
+    CHUNK_SIZE = 1 << 16
+    __digests = {}
+    __lock = Lock()
+
+    @staticmethod
+    def new_digest(digest_size=16, data=b''):
+        '''
+            New hash object, blake2b or sha256 (Python 2.7, 32 bytes).
+
+            :param digest_size: size of blake2b digest in bytes.
+            :type digest_size: <int>
+            :param data: initial data of hash.
+            :type data: <bytes>
+            :return: hash object.
+            :rtype: <hashlib object>
+            :exceptions: None
+        '''
+        try:
+            from hashlib import blake2b
+        except ImportError:
+            from hashlib import sha256
+            return sha256(data)
+        return blake2b(data, digest_size=digest_size)
+
+    @staticmethod
+    def digest(chunks, write=None):
+        '''
+            Digest of content (chunks).
+
+            :param chunks: chunks of content.
+            :type chunks: <Python object(s)>
+            :param write: callable which writes chunk | None.
+            :type write: <function> | <NoneType>
+            :return: digest of encoded content.
+            :rtype: <bytes>
+            :exceptions: None
+        '''
+        encoding = getpreferredencoding(False)
+        digest = AtomicWrite.new_digest()
+        for chunk in chunks:
+            if write is not None:
+                write(chunk)
+            digest.update(chunk.encode(encoding))
+        return digest.digest()
+
+    @staticmethod
+    def disk_digest(file_path):
+        '''
+            Digest of file on disk (cached while stat signature is same).
+
+            :param file_path: real path of file.
+            :type file_path: <str>
+            :return: digest of file content | None.
+            :rtype: <bytes> | <NoneType>
+            :exceptions: None
+        '''
+        signature = ConfigCache.signature(file_path)
+        if signature is None:
+            return None
+        with AtomicWrite.__lock:
+            cached = AtomicWrite.__digests.get(file_path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        digest = AtomicWrite.new_digest()
+        try:
+            with open(file_path, 'rb') as disk_file:
+                for chunk in iter(
+                    lambda: disk_file.read(AtomicWrite.CHUNK_SIZE), b''
+                ):
+                    digest.update(chunk)
+        except (IOError, OSError):
+            return None
+        with AtomicWrite.__lock:
+            AtomicWrite.__digests[file_path] = (signature, digest.digest())
+        return digest.digest()
+
+    @staticmethod
+    def write(
+        file_path, content, fsync_file=True, fsync_dir=False,
+        skip_unchanged=True
+    ):
+        '''
+            Write content to file (temporary file, fsync, atomic replace).
+            Content is one buffer (single write) or iterable of chunks.
+            Buffer with unchanged digest is not written at all, chunks are
+            written to temporary file which is dropped if digest is same.
+
+            :param file_path: real path of file.
+            :type file_path: <str>
+            :param content: content | chunks of content.
+            :type content: <str> | <Python object(s)>
+            :param fsync_file: enable/disable fsync of temporary file.
+            :type fsync_file: <bool>
+            :param fsync_dir: enable/disable fsync of directory.
+            :type fsync_dir: <bool>
+            :param skip_unchanged: enable/disable skip of unchanged content.
+            :type skip_unchanged: <bool>
+            :return: True (written) | False (skipped, same content).
+            :rtype: <bool>
+            :exceptions: IOError | OSError
+        '''
+        from tempfile import mkstemp
+        directory, buffered = dirname(file_path), False
+        if isinstance(content, (str, type(u''))):
+            content, buffered = [content], True
+        digest = AtomicWrite.digest(content) if buffered else None
+        if skip_unchanged and buffered:
+            if digest == AtomicWrite.disk_digest(file_path):
+                return False
+        file_descriptor, temp_path = mkstemp(
+            prefix='.{0}.'.format(basename(file_path)), suffix='.tmp',
+            dir=directory
+        )
+        replaced = False
+        try:
+            with fdopen(file_descriptor, 'w') as temp_file:
+                try:
+                    chmod(temp_path, S_IMODE(stat(file_path).st_mode))
+                except OSError:
+                    pass
+                if buffered:
+                    temp_file.write(content[0])
+                else:
+                    digest = AtomicWrite.digest(content, temp_file.write)
+                    if skip_unchanged and digest == AtomicWrite.disk_digest(
+                        file_path
+                    ):
+                        return False
+                temp_file.flush()
+                if fsync_file:
+                    fsync(temp_file.fileno())
+            replace(temp_path, file_path)
+            replaced = True
+        finally:
+            if not replaced:
+                remove(temp_path)
+        if fsync_dir:
+            try:
+                directory_descriptor = open_descriptor(directory, O_RDONLY)
+                try:
+                    fsync(directory_descriptor)
+                finally:
+                    close(directory_descriptor)
+            except OSError:
+                pass
+        with AtomicWrite.__lock:
+            AtomicWrite.__digests[file_path] = (
+                ConfigCache.signature(file_path), digest
+            )
+        return True
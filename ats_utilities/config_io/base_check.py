@@ -21,13 +21,12 @@
 '''
 
 import sys
-from os.path import splitext
 
 try:
-    from pathlib import Path
     from ats_utilities import VerboseRoot
     from ats_utilities.console_io.error import error_message
     from ats_utilities.console_io.verbose import verbose_message
+    from ats_utilities.config_io.path_cache import PathMetadataCache
 except ImportError as ats_error_message:
     MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
     sys.exit(MESSAGE)  # Force close python ATS ##############################
@@ -46,11 +45,15 @@ class FileChecking:
     '''
         Defined class FileChecking with attribute(s) and method(s).
         Created API for checking operations with files.
+        Path metadata (stat, extension) is shared by all instances through
+        cache with TTL, checked file modes are memoized.
         It defines:
 
             :attributes:
                 | __metaclass__ - setting verbose root for FileChecking.
                 | MODES - mode file operations.
+                | CACHE - shared path metadata cache.
+                | __MODES_OK - memoized status of checked file modes.
                 | __verbose - enable/disable verbose option.
                 | __file_path_ok - file exist, path ok.
                 | __file_mode_ok - supported file mode.
@@ -66,6 +69,8 @@ class FileChecking:
 
     __metaclass__ = VerboseRoot
     MODES = ['r', 'w', 'a', 'b', 'x', 't', '+']
+    CACHE = PathMetadataCache()
+    __MODES_OK = {}
 
     def __init__(self, verbose=False):
         '''
@@ -91,7 +96,7 @@ class FileChecking:
             :type verbose: <bool>
             :exceptions: None
         '''
-        if not Path(file_path).is_file():
+        if not FileChecking.CACHE.is_file(file_path):
             error_message(FileChecking.VERBOSE, 'check file', file_path)
         else:
             self.__file_path_ok = True
@@ -111,13 +116,11 @@ class FileChecking:
             :rtype: <bool>
             :exceptions: None
         '''
-        modes, mode_checks = list(file_mode), []
-        for mode in modes:
-            if mode not in FileChecking.MODES:
-                mode_checks.append(False)
-            else:
-                mode_checks.append(True)
-        if all(mode_checks):
+        mode_ok = FileChecking.__MODES_OK.get(file_mode)
+        if mode_ok is None:
+            mode_ok = set(file_mode) <= set(FileChecking.MODES)
+            FileChecking.__MODES_OK[file_mode] = mode_ok
+        if mode_ok:
             self.__file_mode_ok = True
             verbose_message(
                 FileChecking.VERBOSE, self.__verbose or verbose, file_mode
@@ -143,8 +146,7 @@ class FileChecking:
             :exceptions: None
         '''
         if file_format != 'makefile':
-            file_name_path, extension = splitext(file_path)
-            extension = extension.replace('.', '')
+            extension = FileChecking.CACHE.extension(file_path)
             if extension == '':
                 extension = file_format
         else:
@@ -21,14 +21,17 @@
 '''
 
 import sys
+from functools import partial
+from os.path import getsize
 
 try:
     from ats_utilities import VerboseRoot
-    from ats_utilities.checker import ATSChecker
+    from ats_utilities.checker import checked
     from ats_utilities.abstract import AbstractMethod
     from ats_utilities.console_io.verbose import verbose_message
-    from ats_utilities.exceptions.ats_type_error import ATSTypeError
-    from ats_utilities.exceptions.ats_bad_call_error import ATSBadCallError
+    from ats_utilities.config_io.snapshot import ConfigSnapshot
+    from ats_utilities.config_io.snapshot_file import SnapshotFile
+    from ats_utilities.config_io.config_cache import ConfigCache
 except ImportError as ats_error_message:
     MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
     sys.exit(MESSAGE)  # Force close python ATS ##############################
@@ -51,17 +54,32 @@ class BaseReadConfig:
 
             :attributes:
                 | __metaclass__ - setting verbose root for BaseReadConfig.
+                | CACHE - shared cache of parsed configurations (opt-in).
+                | SNAPSHOTS - binary snapshots of parsed configurations.
+                | PARSER_VERSION - version of parser (snapshot key).
+                | MAPPED_SIZE - file size for memory-mapped read.
                 | __verbose - enable/disable verbose option.
                 | __file_path - configuration file path.
             :methods:
                 | __init__ - initial constructor.
                 | file_path - property methods for set/get operations.
                 | is_not_none - checking is file path None.
+                | read_cached - read configuration through shared cache.
+                | parser_key - key of parser (mode of reader).
+                | parser_libraries - modules of parser libraries.
+                | is_picklable - checking can configuration be snapshot.
+                | snapshot_path - snapshot file path for configuration.
+                | __parser_id - id of parser for snapshots.
+                | is_mapped_read - checking is file read memory-mapped.
                 | read_configuration - read configuration (Abstract method).
                 | __str__ - dunder method for BaseReadConfig.
     '''
 
     __metaclass__ = VerboseRoot
+    CACHE = ConfigCache(enabled=False)
+    SNAPSHOTS = ConfigSnapshot()
+    PARSER_VERSION = 1
+    MAPPED_SIZE = 16 * 1024 * 1024
 
     def __init__(self, verbose=False):
         '''
@@ -86,6 +104,7 @@ class BaseReadConfig:
         return self.__file_path
 
     @file_path.setter
+    @checked('str:file_path')
     def file_path(self, file_path):
         '''
             Property method for setting file path.
@@ -94,12 +113,6 @@ class BaseReadConfig:
             :type file_path: <str>
             :exceptions: None
         '''
-        checker, error, status = ATSChecker(), None, False
-        error, status = checker.check_params([('str:file_path', file_path)])
-        if status == ATSChecker.TYPE_ERROR:
-            raise ATSTypeError(error)
-        if status == ATSChecker.VALUE_ERROR:
-            raise ATSBadCallError(error)
         self.__file_path = file_path
         verbose_message(BaseReadConfig.VERBOSE, self.__verbose, file_path)
 
@@ -113,6 +126,121 @@ class BaseReadConfig:
         '''
         return bool(self.__file_path)
 
+    def read_cached(self, parser, parser_key=None):
+        '''
+            Read configuration through shared cache of parsed configurations.
+            With cache enabled (CACHE.configure(enabled=True)) repeated
+            reads of unchanged file cost one stat of file and return same
+            (shared) configuration object, without cache every read returns
+            new configuration object.
+            With snapshots enabled cache miss loads snapshot of unchanged
+            file instead of parsing.
+
+            :param parser: callable which parses configuration file.
+            :type parser: <function>
+            :param parser_key: key of parser (mode of reader) | None.
+            :type parser_key: <Python object(s)> | <NoneType>
+            :return: configuration object | None.
+            :rtype: <Python object(s)> | <NoneType>
+            :exceptions: None
+        '''
+        if all([
+            BaseReadConfig.SNAPSHOTS.is_enabled(),
+            self.is_picklable(parser_key)
+        ]):
+            parser = partial(
+                BaseReadConfig.SNAPSHOTS.load, self.__file_path, parser,
+                self.__parser_id(parser_key)
+            )
+        return BaseReadConfig.CACHE.read(
+            self.__file_path, parser, (self.__class__.__name__, parser_key)
+        )
+
+    def parser_key(self):
+        '''
+            Key of parser (mode of reader), readers with same file and
+            same key return same configuration.
+
+            :return: key of parser | None (single mode).
+            :rtype: <Python object(s)> | <NoneType>
+            :exceptions: None
+        '''
+        return None
+
+    def parser_libraries(self, parser_key=None):
+        '''
+            Modules of parser libraries, versions of libraries are part
+            of parser id (snapshot of other library version is stale).
+
+            :param parser_key: key of parser (mode of reader) | None.
+            :type parser_key: <Python object(s)> | <NoneType>
+            :return: names of modules (standard library is not listed).
+            :rtype: <list>
+            :exceptions: None
+        '''
+        return []
+
+    def is_picklable(self, parser_key=None):
+        '''
+            Checking can configuration of parser be pickled (snapshot).
+
+            :param parser_key: key of parser (mode of reader) | None.
+            :type parser_key: <Python object(s)> | <NoneType>
+            :return: boolean status, True (snapshots used) | False.
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        return True
+
+    def snapshot_path(self, parser_key=None):
+        '''
+            Snapshot file path for configuration file.
+
+            :param parser_key: key of parser (mode of reader) | None.
+            :type parser_key: <Python object(s)> | <NoneType>
+            :return: snapshot file path.
+            :rtype: <str>
+            :exceptions: None
+        '''
+        return BaseReadConfig.SNAPSHOTS.path(
+            self.__file_path, self.__parser_id(parser_key)
+        )
+
+    def __parser_id(self, parser_key):
+        '''
+            Id of parser for snapshots (class, mode, parser version,
+            versions of parser libraries).
+
+            :param parser_key: key of parser (mode of reader) | None.
+            :type parser_key: <Python object(s)> | <NoneType>
+            :return: id of parser.
+            :rtype: <str>
+            :exceptions: None
+        '''
+        return '{0}:{1}:{2}:{3}'.format(
+            self.__class__.__name__, repr(parser_key), self.PARSER_VERSION,
+            ','.join([
+                SnapshotFile.library_version(module)
+                for module in self.parser_libraries(parser_key)
+            ])
+        )
+
+    def is_mapped_read(self):
+        '''
+            Checking is file read memory-mapped (file size over MAPPED_SIZE).
+            Memory map is used by parsers which read it without copy of
+            whole file (cfg lines, buffer aware json decoder, lxml and
+            ElementTree parsers), other parsers read file as text.
+
+            :return: boolean status, True (mapped read) | False.
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        try:
+            return getsize(self.__file_path) >= BaseReadConfig.MAPPED_SIZE
+        except (IOError, OSError, TypeError):
+            return False
+
     @AbstractMethod
     def read_configuration(self, verbose=False):
         '''
@@ -21,14 +21,19 @@
 '''
 
 import sys
+from threading import Lock
+from os.path import realpath
 
 try:
     from ats_utilities import VerboseRoot
-    from ats_utilities.checker import ATSChecker
+    from ats_utilities.checker import checked
     from ats_utilities.abstract import AbstractMethod
+    from ats_utilities.console_io.error import error_message
+    from ats_utilities.config_io.base_check import FileChecking
     from ats_utilities.console_io.verbose import verbose_message
-    from ats_utilities.exceptions.ats_type_error import ATSTypeError
-    from ats_utilities.exceptions.ats_bad_call_error import ATSBadCallError
+    from ats_utilities.config_io.base_read import BaseReadConfig
+    from ats_utilities.config_io.atomic_write import AtomicWrite
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
 except ImportError as ats_error_message:
     MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
     sys.exit(MESSAGE)  # Force close python ATS ##############################
@@ -47,21 +52,49 @@ class BaseWriteConfig:
     '''
         Defined class BaseWriteConfig with attribute(s) and method(s).
         Created API for write operation for configuration files.
+        Content is replaced into place atomically (see AtomicWrite), crash
+        never leaves truncated file. Content with same digest as file on
+        disk is not written, so mtime is not changed and watchers are not
+        triggered.
         It defines:
 
             :attributes:
                 | __metaclass__ - setting verbose root for BaseWriteConfig.
+                | FSYNC_NONE - no fsync (page cache only).
+                | FSYNC_FILE - fsync of temporary file before replace.
+                | FSYNC_DIR - fsync of temporary file and directory.
+                | FSYNC_POLICIES - supported fsync policies.
+                | __fsync_policy - process-wide fsync policy.
+                | STATUS_FAILED - status of failed write.
+                | STATUS_WRITTEN - status of written file.
+                | STATUS_SKIPPED - status of skipped write (same content).
+                | __skip_unchanged - process-wide skip of unchanged writes.
+                | __statistics - number of written, skipped, failed writes.
+                | __lock - lock for statistics.
                 | __verbose - enable/disable verbose option.
                 | __file_path - configuration file path.
             :methods:
                 | __init__ - initial constructor.
+                | set_fsync_policy - set process-wide fsync policy.
+                | get_fsync_policy - get process-wide fsync policy.
+                | set_skip_unchanged - enable/disable skip of unchanged.
+                | write_statistics - number of written, skipped, failed.
                 | file_path - property methods for set/get operations.
                 | is_not_none - checking is file path None.
+                | write_atomic - write content to file (atomic replace).
                 | write_configuration - write configuration (Abstract method).
+                | __count - count status of write.
                 | __str__ - dunder method for BaseWriteConfig.
     '''
 
     __metaclass__ = VerboseRoot
+    FSYNC_NONE, FSYNC_FILE, FSYNC_DIR = 'none', 'file', 'file+dir'
+    FSYNC_POLICIES = [FSYNC_NONE, FSYNC_FILE, FSYNC_DIR]
+    __fsync_policy = FSYNC_FILE
+    STATUS_FAILED, STATUS_WRITTEN, STATUS_SKIPPED = 0, 1, 2
+    __skip_unchanged = True
+    __statistics = {'written': 0, 'skipped': 0, 'failed': 0}
+    __lock = Lock()
 
     def __init__(self, verbose=False):
         '''
@@ -74,6 +107,55 @@ class BaseWriteConfig:
         self.__verbose = verbose
         self.__file_path = None
 
+    @staticmethod
+    def set_fsync_policy(fsync_policy):
+        '''
+            Set process-wide fsync policy.
+
+            :param fsync_policy: 'none' | 'file' | 'file+dir'.
+            :type fsync_policy: <str>
+            :exceptions: ATSValueError
+        '''
+        if fsync_policy not in BaseWriteConfig.FSYNC_POLICIES:
+            raise ATSValueError(
+                '{0} [{1}]'.format('not supported fsync policy', fsync_policy)
+            )
+        BaseWriteConfig.__fsync_policy = fsync_policy
+
+    @staticmethod
+    def get_fsync_policy():
+        '''
+            Get process-wide fsync policy.
+
+            :return: 'none' | 'file' | 'file+dir'.
+            :rtype: <str>
+            :exceptions: None
+        '''
+        return BaseWriteConfig.__fsync_policy
+
+    @staticmethod
+    def set_skip_unchanged(skip_unchanged):
+        '''
+            Enable/disable process-wide skip of unchanged writes.
+
+            :param skip_unchanged: enable/disable skip of unchanged writes.
+            :type skip_unchanged: <bool>
+            :exceptions: None
+        '''
+        BaseWriteConfig.__skip_unchanged = bool(skip_unchanged)
+
+    @staticmethod
+    def write_statistics():
+        '''
+            Number of written, skipped and failed writes (process-wide).
+
+            :return: written, skipped and failed writes.
+            :rtype: <dict>
+            :exceptions: None
+        '''
+        with BaseWriteConfig.__lock:
+            return dict(BaseWriteConfig.__statistics)
+
     @property
     def file_path(self):
         '''
@@ -86,6 +168,7 @@ class BaseWriteConfig:
         return self.__file_path
 
     @file_path.setter
+    @checked('str:file_path')
     def file_path(self, file_path):
         '''
             Property method for setting file path.
@@ -94,12 +177,6 @@ class BaseWriteConfig:
             :type file_path: <str>
             :exceptions: None
         '''
-        checker, error, status = ATSChecker(), None, False
-        error, status = checker.check_params([('str:file_path', file_path)])
-        if status == ATSChecker.TYPE_ERROR:
-            raise ATSTypeError(error)
-        if status == ATSChecker.VALUE_ERROR:
-            raise ATSBadCallError(error)
         self.__file_path = file_path
         verbose_message(BaseWriteConfig.VERBOSE, self.__verbose, file_path)
 
@@ -113,6 +190,56 @@ class BaseWriteConfig:
         '''
         return bool(self.__file_path)
 
+    def write_atomic(self, content, file_format, verbose=False):
+        '''
+            Write content to file (temporary file, fsync, atomic replace).
+            Content is one buffer (single write) or iterable of chunks.
+            Buffer with unchanged digest is not written at all, chunks are
+            written to temporary file which is dropped if digest is same.
+
+            :param content: serialized configuration | chunks of content.
+            :type content: <str> | <Python object(s)>
+            :param file_format: file format (file extension).
+            :type file_format: <str>
+            :param verbose: enable/disable verbose option.
+            :type verbose: <bool>
+            :return: status, 0 (failed) | 1 (written) | 2 (skipped).
+            :rtype: <int>
+            :exceptions: IOError | OSError
+        '''
+        checker = FileChecking(verbose=verbose)
+        checker.check_path(file_path=self.__file_path, verbose=verbose)
+        checker.check_mode(file_mode='w', verbose=verbose)
+        checker.check_format(
+            file_path=self.__file_path, file_format=file_format,
+            verbose=verbose
+        )
+        if not checker.is_file_ok():
+            error_message(
+                BaseWriteConfig.VERBOSE, 'check file', self.__file_path
+            )
+            return BaseWriteConfig.__count(BaseWriteConfig.STATUS_FAILED)
+        file_path = realpath(self.__file_path)
+        policy = BaseWriteConfig.__fsync_policy
+        written = AtomicWrite.write(
+            file_path, content, policy != BaseWriteConfig.FSYNC_NONE,
+            policy == BaseWriteConfig.FSYNC_DIR,
+            BaseWriteConfig.__skip_unchanged
+        )
+        if not written:
+            verbose_message(
+                BaseWriteConfig.VERBOSE, self.__verbose or verbose,
+                'unchanged', file_path
+            )
+            return BaseWriteConfig.__count(BaseWriteConfig.STATUS_SKIPPED)
+        BaseReadConfig.CACHE.invalidate(self.__file_path)
+        FileChecking.CACHE.invalidate(self.__file_path)
+        verbose_message(
+            BaseWriteConfig.VERBOSE, self.__verbose or verbose,
+            'write', file_path
+        )
+        return BaseWriteConfig.__count(BaseWriteConfig.STATUS_WRITTEN)
+
     @AbstractMethod
     def write_configuration(self, configuration, verbose=False):
         '''
@@ -125,6 +252,26 @@ class BaseWriteConfig:
             :exception: NotImplementedError
         '''
 
+    @staticmethod
+    def __count(status):
+        '''
+            Count status of write (metrics).
+
+            :param status: status of write.
+            :type status: <int>
+            :return: status of write.
+            :rtype: <int>
+            :exceptions: None
+        '''
+        counter = {
+            BaseWriteConfig.STATUS_FAILED: 'failed',
+            BaseWriteConfig.STATUS_WRITTEN: 'written',
+            BaseWriteConfig.STATUS_SKIPPED: 'skipped'
+        }[status]
+        with BaseWriteConfig.__lock:
+            BaseWriteConfig.__statistics[counter] += 1
+        return status
+
     def __str__(self):
         '''
             Dunder method for BaseWriteConfig.
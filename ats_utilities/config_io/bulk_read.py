@@ -0,0 +1,273 @@
+# -*- coding: UTF-8 -*-
+
+'''
+ Module
+     bulk_read.py
+ Copyright
+     Copyright (C) 2017 Vladimir Roncevic <elektron.ronca@gmail.com>
+     ats_utilities is free software: you can redistribute it and/or modify it
+     under the terms of the GNU General Public License as published by the
+     Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+     ats_utilities is distributed in the hope that it will be useful, but
+     WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+     See the GNU General Public License for more details.
+     You should have received a copy of the GNU General Public License along
+     with this program. If not, see <http://www.gnu.org/licenses/>.
+ Info
+     Defined class BulkResult and functions read_many, iter_many.
+     Created API for concurrent reading of many configuration files.
+'''
+
+import sys
+from os.path import splitext
+from multiprocessing import cpu_count
+from collections import OrderedDict
+
+try:
+    from ats_utilities.final import ATSFinal
+    from ats_utilities.config_io.cfg.cfg2object import Cfg2Object
+    from ats_utilities.config_io.ini.ini2object import Ini2Object
+    from ats_utilities.config_io.xml.xml2object import Xml2Object
+    from ats_utilities.config_io.json.json2object import Json2Object
+    from ats_utilities.config_io.yaml.yaml2object import Yaml2Object
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from concurrent.futures import (
+        ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+    )
+except ImportError as ats_error_message:
+    MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
+    sys.exit(MESSAGE)  # Force close python ATS ##############################
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = 'Copyright 2017, https://vroncevic.github.io/ats_utilities'
+__credits__ = ['Vladimir Roncevic']
+__license__ = 'https://github.com/vroncevic/ats_utilities/blob/dev/LICENSE'
+__version__ = '1.8.8'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+READERS = {
+    'cfg': Cfg2Object, 'ini': Ini2Object, 'xml': Xml2Object,
+    'json': Json2Object, 'yaml': Yaml2Object
+}
+CPU_BOUND_FORMATS = frozenset(['xml', 'yaml'])
+EXECUTORS = ['auto', 'thread', 'process']
+
+
+class BulkResult:
+    '''
+        Defined class BulkResult with attribute(s) and method(s).
+        Created API for result of reading one configuration file.
+        It defines:
+
+            :attributes:
+                | __metaclass__ - setting class BulkResult as final.
+                | file_path - configuration file path.
+                | configuration - configuration object | None.
+                | error - error message | None (configuration is read).
+            :methods:
+                | __init__ - initial constructor.
+                | is_ok - configuration is read without error.
+                | __str__ - dunder method for BulkResult.
+    '''
+
+    __metaclass__ = ATSFinal
+
+    def __init__(self, file_path, configuration=None, error=None):
+        '''
+            Initial constructor.
+
+            :param file_path: configuration file path.
+            :type file_path: <str>
+            :param configuration: configuration object | None.
+            :type configuration: <Python object(s)> | <NoneType>
+            :param error: error message | None.
+            :type error: <str> | <NoneType>
+            :exceptions: None
+        '''
+        self.file_path = file_path
+        self.configuration = configuration
+        self.error = error
+
+    def is_ok(self):
+        '''
+            Configuration is read without error.
+
+            :return: boolean status, True (configuration is read) | False.
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        return self.error is None
+
+    def __str__(self):
+        '''
+            Dunder method for BulkResult.
+
+            :return: object in a human-readable format.
+            :rtype: <str>
+            :exceptions: None
+        '''
+        return '{0} ({1}, {2})'.format(
+            self.__class__.__name__, self.file_path, self.error
+        )
+
+
+def file_format(file_path):
+    '''
+        Format of configuration file by extension.
+
+        :param file_path: configuration file path.
+        :type file_path: <str>
+        :return: format of configuration file (extension without dot).
+        :rtype: <str>
+        :exceptions: None
+    '''
+    return splitext(file_path)[1].replace('.', '').lower()
+
+
+def error_text(error):
+    '''
+        Error message of result (class name and message of exception).
+
+        :param error: exception.
+        :type error: <Exception>
+        :return: error message.
+        :rtype: <str>
+        :exceptions: None
+    '''
+    return '{0}: {1}'.format(error.__class__.__name__, error)
+
+
+def read_file(file_path, verbose=False, plain=False):
+    '''
+        Read configuration file with reader for extension (errors captured).
+        In plain mode xml file is read as plain data (Xml2Object.read_data),
+        element trees of xml backends (lxml) can not be sent between
+        processes.
+
+        :param file_path: configuration file path.
+        :type file_path: <str>
+        :param verbose: enable/disable verbose option.
+        :type verbose: <bool>
+        :param plain: enable/disable plain data of xml file.
+        :type plain: <bool>
+        :return: result of reading configuration file.
+        :rtype: <BulkResult>
+        :exceptions: None
+    '''
+    reader = READERS.get(file_format(file_path))
+    if reader is None:
+        return BulkResult(file_path, error='not supported format')
+    try:
+        reader = reader(file_path, verbose=verbose)
+        if plain and isinstance(reader, Xml2Object):
+            configuration = reader.read_data(verbose=verbose)
+        else:
+            configuration = reader.read_configuration(verbose=verbose)
+    except Exception as read_error:
+        return BulkResult(file_path, error=error_text(read_error))
+    if configuration is None:
+        return BulkResult(file_path, error='check file')
+    return BulkResult(file_path, configuration)
+
+
+def read_files(file_paths, verbose=False, plain=False):
+    '''
+        Read chunk of configuration files in one worker.
+
+        :param file_paths: configuration file paths.
+        :type file_paths: <list>
+        :param verbose: enable/disable verbose option.
+        :type verbose: <bool>
+        :param plain: enable/disable plain data of xml files.
+        :type plain: <bool>
+        :return: results of reading configuration files.
+        :rtype: <list>
+        :exceptions: None
+    '''
+    return [
+        read_file(file_path, verbose, plain) for file_path in file_paths
+    ]
+
+
+def iter_many(file_paths, workers=None, executor='auto', verbose=False):
+    '''
+        Read configuration files concurrently, yield in completion order.
+        Executor 'auto' uses process pool when any file is xml/yaml
+        (CPU bound parsing), thread pool otherwise. Paths are sent to
+        workers in chunks, duplicated paths are read once. Process pool
+        returns xml files as plain data (Xml2Object.read_data), failure
+        of worker is reported as error of every path in its chunk.
+
+        :param file_paths: configuration file paths.
+        :type file_paths: <list> | <tuple>
+        :param workers: number of workers | None (number of CPUs).
+        :type workers: <int> | <NoneType>
+        :param executor: 'auto' | 'thread' | 'process'.
+        :type executor: <str>
+        :param verbose: enable/disable verbose option.
+        :type verbose: <bool>
+        :return: generator of results in completion order.
+        :rtype: <generator>
+        :exceptions: ATSValueError
+    '''
+    if executor not in EXECUTORS:
+        raise ATSValueError(
+            '{0} [{1}]'.format('not supported executor', executor)
+        )
+    file_paths = list(OrderedDict.fromkeys(file_paths))
+    if not file_paths:
+        return
+    if executor == 'auto':
+        formats = set([file_format(file_path) for file_path in file_paths])
+        executor = 'process' if formats & CPU_BOUND_FORMATS else 'thread'
+    workers = workers or cpu_count() or 1
+    pool = ProcessPoolExecutor if executor == 'process' else ThreadPoolExecutor
+    chunk_size = max(1, len(file_paths) // (workers * 4))
+    with pool(max_workers=workers) as bulk_executor:
+        chunks = {}
+        for index in range(0, len(file_paths), chunk_size):
+            chunk = file_paths[index:index + chunk_size]
+            chunks[bulk_executor.submit(
+                read_files, chunk, verbose, executor == 'process'
+            )] = chunk
+        for future in as_completed(chunks):
+            try:
+                results = future.result()
+            except Exception as worker_error:
+                results = [
+                    BulkResult(file_path, error=error_text(worker_error))
+                    for file_path in chunks[future]
+                ]
+            for result in results:
+                yield result
+
+
+def read_many(file_paths, workers=None, executor='auto', verbose=False):
+    '''
+        Read configuration files concurrently.
+
+        :param file_paths: configuration file paths.
+        :type file_paths: <list> | <tuple>
+        :param workers: number of workers | None (number of CPUs).
+        :type workers: <int> | <NoneType>
+        :param executor: 'auto' | 'thread' | 'process'.
+        :type executor: <str>
+        :param verbose: enable/disable verbose option.
+        :type verbose: <bool>
+        :return: results by file path (order of file paths).
+        :rtype: <OrderedDict>
+        :exceptions: ATSValueError
+    '''
+    results = dict([
+        (result.file_path, result) for result in iter_many(
+            file_paths, workers=workers, executor=executor, verbose=verbose
+        )
+    ])
+    return OrderedDict([
+        (file_path, results[file_path]) for file_path in file_paths
+        if file_path in results
+    ])
@@ -21,16 +21,15 @@
 '''
 
 import sys
-from re import match
+from functools import partial
+from codecs import getincrementaldecoder
 
 try:
     from ats_utilities import VerboseRoot
-    from ats_utilities.checker import ATSChecker
+    from ats_utilities.checker import checked
     from ats_utilities.config_io import ConfigFile
     from ats_utilities.console_io.verbose import verbose_message
     from ats_utilities.config_io.base_read import BaseReadConfig
-    from ats_utilities.exceptions.ats_type_error import ATSTypeError
-    from ats_utilities.exceptions.ats_bad_call_error import ATSBadCallError
 except ImportError as ats_error_message:
     MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
     sys.exit(MESSAGE)  # Force close python ATS ##############################
@@ -54,18 +53,22 @@ class Cfg2Object(BaseReadConfig):
             :attributes:
                 | __metaclass__ - setting verbose root for Cfg2Object.
                 | __FORMAT - format of configuration content.
-                | __REGEX_MATCH_LINE - regular expression for matching line.
+                | CHUNK_SIZE - size of chunk for streaming file content.
                 | __verbose - enable/disable verbose option.
             :methods:
                 | __init__ - initial constructor.
                 | read_configuration - read configuration from file.
+                | iter_configuration - iterate (key, value) pairs from file.
+                | __parse_configuration - parse configuration from file.
+                | __iter_pairs - iterate (key, value) pairs from opened file.
                 | __str__ - dunder method for object Cfg2Object.
     '''
 
     __metaclass__ = VerboseRoot
     __FORMAT = 'cfg'
-    __REGEX_MATCH_LINE = r'^\s*$'
+    CHUNK_SIZE = 64 * 1024
 
+    @checked('str:configuration_file')
     def __init__(self, configuration_file, verbose=False):
         '''
             Initial constructor.
@@ -76,14 +79,6 @@ class Cfg2Object(BaseReadConfig):
             :type verbose: <bool>
             :exceptions: ATSTypeError | ATSBadCallError
         '''
-        checker, error, status = ATSChecker(), None, False
-        error, status = checker.check_params([
-            ('str:configuration_file', configuration_file)
-        ])
-        if status == ATSChecker.TYPE_ERROR:
-            raise ATSTypeError(error)
-        if status == ATSChecker.VALUE_ERROR:
-            raise ATSBadCallError(error)
         BaseReadConfig.__init__(self, verbose=verbose)
         self.__verbose = verbose
         self.file_path = configuration_file
@@ -99,24 +94,88 @@ class Cfg2Object(BaseReadConfig):
             :rtype: <dict> | <NoneType>
             :exceptions: None
         '''
-        config = None
+        config = self.read_cached(self.__parse_configuration)
+        verbose_message(Cfg2Object.VERBOSE, self.__verbose or verbose, config)
+        return config
+
+    def iter_configuration(self, chunk_size=CHUNK_SIZE, verbose=False):
+        '''
+            Iterate (key, value) pairs from cfg file lazily.
+            File is streamed in chunks, iteration can be stopped early.
+
+            :param chunk_size: size of chunk for streaming file content.
+            :type chunk_size: <int>
+            :param verbose: enable/disable verbose option.
+            :type verbose: <bool>
+            :return: generator of (key, value) pairs.
+            :rtype: <generator>
+            :exceptions: None
+        '''
+        mapped = self.is_mapped_read()
+        with ConfigFile(
+            self.file_path, 'r', Cfg2Object.__FORMAT, mapped=mapped
+        ) as cfg:
+            if bool(cfg):
+                verbose_message(
+                    Cfg2Object.VERBOSE, self.__verbose or verbose,
+                    'stream configuration', self.file_path
+                )
+                for key, value in self.__iter_pairs(cfg, mapped, chunk_size):
+                    yield key, value
+
+    def __parse_configuration(self):
+        '''
+            Parse a configuration from a cfg file.
+
+            :return: configuration object | None.
+            :rtype: <dict> | <NoneType>
+            :exceptions: None
+        '''
+        config, mapped = None, self.is_mapped_read()
         try:
-            with ConfigFile(self.file_path, 'r', Cfg2Object.__FORMAT) as cfg:
+            with ConfigFile(
+                self.file_path, 'r', Cfg2Object.__FORMAT, mapped=mapped
+            ) as cfg:
                 if bool(cfg):
-                    content = cfg.read()
-                    config, lines = {}, content.splitlines()
-                    for line in lines:
-                        regex_match = match(
-                            Cfg2Object.__REGEX_MATCH_LINE, line
-                        )
-                        if not regex_match:
-                            pairs = line.split('=')
-                            config[pairs[0].strip()] = pairs[1].strip()
+                    config = dict(
+                        self.__iter_pairs(cfg, mapped, Cfg2Object.CHUNK_SIZE)
+                    )
         except AttributeError:
             pass
-        verbose_message(Cfg2Object.VERBOSE, self.__verbose or verbose, config)
         return config
 
+    def __iter_pairs(self, cfg, mapped, chunk_size):
+        '''
+            Iterate (key, value) pairs from opened cfg file.
+
+            :param cfg: opened file object | memory map of file.
+            :type cfg: <file> | <mmap>
+            :param mapped: file content is memory map (bytes).
+            :type mapped: <bool>
+            :param chunk_size: size of chunk for streaming file content.
+            :type chunk_size: <int>
+            :return: generator of (key, value) pairs.
+            :rtype: <generator>
+            :exceptions: None
+        '''
+        decoder, pending, end = None, '', ''
+        if mapped:
+            decoder, end = getincrementaldecoder('utf-8')(), b''
+        for chunk in iter(partial(cfg.read, chunk_size), end):
+            if decoder is not None:
+                chunk = decoder.decode(chunk)
+            lines = '{0}{1}'.format(pending, chunk).split('\n')
+            pending = lines.pop()
+            for line in lines:
+                if line.strip():
+                    pairs = line.split('=', 1)
+                    yield pairs[0].strip(), pairs[1].strip()
+        if decoder is not None:
+            pending = '{0}{1}'.format(pending, decoder.decode(b'', True))
+        if pending.strip():
+            pairs = pending.split('=', 1)
+            yield pairs[0].strip(), pairs[1].strip()
+
     def __str__(self):
         '''
             Dunder method for Cfg2Object.
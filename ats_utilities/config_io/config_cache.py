@@ -0,0 +1,300 @@
+# -*- coding: UTF-8 -*-
+
+'''
+ Module
+     config_cache.py
+ Copyright
+     Copyright (C) 2017 Vladimir Roncevic <elektron.ronca@gmail.com>
+     ats_utilities is free software: you can redistribute it and/or modify it
+     under the terms of the GNU General Public License as published by the
+     Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+     ats_utilities is distributed in the hope that it will be useful, but
+     WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+     See the GNU General Public License for more details.
+     You should have received a copy of the GNU General Public License along
+     with this program. If not, see <http://www.gnu.org/licenses/>.
+ Info
+     Defined class ConfigCache with attribute(s) and method(s).
+     Created API for caching parsed configurations (LRU, stat validated).
+'''
+
+import sys
+from os import environ, stat
+from os.path import abspath
+from threading import Lock
+from collections import OrderedDict
+
+try:
+    from ats_utilities.final import ATSFinal
+except ImportError as ats_error_message:
+    MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
+    sys.exit(MESSAGE)  # Force close python ATS ##############################
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = 'Copyright 2017, https://vroncevic.github.io/ats_utilities'
+__credits__ = ['Vladimir Roncevic']
+__license__ = 'https://github.com/vroncevic/ats_utilities/blob/dev/LICENSE'
+__version__ = '1.8.8'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+
+class ConfigCache:
+    '''
+        Defined class ConfigCache with attribute(s) and method(s).
+        Created API for caching parsed configurations (LRU, stat validated).
+        Entry is valid while (st_mtime_ns, st_size, st_ino) of file is same,
+        size of file is used as cost of entry for byte budget.
+        Cached configuration objects are shared between readers, so cache
+        is for readers which treat configuration as read-only (opt-in).
+        It defines:
+
+            :attributes:
+                | __metaclass__ - setting class ConfigCache as final.
+                | MAX_ENTRIES - default max number of entries.
+                | MAX_BYTES - default byte budget (sum of file sizes).
+                | CACHE_ENV - 'on' enables caching, 'off' disables caching.
+                | __lock - lock for entries.
+                | __entries - cached entries in LRU order.
+                | __max_entries - max number of entries.
+                | __max_bytes - byte budget for entries.
+                | __total_bytes - current cost of entries.
+                | __enabled - enable/disable caching.
+                | __hits - number of cache hits.
+                | __misses - number of cache misses.
+            :methods:
+                | __init__ - initial constructor.
+                | configure - setup limits and enable/disable caching.
+                | is_enabled - checking is caching enabled.
+                | signature - stat signature of file.
+                | get - get valid configuration from cache.
+                | put - put configuration to cache.
+                | read - read configuration through cache.
+                | invalidate - remove entries for file (or all entries).
+                | statistics - cache statistics.
+                | __evict - evict least recently used entries over limits.
+                | __len__ - number of cached entries.
+                | __str__ - dunder method for ConfigCache.
+    '''
+
+    __metaclass__ = ATSFinal
+    MAX_ENTRIES = 128
+    MAX_BYTES = 64 * 1024 * 1024
+    CACHE_ENV = 'ATS_CONFIG_CACHE'
+
+    def __init__(
+        self, max_entries=MAX_ENTRIES, max_bytes=MAX_BYTES, enabled=True
+    ):
+        '''
+            Initial constructor.
+            Environment variable ATS_CONFIG_CACHE ('on' | 'off') overrides
+            enabled parameter.
+
+            :param max_entries: max number of entries.
+            :type max_entries: <int>
+            :param max_bytes: byte budget (sum of file sizes).
+            :type max_bytes: <int>
+            :param enabled: enable/disable caching.
+            :type enabled: <bool>
+            :exceptions: None
+        '''
+        self.__lock = Lock()
+        self.__entries = OrderedDict()
+        self.__max_entries, self.__max_bytes = max_entries, max_bytes
+        self.__total_bytes, self.__enabled = 0, enabled
+        self.__hits, self.__misses = 0, 0
+        cache_env = environ.get(ConfigCache.CACHE_ENV, '').lower()
+        if cache_env in ['on', 'off']:
+            self.__enabled = cache_env == 'on'
+
+    def configure(self, max_entries=None, max_bytes=None, enabled=None):
+        '''
+            Setup limits and enable/disable caching.
+
+            :param max_entries: max number of entries | None.
+            :type max_entries: <int> | <NoneType>
+            :param max_bytes: byte budget | None.
+            :type max_bytes: <int> | <NoneType>
+            :param enabled: enable/disable caching | None.
+            :type enabled: <bool> | <NoneType>
+            :exceptions: None
+        '''
+        with self.__lock:
+            if max_entries is not None:
+                self.__max_entries = max_entries
+            if max_bytes is not None:
+                self.__max_bytes = max_bytes
+            if enabled is not None:
+                self.__enabled = enabled
+            self.__evict()
+        if enabled is False:
+            self.invalidate()
+
+    def is_enabled(self):
+        '''
+            Checking is caching enabled.
+
+            :return: boolean status, True (enabled) | False.
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        return self.__enabled
+
+    @staticmethod
+    def signature(file_path):
+        '''
+            Stat signature of file.
+
+            :param file_path: file path.
+            :type file_path: <str>
+            :return: (st_mtime_ns, st_size, st_ino) | None.
+            :rtype: <tuple> | <NoneType>
+            :exceptions: None
+        '''
+        try:
+            file_stat = stat(file_path)
+        except (IOError, OSError, TypeError):
+            return None
+        mtime_ns = getattr(
+            file_stat, 'st_mtime_ns', int(file_stat.st_mtime * 1e9)
+        )
+        return mtime_ns, file_stat.st_size, file_stat.st_ino
+
+    def get(self, key, signature):
+        '''
+            Get valid configuration from cache.
+
+            :param key: cache key (absolute path, parser key).
+            :type key: <tuple>
+            :param signature: stat signature of file.
+            :type signature: <tuple>
+            :return: configuration object | None.
+            :rtype: <Python object(s)> | <NoneType>
+            :exceptions: None
+        '''
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None or entry[0] != signature:
+                self.__misses += 1
+                return None
+            self.__hits += 1
+            self.__entries[key] = self.__entries.pop(key)
+            return entry[1]
+
+    def put(self, key, signature, configuration):
+        '''
+            Put configuration to cache.
+
+            :param key: cache key (absolute path, parser key).
+            :type key: <tuple>
+            :param signature: stat signature of file.
+            :type signature: <tuple>
+            :param configuration: configuration object.
+            :type configuration: <Python object(s)>
+            :exceptions: None
+        '''
+        cost = signature[1]
+        with self.__lock:
+            if not self.__enabled or cost > self.__max_bytes:
+                return
+            old_entry = self.__entries.pop(key, None)
+            if old_entry is not None:
+                self.__total_bytes -= old_entry[0][1]
+            self.__entries[key] = (signature, configuration)
+            self.__total_bytes += cost
+            self.__evict()
+
+    def read(self, file_path, parser, parser_key=None):
+        '''
+            Read configuration through cache.
+
+            :param file_path: configuration file path.
+            :type file_path: <str>
+            :param parser: callable which parses configuration file.
+            :type parser: <function>
+            :param parser_key: key of parser (class, mode) | None.
+            :type parser_key: <Python object(s)> | <NoneType>
+            :return: configuration object | None.
+            :rtype: <Python object(s)> | <NoneType>
+            :exceptions: None
+        '''
+        signature = None
+        if self.__enabled:
+            signature = ConfigCache.signature(file_path)
+        if signature is None:
+            return parser()
+        key = (abspath(file_path), parser_key)
+        configuration = self.get(key, signature)
+        if configuration is None:
+            configuration = parser()
+            if configuration is not None:
+                self.put(key, signature, configuration)
+        return configuration
+
+    def invalidate(self, file_path=None):
+        '''
+            Remove entries for file (or all entries).
+
+            :param file_path: configuration file path | None (all entries).
+            :type file_path: <str> | <NoneType>
+            :exceptions: None
+        '''
+        with self.__lock:
+            path = None if file_path is None else abspath(file_path)
+            for key in list(self.__entries):
+                if path is None or key[0] == path:
+                    self.__total_bytes -= self.__entries.pop(key)[0][1]
+
+    def statistics(self):
+        '''
+            Cache statistics.
+
+            :return: entries, bytes, hits and misses of cache.
+            :rtype: <dict>
+            :exceptions: None
+        '''
+        with self.__lock:
+            return {
+                'entries': len(self.__entries), 'bytes': self.__total_bytes,
+                'hits': self.__hits, 'misses': self.__misses
+            }
+
+    def __evict(self):
+        '''
+            Evict least recently used entries over limits (lock is held).
+
+            :exceptions: None
+        '''
+        while self.__entries and any([
+            len(self.__entries) > self.__max_entries,
+            self.__total_bytes > self.__max_bytes
+        ]):
+            signature, _ = self.__entries.popitem(last=False)[1]
+            self.__total_bytes -= signature[1]
+
+    def __len__(self):
+        '''
+            Number of cached entries.
+
+            :return: number of cached entries.
+            :rtype: <int>
+            :exceptions: None
+        '''
+        return len(self.__entries)
+
+    def __str__(self):
+        '''
+            Dunder method for ConfigCache.
+
+            :return: object in a human-readable format.
+            :rtype: <str>
+            :exceptions: None
+        '''
+        return '{0} ({1}, {2}, {3}, {4})'.format(
+            self.__class__.__name__, str(self.__enabled),
+            str(self.__max_entries), str(self.__max_bytes),
+            str(self.statistics())
+        )
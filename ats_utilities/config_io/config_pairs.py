@@ -0,0 +1,210 @@
+# -*- coding: UTF-8 -*-
+
+'''
+ Module
+     config_pairs.py
+ Copyright
+     Copyright (C) 2017 Vladimir Roncevic <elektron.ronca@gmail.com>
+     ats_utilities is free software: you can redistribute it and/or modify it
+     under the terms of the GNU General Public License as published by the
+     Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+     ats_utilities is distributed in the hope that it will be useful, but
+     WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+     See the GNU General Public License for more details.
+     You should have received a copy of the GNU General Public License along
+     with this program. If not, see <http://www.gnu.org/licenses/>.
+ Info
+     Defined API for (key, value) pairs of configuration files, pairs of
+     cfg, jsonl and xml files are streamed in constant memory. Repeated
+     keys (xml elements) are grouped into lists, no pair is dropped.
+'''
+
+import sys
+from collections import OrderedDict
+
+try:
+    from ats_utilities.config_io.cfg.cfg2object import Cfg2Object
+    from ats_utilities.config_io.ini.ini2object import Ini2Object
+    from ats_utilities.config_io.xml.xml2object import Xml2Object
+    from ats_utilities.config_io.xml.xml_backend import XmlBackend
+    from ats_utilities.config_io.xml.object2xml import Object2Xml
+    from ats_utilities.config_io.json.json2object import Json2Object
+    from ats_utilities.config_io.yaml.yaml2object import Yaml2Object
+    from ats_utilities.config_io.json.json_backend import JsonBackend
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from ats_utilities.config_io.bulk_read import file_format
+except ImportError as ats_error_message:
+    MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
+    sys.exit(MESSAGE)  # Force close python ATS ##############################
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = 'Copyright 2017, https://vroncevic.github.io/ats_utilities'
+__credits__ = ['Vladimir Roncevic']
+__license__ = 'https://github.com/vroncevic/ats_utilities/blob/dev/LICENSE'
+__version__ = '1.8.8'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+FORMATS = ['cfg', 'ini', 'json', 'jsonl', 'xml', 'yaml']
+STREAMING_FORMATS = frozenset(['cfg', 'jsonl', 'xml'])
+READERS = {
+    'cfg': Cfg2Object, 'ini': Ini2Object, 'xml': Xml2Object,
+    'json': Json2Object, 'yaml': Yaml2Object
+}
+XML_ROOT = 'configuration'
+
+
+def flat_value(value):
+    '''
+        Value for flat formats (cfg, ini), containers are json encoded.
+
+        :param value: value of pair.
+        :type value: <Python object(s)>
+        :return: value in text form.
+        :rtype: <str>
+        :exceptions: None
+    '''
+    if isinstance(value, (dict, list)):
+        return JsonBackend.dumps(value)
+    return str(value)
+
+
+def element_value(element):
+    '''
+        Value of xml element (text or dict of children, repeated as list).
+
+        :param element: xml element.
+        :type element: <Element>
+        :return: text of element | children of element.
+        :rtype: <str> | <dict>
+        :exceptions: None
+    '''
+    return XmlBackend.element_value(element)
+
+
+def iter_pairs(file_path, verbose=False):
+    '''
+        Iterate (key, value) pairs of configuration file.
+        Pairs of cfg, jsonl and xml (children of root) files are streamed
+        in constant memory, other formats are read as whole document.
+
+        :param file_path: configuration file path.
+        :type file_path: <str>
+        :param verbose: enable/disable verbose option.
+        :type verbose: <bool>
+        :return: generator of (key, value) pairs.
+        :rtype: <generator>
+        :exceptions: ATSValueError
+    '''
+    source_format = file_format(file_path)
+    if source_format not in FORMATS:
+        raise ATSValueError(
+            '{0} [{1}]'.format('not supported format', source_format)
+        )
+    if source_format == 'cfg':
+        for pair in Cfg2Object(file_path, verbose).iter_configuration(
+            verbose=verbose
+        ):
+            yield pair
+    elif source_format == 'xml':
+        for element in Xml2Object(file_path, verbose).iter_elements(
+            verbose=verbose
+        ):
+            yield element.tag, element_value(element)
+    elif source_format == 'jsonl':
+        with open(file_path) as jsonl:
+            for line in jsonl:
+                if line.strip():
+                    for pair in JsonBackend.loads(line).items():
+                        yield pair
+    else:
+        reader = READERS[source_format](file_path, verbose=verbose)
+        if source_format == 'ini':
+            configuration = reader.read_mapping(
+                interpolation=False, verbose=verbose
+            )
+            if configuration is not None:
+                configuration = dict(configuration)
+                configuration.pop('DEFAULT')
+        else:
+            configuration = reader.read_configuration(verbose=verbose)
+        if not isinstance(configuration, dict):
+            raise ATSValueError(
+                '{0} [{1}]'.format('not mapping configuration', file_path)
+            )
+        for pair in configuration.items():
+            yield pair
+
+
+def group_pairs(pairs):
+    '''
+        Mapping of (key, value) pairs, values of repeated keys are grouped
+        into list (same as children of xml element), no pair is dropped.
+
+        :param pairs: (key, value) pairs.
+        :type pairs: <Python object(s)>
+        :return: mapping of pairs.
+        :rtype: <OrderedDict>
+        :exceptions: None
+    '''
+    grouped, repeated = OrderedDict(), set()
+    for key, value in pairs:
+        if key not in grouped:
+            grouped[key] = value
+        elif key in repeated:
+            grouped[key].append(value)
+        else:
+            grouped[key] = [grouped[key], value]
+            repeated.add(key)
+    return grouped
+
+
+def load_mapping(source, verbose=False):
+    '''
+        Load mapping from source (file of any supported format).
+
+        :param source: configuration file path | mapping.
+        :type source: <str> | <dict>
+        :param verbose: enable/disable verbose option.
+        :type verbose: <bool>
+        :return: configuration mapping.
+        :rtype: <dict>
+        :exceptions: ATSValueError
+    '''
+    if isinstance(source, dict):
+        return source
+    if not isinstance(source, str):
+        raise ATSValueError(
+            '{0} [{1}]'.format('not supported source', type(source))
+        )
+    return dict(iter_pairs(source, verbose))
+
+
+def iter_chunks(pairs, target_format):
+    '''
+        Serialize (key, value) pairs to chunks of streaming format.
+
+        :param pairs: (key, value) pairs.
+        :type pairs: <Python object(s)>
+        :param target_format: 'cfg' | 'jsonl' | 'xml'.
+        :type target_format: <str>
+        :return: generator of chunks of content.
+        :rtype: <generator>
+        :exceptions: ATSValueError
+    '''
+    if target_format not in STREAMING_FORMATS:
+        raise ATSValueError(
+            '{0} [{1}]'.format('not streaming format', target_format)
+        )
+    if target_format == 'xml':
+        for chunk in Object2Xml.iter_chunks(pairs, XML_ROOT):
+            yield chunk
+        return
+    for key, value in pairs:
+        if target_format == 'jsonl':
+            yield '{0}\n'.format(JsonBackend.dumps({key: value}))
+        else:
+            yield '{0} = {1}\n'.format(key, flat_value(value))
@@ -0,0 +1,282 @@
+# -*- coding: UTF-8 -*-
+
+'''
+ Module
+     converter.py
+ Copyright
+     Copyright (C) 2017 Vladimir Roncevic <elektron.ronca@gmail.com>
+     ats_utilities is free software: you can redistribute it and/or modify it
+     under the terms of the GNU General Public License as published by the
+     Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+     ats_utilities is distributed in the hope that it will be useful, but
+     WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+     See the GNU General Public License for more details.
+     You should have received a copy of the GNU General Public License along
+     with this program. If not, see <http://www.gnu.org/licenses/>.
+ Info
+     Defined converter API for configuration files (cfg, ini, json, jsonl,
+     xml, yaml) with streaming paths for cfg, jsonl and xml (pairs of
+     configuration are read and written by config_pairs API).
+ Execute
+     ats-convert SOURCE TARGET
+     ats-convert -r -t FORMAT [-j WORKERS] SOURCE_DIR TARGET_DIR
+'''
+
+import sys
+from os import makedirs, remove, walk
+from os.path import dirname, exists, isdir, join, relpath, splitext
+from multiprocessing import cpu_count
+from collections import OrderedDict
+
+try:
+    from ats_utilities.config_io.base_write import BaseWriteConfig
+    from ats_utilities.config_io.ini.object2ini import Object2Ini
+    from ats_utilities.config_io.json.object2json import Object2Json
+    from ats_utilities.config_io.yaml.object2yaml import Object2Yaml
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from ats_utilities.config_io.bulk_read import file_format
+    from ats_utilities.config_io.config_pairs import (
+        FORMATS, STREAMING_FORMATS, flat_value, group_pairs, iter_chunks,
+        iter_pairs
+    )
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+except ImportError as ats_error_message:
+    MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
+    sys.exit(MESSAGE)  # Force close python ATS ##############################
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = 'Copyright 2017, https://vroncevic.github.io/ats_utilities'
+__credits__ = ['Vladimir Roncevic']
+__license__ = 'https://github.com/vroncevic/ats_utilities/blob/dev/LICENSE'
+__version__ = '1.8.8'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+WRITERS = {'ini': Object2Ini, 'json': Object2Json, 'yaml': Object2Yaml}
+CONVERSION_ERRORS = (
+    ATSValueError, IOError, ValueError, TypeError, SyntaxError
+)
+
+
+def convert_file(source, target, verbose=False):
+    '''
+        Convert configuration file to format of target file (extension).
+        Streaming target (cfg, jsonl, xml) is written chunk by chunk,
+        other targets are written from one mapping of pairs.
+
+        :param source: source configuration file path.
+        :type source: <str>
+        :param target: target configuration file path.
+        :type target: <str>
+        :param verbose: enable/disable verbose option.
+        :type verbose: <bool>
+        :return: status, 0 (failed) | 1 (written) | 2 (skipped).
+        :rtype: <int>
+        :exceptions: ATSValueError
+    '''
+    target_format = file_format(target)
+    if target_format not in FORMATS:
+        raise ATSValueError(
+            '{0} [{1}]'.format('not supported format', target_format)
+        )
+    created = not exists(target)
+    if created:
+        open(target, 'a').close()
+    status = BaseWriteConfig.STATUS_FAILED
+    try:
+        pairs = iter_pairs(source, verbose)
+        if target_format in STREAMING_FORMATS:
+            writer = BaseWriteConfig(verbose=verbose)
+            writer.file_path = target
+            status = writer.write_atomic(
+                iter_chunks(pairs, target_format), target_format, verbose
+            )
+        elif target_format == 'ini':
+            from configparser import ConfigParser
+            configuration = ConfigParser(interpolation=None)
+            for key, value in group_pairs(pairs).items():
+                if isinstance(value, dict):
+                    configuration[key] = dict([
+                        (option, flat_value(option_value))
+                        for option, option_value in value.items()
+                    ])
+                else:
+                    configuration['DEFAULT'][key] = flat_value(value)
+            status = Object2Ini(target, verbose).write_configuration(
+                configuration, verbose
+            )
+        else:
+            status = WRITERS[target_format](
+                target, verbose
+            ).write_configuration(dict(group_pairs(pairs)), verbose)
+    finally:
+        if created and not status:
+            remove(target)
+    return status
+
+
+def conversion_errors():
+    '''
+        Expected errors of converting files (parser errors included).
+
+        :return: classes of expected conversion errors.
+        :rtype: <tuple>
+        :exceptions: None
+    '''
+    from configparser import Error as IniError
+    errors = CONVERSION_ERRORS + (IniError,)
+    try:
+        from yaml import YAMLError
+    except ImportError:
+        return errors
+    return errors + (YAMLError,)
+
+
+def convert_files(jobs, verbose=False):
+    '''
+        Convert chunk of configuration files in one worker.
+        Expected errors are reported per file, other errors are raised.
+
+        :param jobs: (source, target) file paths.
+        :type jobs: <list>
+        :param verbose: enable/disable verbose option.
+        :type verbose: <bool>
+        :return: (source, status, error | None) of converted files.
+        :rtype: <list>
+        :exceptions: None
+    '''
+    errors, results = conversion_errors(), []
+    for source, target in jobs:
+        error = None
+        try:
+            status = convert_file(source, target, verbose)
+        except errors as conversion_error:
+            status = BaseWriteConfig.STATUS_FAILED
+            error = '{0}: {1}'.format(
+                conversion_error.__class__.__name__, conversion_error
+            )
+        results.append((source, status, error))
+    return results
+
+
+def convert_tree(
+    source_dir, target_dir, target_format, workers=None, verbose=False
+):
+    '''
+        Convert supported files of directory tree across processes.
+        Structure of source directory is mirrored in target directory.
+
+        :param source_dir: source directory.
+        :type source_dir: <str>
+        :param target_dir: target directory.
+        :type target_dir: <str>
+        :param target_format: format of target files.
+        :type target_format: <str>
+        :param workers: number of workers | None (number of CPUs).
+        :type workers: <int> | <NoneType>
+        :param verbose: enable/disable verbose option.
+        :type verbose: <bool>
+        :return: (status, error | None) by source file path (sorted).
+        :rtype: <OrderedDict>
+        :exceptions: ATSValueError
+    '''
+    if target_format not in FORMATS:
+        raise ATSValueError(
+            '{0} [{1}]'.format('not supported format', target_format)
+        )
+    jobs = []
+    for root, _, file_names in walk(source_dir):
+        for file_name in sorted(file_names):
+            source = join(root, file_name)
+            if file_format(source) not in FORMATS:
+                continue
+            target = join(target_dir, '{0}.{1}'.format(
+                splitext(relpath(source, source_dir))[0], target_format
+            ))
+            if not isdir(dirname(target)):
+                makedirs(dirname(target))
+            jobs.append((source, target))
+    results = {}
+    if jobs:
+        workers = workers or cpu_count() or 1
+        chunk_size = max(1, len(jobs) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as tree_executor:
+            futures = [
+                tree_executor.submit(
+                    convert_files, jobs[index:index + chunk_size], verbose
+                ) for index in range(0, len(jobs), chunk_size)
+            ]
+            for future in as_completed(futures):
+                for source, status, error in future.result():
+                    results[source] = (status, error)
+    return OrderedDict([
+        (source, results[source]) for source in sorted(results)
+    ])
+
+
+def main(argv=None):
+    '''
+        Command line tool for converting configuration files.
+
+        :param argv: command line arguments | None (sys.argv).
+        :type argv: <list> | <NoneType>
+        :return: exit status, 0 (all files converted) | 1.
+        :rtype: <int>
+        :exceptions: None
+    '''
+    from argparse import ArgumentParser
+    parser = ArgumentParser(
+        prog='ats-convert',
+        description='convert configuration files (cfg, ini, json, jsonl, '
+                    'xml, yaml), format is taken from file extension'
+    )
+    parser.add_argument('source', metavar='SOURCE')
+    parser.add_argument('target', metavar='TARGET')
+    parser.add_argument(
+        '-r', '--recursive', action='store_true',
+        help='convert directory tree (SOURCE, TARGET are directories)'
+    )
+    parser.add_argument(
+        '-t', '--to', dest='target_format', choices=FORMATS,
+        help='format of target files (recursive mode)'
+    )
+    parser.add_argument(
+        '-j', '--jobs', type=int, default=None,
+        help='number of worker processes (recursive mode)'
+    )
+    parser.add_argument(
+        '-v', '--verbose', action='store_true', help='verbose output'
+    )
+    args = parser.parse_args(argv)
+    if args.recursive:
+        if args.target_format is None:
+            parser.error('recursive mode requires -t/--to FORMAT')
+        results = convert_tree(
+            args.source, args.target, args.target_format, args.jobs,
+            args.verbose
+        )
+    else:
+        results = OrderedDict([
+            (source, (result, error)) for source, result, error in
+            convert_files([(args.source, args.target)], args.verbose)
+        ])
+    status = 0
+    for source, (result, error) in results.items():
+        if not result:
+            status = 1
+            sys.stderr.write('{0}: not converted{1}\n'.format(
+                source, ' ({0})'.format(error) if error else ''
+            ))
+        elif args.verbose:
+            sys.stdout.write('{0}: {1}\n'.format(source, {
+                BaseWriteConfig.STATUS_WRITTEN: 'written',
+                BaseWriteConfig.STATUS_SKIPPED: 'unchanged'
+            }[result]))
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
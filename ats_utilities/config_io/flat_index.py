@@ -0,0 +1,213 @@
+# -*- coding: UTF-8 -*-
+
+'''
+ Module
+     flat_index.py
+ Copyright
+     Copyright (C) 2017 Vladimir Roncevic <elektron.ronca@gmail.com>
+     ats_utilities is free software: you can redistribute it and/or modify it
+     under the terms of the GNU General Public License as published by the
+     Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+     ats_utilities is distributed in the hope that it will be useful, but
+     WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+     See the GNU General Public License for more details.
+     You should have received a copy of the GNU General Public License along
+     with this program. If not, see <http://www.gnu.org/licenses/>.
+ Info
+     Defined class FlatIndex with attribute(s) and method(s).
+     Created API for flattened key index of layered configuration.
+'''
+
+import sys
+
+try:
+    from ats_utilities.final import ATSFinal
+    from ats_utilities.exceptions.ats_key_error import ATSKeyError
+except ImportError as ats_error_message:
+    MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
+    sys.exit(MESSAGE)  # Force close python ATS ##############################
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = 'Copyright 2017, https://vroncevic.github.io/ats_utilities'
+__credits__ = ['Vladimir Roncevic']
+__license__ = 'https://github.com/vroncevic/ats_utilities/blob/dev/LICENSE'
+__version__ = '1.8.8'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+
+class FlatIndex:
+    '''
+        Defined class FlatIndex with attribute(s) and method(s).
+        Created API for flattened key index of layered configuration.
+        Layer is flattened to leaves (dotted key: value) and nodes (key
+        of subtree: keys of leaves), index maps key of leaf to value and
+        name of layer which sets it.
+        It defines:
+
+            :attributes:
+                | __metaclass__ - setting class FlatIndex as final.
+            :methods:
+                | flatten - flatten mapping to leaves and nodes.
+                | replace - replace layer, recompute affected keys.
+                | resolve - resolve key through layers (top down).
+                | lookup - value for key (leaf or merged subtree).
+                | subtree - merged subtree for node key.
+    '''
+
+    __metaclass__ = ATSFinal
+
+    @staticmethod
+    def flatten(mapping, separator):
+        '''
+            Flatten mapping to leaves and nodes (subtree keys).
+
+            :param mapping: configuration mapping.
+            :type mapping: <dict>
+            :param separator: separator of flattened keys.
+            :type separator: <str>
+            :return: leaves (key: value), nodes (key: keys of leaves).
+            :rtype: <tuple>
+            :exceptions: None
+        '''
+        leaves, nodes = {}, {}
+        stack = [(None, mapping)]
+        while stack:
+            prefix, subtree = stack.pop()
+            for key, value in subtree.items():
+                if prefix is not None:
+                    key = '{0}{1}{2}'.format(prefix, separator, key)
+                else:
+                    key = str(key)
+                if isinstance(value, dict) and value:
+                    stack.append((key, value))
+                    continue
+                leaves[key] = value
+                node = key.rpartition(separator)[0]
+                while node:
+                    nodes.setdefault(node, []).append(key)
+                    node = node.rpartition(separator)[0]
+        return leaves, nodes
+
+    @staticmethod
+    def replace(layers, index, name, source, mapping, separator):
+        '''
+            Replace (add) layer, recompute affected keys (lock is held).
+            Affected are old and new keys of layer and leaves of other
+            layers below scalar keys of layer (shadowed subtrees).
+
+            :param layers: layer name to (source, leaves, nodes).
+            :type layers: <OrderedDict>
+            :param index: flattened key to (value, layer name).
+            :type index: <dict>
+            :param name: name of layer.
+            :type name: <str>
+            :param source: configuration file path | mapping.
+            :type source: <str> | <dict>
+            :param mapping: configuration mapping.
+            :type mapping: <dict>
+            :param separator: separator of flattened keys.
+            :type separator: <str>
+            :exceptions: None
+        '''
+        _, old_leaves, old_nodes = layers.get(name, (source, {}, {}))
+        leaves, nodes = FlatIndex.flatten(mapping, separator)
+        layers[name] = (source, leaves, nodes)
+        affected = set(old_leaves) | set(leaves) | set(old_nodes) | set(nodes)
+        for key in set(old_leaves) | set(leaves):
+            for _, _, layer_nodes in layers.values():
+                affected.update(layer_nodes.get(key, ()))
+        top_down = list(layers.items())[::-1]
+        for key in affected:
+            resolved = FlatIndex.resolve(key, top_down, separator)
+            if resolved is None:
+                index.pop(key, None)
+            else:
+                index[key] = resolved
+
+    @staticmethod
+    def resolve(key, layers, separator):
+        '''
+            Resolve key through layers (highest priority first).
+
+            :param key: flattened key.
+            :type key: <str>
+            :param layers: (name, (source, leaves, nodes)) top down.
+            :type layers: <list>
+            :param separator: separator of flattened keys.
+            :type separator: <str>
+            :return: (value, layer name) | None (not leaf).
+            :rtype: <tuple> | <NoneType>
+            :exceptions: None
+        '''
+        prefixes, node = [], key.rpartition(separator)[0]
+        while node:
+            prefixes.append(node)
+            node = node.rpartition(separator)[0]
+        for name, (_, leaves, nodes) in layers:
+            if key in leaves:
+                return leaves[key], name
+            if key in nodes:
+                return None
+            for prefix in prefixes:
+                if prefix in leaves:
+                    return None
+        return None
+
+    @staticmethod
+    def lookup(layers, index, key, separator):
+        '''
+            Value for key, leaf is one lookup in flattened index,
+            node key returns merged subtree (nested dicts).
+
+            :param layers: layer name to (source, leaves, nodes).
+            :type layers: <OrderedDict>
+            :param index: flattened key to (value, layer name).
+            :type index: <dict>
+            :param key: flattened key.
+            :type key: <str>
+            :param separator: separator of flattened keys.
+            :type separator: <str>
+            :return: value for key.
+            :rtype: <Python object(s)>
+            :exceptions: ATSKeyError
+        '''
+        leaf = index.get(key)
+        if leaf is not None:
+            return leaf[0]
+        leaves = set()
+        for _, _, nodes in layers.values():
+            leaves.update(nodes.get(key, ()))
+        leaves = [leaf_key for leaf_key in leaves if leaf_key in index]
+        if not leaves:
+            raise ATSKeyError('{0} [{1}]'.format('not found key', key))
+        return FlatIndex.subtree(index, key, leaves, separator)
+
+    @staticmethod
+    def subtree(index, key, leaves, separator):
+        '''
+            Merged subtree (nested dicts) for node key.
+
+            :param index: flattened key to (value, layer name).
+            :type index: <dict>
+            :param key: node key | None (whole configuration).
+            :type key: <str> | <NoneType>
+            :param leaves: flattened keys of leaves in subtree.
+            :type leaves: <list>
+            :param separator: separator of flattened keys.
+            :type separator: <str>
+            :return: merged subtree.
+            :rtype: <dict>
+            :exceptions: None
+        '''
+        subtree, start = {}, 0 if key is None else len(key) + 1
+        for leaf_key in sorted(leaves):
+            path = leaf_key[start:].split(separator)
+            node = subtree
+            for part in path[:-1]:
+                node = node.setdefault(part, {})
+            node[path[-1]] = index[leaf_key][0]
+        return subtree
@@ -21,16 +21,16 @@
 '''
 
 import sys
+from functools import partial
 from configparser import ConfigParser
 
 try:
     from ats_utilities import VerboseRoot
-    from ats_utilities.checker import ATSChecker
+    from ats_utilities.checker import checked
     from ats_utilities.config_io import ConfigFile
     from ats_utilities.console_io.verbose import verbose_message
     from ats_utilities.config_io.base_read import BaseReadConfig
-    from ats_utilities.exceptions.ats_type_error import ATSTypeError
-    from ats_utilities.exceptions.ats_bad_call_error import ATSBadCallError
+    from ats_utilities.config_io.ini.ini_mapping import parse_ini
 except ImportError as ats_error_message:
     MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
     sys.exit(MESSAGE)  # Force close python ATS ##############################
@@ -58,12 +58,16 @@ class Ini2Object(BaseReadConfig):
             :methods:
                 | __init__ - initial constructor.
                 | read_configuration - read configuration from file.
+                | read_mapping - read configuration as plain dicts.
+                | __parse_configuration - parse configuration from file.
+                | __parse_mapping - parse configuration to plain dicts.
                 | __str__ - dunder method for object Ini2Object.
     '''
 
     __metaclass__ = VerboseRoot
     __FORMAT = 'ini'
 
+    @checked('str:configuration_file')
     def __init__(self, configuration_file, verbose=False):
         '''
             Initial constructor.
@@ -74,14 +78,6 @@ class Ini2Object(BaseReadConfig):
             :type verbose: <bool>
             :exceptions: ATSTypeError | ATSBadCallError
         '''
-        checker, error, status = ATSChecker(), None, False
-        error, status = checker.check_params([
-            ('str:configuration_file', configuration_file)
-        ])
-        if status == ATSChecker.TYPE_ERROR:
-            raise ATSTypeError(error)
-        if status == ATSChecker.VALUE_ERROR:
-            raise ATSBadCallError(error)
         BaseReadConfig.__init__(self, verbose=verbose)
         self.__verbose = verbose
         self.file_path = configuration_file
@@ -96,14 +92,88 @@ class Ini2Object(BaseReadConfig):
             :return: configuration object | None.
             :rtype: <ConfigParser> | <NoneType>
         '''
+        content = self.read_cached(self.__parse_configuration)
+        verbose_message(
+            Ini2Object.VERBOSE, self.__verbose or verbose, content
+        )
+        return content
+
+    def read_mapping(self, interpolation=True, frozen=False, verbose=False):
+        '''
+            Getting a configuration from an ini file as plain dicts.
+            Fast read-mostly mode without ConfigParser objects, values of
+            DEFAULT section are merged into sections and interpolation is
+            resolved once at load. Frozen mode returns read-only views of
+            parsed mapping (Python 2.7 has no read-only views, copies are
+            returned), otherwise with enabled cache (shared mapping)
+            sections are copied, so changes of result stay local.
+
+            :param interpolation: resolve basic interpolation | raw values.
+            :type interpolation: <bool>
+            :param frozen: return read-only mapping.
+            :type frozen: <bool>
+            :param verbose: enable/disable verbose option.
+            :type verbose: <bool>
+            :return: configuration sections {section: {option: value}}.
+            :rtype: <dict> | <mappingproxy> | <NoneType>
+            :exceptions: ATSValueError
+        '''
+        content = self.read_cached(
+            partial(self.__parse_mapping, interpolation),
+            ('mapping', interpolation)
+        )
+        view = None
+        if content is not None and frozen:
+            try:
+                from types import MappingProxyType as view
+            except ImportError:
+                view = None
+        if view is not None:
+            content = view(dict(
+                (section, view(options))
+                for section, options in content.items()
+            ))
+        elif content is not None and (
+            frozen or BaseReadConfig.CACHE.is_enabled()
+        ):
+            content = dict(
+                (section, dict(options))
+                for section, options in content.items()
+            )
+        verbose_message(
+            Ini2Object.VERBOSE, self.__verbose or verbose, content
+        )
+        return content
+
+    def __parse_configuration(self):
+        '''
+            Parse a configuration from an ini file.
+
+            :return: configuration object | None.
+            :rtype: <ConfigParser> | <NoneType>
+            :exceptions: None
+        '''
         content = None
         with ConfigFile(self.file_path, 'r', Ini2Object.__FORMAT) as ini:
             if bool(ini):
                 content = ConfigParser()
                 content.read_file(ini)
-        verbose_message(
-            Ini2Object.VERBOSE, self.__verbose or verbose, content
-        )
+        return content
+
+    def __parse_mapping(self, interpolation):
+        '''
+            Parse a configuration from an ini file to plain dicts.
+
+            :param interpolation: resolve basic interpolation | raw values.
+            :type interpolation: <bool>
+            :return: configuration sections | None.
+            :rtype: <dict> | <NoneType>
+            :exceptions: ATSValueError
+        '''
+        content = None
+        with ConfigFile(self.file_path, 'r', Ini2Object.__FORMAT) as ini:
+            if bool(ini):
+                content = parse_ini(ini, interpolation=interpolation)
         return content
 
     def __str__(self):
@@ -0,0 +1,200 @@
+# -*- coding: UTF-8 -*-
+
+'''
+ Module
+     ini_mapping.py
+ Copyright
+     Copyright (C) 2017 Vladimir Roncevic <elektron.ronca@gmail.com>
+     ats_utilities is free software: you can redistribute it and/or modify it
+     under the terms of the GNU General Public License as published by the
+     Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+     ats_utilities is distributed in the hope that it will be useful, but
+     WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+     See the GNU General Public License for more details.
+     You should have received a copy of the GNU General Public License along
+     with this program. If not, see <http://www.gnu.org/licenses/>.
+ Info
+     Defined parser API for reading ini content into plain dicts.
+     Syntax follows ConfigParser defaults (comment prefixes, delimiters,
+     multiline values, DEFAULT section, lower case options, strict mode),
+     basic interpolation is resolved once at load (or disabled).
+'''
+
+import sys
+from re import compile as re_compile
+
+try:
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+except ImportError as ats_error_message:
+    MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
+    sys.exit(MESSAGE)  # Force close python ATS ##############################
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = 'Copyright 2017, https://vroncevic.github.io/ats_utilities'
+__credits__ = ['Vladimir Roncevic']
+__license__ = 'https://github.com/vroncevic/ats_utilities/blob/dev/LICENSE'
+__version__ = '1.8.8'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+DEFAULT_SECTION = 'DEFAULT'
+COMMENT_PREFIXES = ('#', ';')
+MAX_INTERPOLATION_DEPTH = 10
+SECTION = re_compile(r'\[(?P<header>.+)\]')
+REFERENCE = re_compile(r'%\(([^)]+)\)s')
+
+
+def parse_sections(lines):
+    '''
+        Parse ini lines to raw options of DEFAULT section and sections.
+
+        :param lines: lines of ini content (file object or list).
+        :type lines: <file> | <list>
+        :return: options of DEFAULT section, options of sections.
+        :rtype: <tuple>
+        :exceptions: ATSValueError
+    '''
+    defaults, sections, added, multiline = {}, {}, set(), []
+    section, section_name, option, indent_level = None, None, None, 0
+    for line_number, line in enumerate(lines, start=1):
+        value = line.strip()
+        if not value or value.startswith(COMMENT_PREFIXES):
+            if not value and section is not None and option:
+                section[option] += '\n'
+                multiline.append((section, option))
+            continue
+        indent = len(line) - len(line.lstrip())
+        if section is not None and option and indent > indent_level:
+            section[option] += '\n' + value
+            multiline.append((section, option))
+            continue
+        indent_level = indent
+        match = SECTION.match(value) if value[0] == '[' else None
+        if match:
+            section_name, option = match.group('header'), None
+            if section_name == DEFAULT_SECTION:
+                section = defaults
+            elif section_name in sections:
+                raise ATSValueError('{0} [{1}] line {2}'.format(
+                    'duplicate section', section_name, line_number
+                ))
+            else:
+                section = sections[section_name] = {}
+            continue
+        if section is None:
+            raise ATSValueError('{0} line {1}'.format(
+                'missing section header', line_number
+            ))
+        delimiter = value.find('=')
+        colon = value.find(':', 0, delimiter) if delimiter >= 0 else (
+            value.find(':')
+        )
+        if colon >= 0:
+            delimiter = colon
+        if delimiter <= 0:
+            raise ATSValueError('{0} line {1} {2!r}'.format(
+                'not valid option', line_number, value
+            ))
+        option = value[:delimiter].rstrip().lower()
+        if (section_name, option) in added:
+            raise ATSValueError('{0} [{1}.{2}] line {3}'.format(
+                'duplicate option', section_name, option, line_number
+            ))
+        added.add((section_name, option))
+        section[option] = value[delimiter + 1:].lstrip()
+    for section, option in multiline:
+        section[option] = section[option].rstrip()
+    return defaults, sections
+
+
+def interpolate(section_name, option, value, options, depth=1):
+    '''
+        Resolve basic interpolation (%(name)s, %%) of value.
+
+        :param section_name: name of section.
+        :type section_name: <str>
+        :param option: name of option.
+        :type option: <str>
+        :param value: raw value of option.
+        :type value: <str>
+        :param options: raw options visible in section (with defaults).
+        :type options: <dict>
+        :param depth: depth of interpolation.
+        :type depth: <int>
+        :return: interpolated value.
+        :rtype: <str>
+        :exceptions: ATSValueError
+    '''
+    if depth > MAX_INTERPOLATION_DEPTH:
+        raise ATSValueError('{0} [{1}.{2}]'.format(
+            'interpolation depth exceeded', section_name, option
+        ))
+    parts, position = [], 0
+    while True:
+        index = value.find('%', position)
+        if index < 0:
+            parts.append(value[position:])
+            return ''.join(parts)
+        parts.append(value[position:index])
+        marker = value[index + 1:index + 2]
+        if marker == '%':
+            parts.append('%')
+            position = index + 2
+            continue
+        match = REFERENCE.match(value, index) if marker == '(' else None
+        if match is None:
+            raise ATSValueError('{0} [{1}.{2}] {3!r}'.format(
+                'bad interpolation syntax', section_name, option, value
+            ))
+        reference = match.group(1).lower()
+        if reference not in options:
+            raise ATSValueError('{0} {1} [{2}.{3}]'.format(
+                'missing interpolation option', reference, section_name,
+                option
+            ))
+        referenced = options[reference]
+        if '%' in referenced:
+            referenced = interpolate(
+                section_name, option, referenced, options, depth + 1
+            )
+        parts.append(referenced)
+        position = match.end()
+
+
+def parse_ini(lines, interpolation=True):
+    '''
+        Parse ini lines to plain dicts {section: {option: value}}.
+        Options of DEFAULT section are visible in every section (as in
+        ConfigParser), DEFAULT section is first key of mapping.
+
+        :param lines: lines of ini content (file object or list).
+        :type lines: <file> | <list>
+        :param interpolation: resolve basic interpolation | raw values.
+        :type interpolation: <bool>
+        :return: configuration sections.
+        :rtype: <dict>
+        :exceptions: ATSValueError
+    '''
+    defaults, sections = parse_sections(lines)
+    mapping = {DEFAULT_SECTION: defaults}
+    for section_name, options in sections.items():
+        for option, value in defaults.items():
+            options.setdefault(option, value)
+        mapping[section_name] = options
+    if not interpolation:
+        return mapping
+    for section_name, options in mapping.items():
+        resolved = None
+        for option, value in options.items():
+            if '%' in value:
+                if resolved is None:
+                    resolved = dict(options)
+                resolved[option] = interpolate(
+                    section_name, option, value, options
+                )
+        if resolved is not None:
+            mapping[section_name] = resolved
+    return mapping
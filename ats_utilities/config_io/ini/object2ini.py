@@ -21,15 +21,13 @@
 '''
 
 import sys
+from io import StringIO
 
 try:
     from ats_utilities import VerboseRoot
-    from ats_utilities.checker import ATSChecker
-    from ats_utilities.config_io import ConfigFile
+    from ats_utilities.checker import checked
     from ats_utilities.console_io.verbose import verbose_message
     from ats_utilities.config_io.base_write import BaseWriteConfig
-    from ats_utilities.exceptions.ats_type_error import ATSTypeError
-    from ats_utilities.exceptions.ats_bad_call_error import ATSBadCallError
 except ImportError as ats_error_message:
     MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
     sys.exit(MESSAGE)  # Force close python ATS ##############################
@@ -63,6 +61,7 @@ class Object2Ini(BaseWriteConfig):
     __metaclass__ = VerboseRoot
     __FORMAT = 'ini'
 
+    @checked('str:configuration_file')
     def __init__(self, configuration_file, verbose=False):
         '''
             Initial constructor.
@@ -73,14 +72,6 @@ class Object2Ini(BaseWriteConfig):
             :type verbose: <bool>
             :exceptions: ATSTypeError | ATSBadCallError
         '''
-        checker, error, status = ATSChecker(), None, False
-        error, status = checker.check_params([
-            ('str:configuration_file', configuration_file)
-        ])
-        if status == ATSChecker.TYPE_ERROR:
-            raise ATSTypeError(error)
-        if status == ATSChecker.VALUE_ERROR:
-            raise ATSBadCallError(error)
         BaseWriteConfig.__init__(self, verbose=verbose)
         self.__verbose = verbose
         self.file_path = configuration_file
@@ -94,18 +85,19 @@ class Object2Ini(BaseWriteConfig):
             :type configuration: <Python object(s)> | <NoneType>
             :param verbose: enable/disable verbose option.
             :type verbose: <bool>
-            :return: boolean status, True (success) | False.
-            :rtype: <bool>
+            :return: status, 0 (failed) | 1 (written) | 2 (skipped).
+            :rtype: <int>
             :exception: None
         '''
-        status = False
+        status = BaseWriteConfig.STATUS_FAILED
         verbose_message(Object2Ini.VERBOSE, verbose, configuration)
         if configuration is None or not configuration:
             return status
-        with ConfigFile(self.file_path, 'w', Object2Ini.__FORMAT) as ini:
-            if bool(ini):
-                configuration.write(ini, space_around_delimiters=True)
-                status = True
+        content = StringIO()
+        configuration.write(content, space_around_delimiters=True)
+        status = self.write_atomic(
+            content.getvalue(), Object2Ini.__FORMAT, verbose
+        )
         return status
 
     def __str__(self):
@@ -21,16 +21,15 @@
 '''
 
 import sys
-from json import load
 
 try:
     from ats_utilities import VerboseRoot
-    from ats_utilities.checker import ATSChecker
+    from ats_utilities.checker import checked
     from ats_utilities.config_io import ConfigFile
     from ats_utilities.console_io.verbose import verbose_message
     from ats_utilities.config_io.base_read import BaseReadConfig
-    from ats_utilities.exceptions.ats_type_error import ATSTypeError
-    from ats_utilities.exceptions.ats_bad_call_error import ATSBadCallError
+    from ats_utilities.config_io.json.json_index import JsonIndex
+    from ats_utilities.config_io.json.json_backend import JsonBackend
 except ImportError as ats_error_message:
     MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
     sys.exit(MESSAGE)  # Force close python ATS ##############################
@@ -55,15 +54,19 @@ class Json2Object(BaseReadConfig):
                 | __metaclass__ - setting verbose root for Json2Object.
                 | __FORMAT - format of configuration content.
                 | __verbose - enable/disable verbose option.
+                | __index - offset index of json file | None (not used).
             :methods:
                 | __init__ - initial constructor.
                 | read_configuration - read configuration from file.
+                | get - read value for json pointer (offset index).
+                | __parse_configuration - parse configuration from file.
                 | __str__ - dunder method for object Json2Object.
     '''
 
     __metaclass__ = VerboseRoot
     __FORMAT = 'json'
 
+    @checked('str:configuration_file')
     def __init__(self, configuration_file, verbose=False):
         '''
             Initial constructor.
@@ -74,16 +77,9 @@ class Json2Object(BaseReadConfig):
             :type verbose: <bool>
             :exceptions: ATSTypeError | ATSBadCallError
         '''
-        checker, error, status = ATSChecker(), None, False
-        error, status = checker.check_params([
-            ('str:configuration_file', configuration_file)
-        ])
-        if status == ATSChecker.TYPE_ERROR:
-            raise ATSTypeError(error)
-        if status == ATSChecker.VALUE_ERROR:
-            raise ATSBadCallError(error)
         BaseReadConfig.__init__(self, verbose=verbose)
         self.__verbose = verbose
+        self.__index = None
         self.file_path = configuration_file
         verbose_message(Json2Object.VERBOSE, verbose, configuration_file)
 
@@ -97,15 +93,53 @@ class Json2Object(BaseReadConfig):
             :rtype: <Python object(s)> | <NoneType>
             :exceptions: None
         '''
-        content = None
-        with ConfigFile(self.file_path, 'r', Json2Object.__FORMAT) as json:
-            if bool(json):
-                content = load(json)
+        content = self.read_cached(self.__parse_configuration)
         verbose_message(
             Json2Object.VERBOSE, self.__verbose or verbose, content
         )
         return content
 
+    def get(self, pointer, depth=JsonIndex.DEPTH, verbose=False):
+        '''
+            Read value for json pointer without parsing whole file.
+            Offset index is loaded from sidecar file (built if missing or
+            stale), only indexed subtree with pointer is decoded.
+
+            :param pointer: json pointer ('/servers/0/name').
+            :type pointer: <str>
+            :param depth: depth of indexed values (index of first call).
+            :type depth: <int>
+            :param verbose: enable/disable verbose option.
+            :type verbose: <bool>
+            :return: value for json pointer.
+            :rtype: <Python object(s)>
+            :exceptions: ATSKeyError | ATSValueError | IOError | OSError
+        '''
+        if self.__index is None:
+            self.__index = JsonIndex(self.file_path, depth=depth)
+        value = self.__index.get(pointer)
+        verbose_message(
+            Json2Object.VERBOSE, self.__verbose or verbose, pointer
+        )
+        return value
+
+    def __parse_configuration(self):
+        '''
+            Parse a configuration from a json file.
+
+            :return: configuration object | None.
+            :rtype: <Python object(s)> | <NoneType>
+            :exceptions: None
+        '''
+        content = None
+        mapped = self.is_mapped_read() and JsonBackend.is_buffer_aware()
+        with ConfigFile(
+            self.file_path, 'r', Json2Object.__FORMAT, mapped=mapped
+        ) as json:
+            if bool(json):
+                content = JsonBackend.load(json)
+        return content
+
     def __str__(self):
         '''
             Dunder method for Json2Object.
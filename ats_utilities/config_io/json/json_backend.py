@@ -0,0 +1,275 @@
+# -*- coding: UTF-8 -*-
+
+'''
+ Module
+     json_backend.py
+ Copyright
+     Copyright (C) 2017 Vladimir Roncevic <elektron.ronca@gmail.com>
+     ats_utilities is free software: you can redistribute it and/or modify it
+     under the terms of the GNU General Public License as published by the
+     Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+     ats_utilities is distributed in the hope that it will be useful, but
+     WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+     See the GNU General Public License for more details.
+     You should have received a copy of the GNU General Public License along
+     with this program. If not, see <http://www.gnu.org/licenses/>.
+ Info
+     Defined class JsonBackend with attribute(s) and method(s).
+     Created API for pluggable json encoder/decoder (registry).
+'''
+
+import sys
+from mmap import mmap
+from json import loads, dumps
+from collections import OrderedDict
+
+try:
+    from ats_utilities.final import ATSFinal
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+except ImportError as ats_error_message:
+    MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
+    sys.exit(MESSAGE)  # Force close python ATS ##############################
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = 'Copyright 2017, https://vroncevic.github.io/ats_utilities'
+__credits__ = ['Vladimir Roncevic']
+__license__ = 'https://github.com/vroncevic/ats_utilities/blob/dev/LICENSE'
+__version__ = '1.8.8'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+
+class JsonBackend:
+    '''
+        Defined class JsonBackend with attribute(s) and method(s).
+        Created API for pluggable json encoder/decoder (registry).
+        Fastest installed backend is selected at import time, explicit
+        backend is set by select or by environment variable.
+        Content with integers out of 64-bit range and content rejected by
+        fast decoder (NaN, Infinity, lone surrogates) is decoded by json
+        module, so result is same as with json module.
+        Fast encoder is selected automatically only when output decodes to
+        same objects as output of json module (exact encoder).
+        It defines:
+
+            :attributes:
+                | __metaclass__ - setting class JsonBackend as final.
+                | STDLIB - name of json module backend.
+                | ORJSON - name of orjson backend.
+                | UJSON - name of ujson backend.
+                | SIMDJSON - name of simdjson backend (decoder only).
+                | PREFERENCE - backends in order of preference.
+                | BACKEND_ENV - environment variable for explicit backend.
+                | CHUNK_SIZE - size of chunk for scanning content.
+                | __DIGITS - translation table (digit to '0').
+                | __WIDE - marker of integer out of 64-bit range.
+                | __backends - registered backends.
+                | __decoder - name of active decoder.
+                | __encoder - name of active encoder.
+            :methods:
+                | register - register json backend.
+                | available - names of registered backends.
+                | select - select backend (explicit or automatic).
+                | active - names of active decoder and encoder.
+                | is_buffer_aware - active decoder accepts memory map.
+                | loads - decode json content.
+                | load - decode json content from file object | memory map.
+                | dumps - encode object to json content.
+                | __is_wide - content has integer out of 64-bit range.
+    '''
+
+    __metaclass__ = ATSFinal
+    STDLIB, ORJSON, UJSON, SIMDJSON = 'json', 'orjson', 'ujson', 'simdjson'
+    PREFERENCE = [ORJSON, SIMDJSON, UJSON, STDLIB]
+    BACKEND_ENV = 'ATS_JSON_BACKEND'
+    CHUNK_SIZE = 1024 * 1024
+    __DIGITS = bytes(bytearray(
+        48 if 48 <= code <= 57 else code for code in range(256)
+    ))
+    __WIDE = b'0' * 19
+    __backends = OrderedDict()
+    __decoder = STDLIB
+    __encoder = STDLIB
+
+    @staticmethod
+    def register(name, decoder, encoder=None, exact=False, buffer=False):
+        '''
+            Register json backend.
+
+            :param name: name of backend.
+            :type name: <str>
+            :param decoder: decodes str | bytes content.
+            :type decoder: <function>
+            :param encoder: encodes object to str | bytes | None.
+            :type encoder: <function> | <NoneType>
+            :param exact: encoder output decodes same as json module output.
+            :type exact: <bool>
+            :param buffer: decoder accepts memoryview (zero-copy).
+            :type buffer: <bool>
+            :exceptions: None
+        '''
+        JsonBackend.__backends[name] = (decoder, encoder, exact, buffer)
+
+    @staticmethod
+    def available():
+        '''
+            Names of registered backends.
+
+            :return: names of registered backends.
+            :rtype: <list>
+            :exceptions: None
+        '''
+        return list(JsonBackend.__backends)
+
+    @staticmethod
+    def select(name=None):
+        '''
+            Select backend (explicit or automatic).
+            Backend without encoder encodes with json module.
+
+            :param name: name of backend | None (fastest installed).
+            :type name: <str> | <NoneType>
+            :exceptions: ATSValueError
+        '''
+        backends = JsonBackend.__backends
+        if name is None:
+            preferred = [
+                backend for backend in JsonBackend.PREFERENCE
+                if backend in backends
+            ]
+            JsonBackend.__decoder = preferred[0]
+            JsonBackend.__encoder = [
+                backend for backend in preferred
+                if backends[backend][1] is not None and backends[backend][2]
+            ][0]
+            return
+        if name not in backends:
+            raise ATSValueError(
+                '{0} [{1}]'.format('not supported json backend', name)
+            )
+        JsonBackend.__decoder = name
+        if backends[name][1] is not None:
+            JsonBackend.__encoder = name
+        else:
+            JsonBackend.__encoder = JsonBackend.STDLIB
+
+    @staticmethod
+    def active():
+        '''
+            Names of active decoder and encoder.
+
+            :return: (decoder name, encoder name).
+            :rtype: <tuple>
+            :exceptions: None
+        '''
+        return JsonBackend.__decoder, JsonBackend.__encoder
+
+    @staticmethod
+    def is_buffer_aware():
+        '''
+            Checking does active decoder accept memory map (zero-copy).
+
+            :return: boolean status, True (buffer aware decoder) | False.
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        return JsonBackend.__backends[JsonBackend.__decoder][3]
+
+    @staticmethod
+    def loads(content):
+        '''
+            Decode json content.
+
+            :param content: json content.
+            :type content: <str> | <bytes> | <memoryview>
+            :return: configuration object.
+            :rtype: <Python object(s)>
+            :exceptions: ValueError
+        '''
+        if JsonBackend.__decoder != JsonBackend.STDLIB:
+            if not JsonBackend.__is_wide(content):
+                decoder = JsonBackend.__backends[JsonBackend.__decoder][0]
+                try:
+                    return decoder(content)
+                except (ValueError, TypeError, OverflowError):
+                    pass
+        if isinstance(content, memoryview):
+            content = content.tobytes()
+        return loads(content)
+
+    @staticmethod
+    def load(json_file):
+        '''
+            Decode json content from file object | memory map.
+            Memory map is passed to buffer aware decoder without copy,
+            other decoders read whole content (copy of memory map).
+
+            :param json_file: opened json file | memory map of json file.
+            :type json_file: <file> | <mmap>
+            :return: configuration object.
+            :rtype: <Python object(s)>
+            :exceptions: ValueError
+        '''
+        if JsonBackend.is_buffer_aware() and isinstance(json_file, mmap):
+            view = memoryview(json_file)
+            try:
+                return JsonBackend.loads(view)
+            finally:
+                view.release()
+        return JsonBackend.loads(json_file.read())
+
+    @staticmethod
+    def dumps(configuration):
+        '''
+            Encode object to json content.
+
+            :param configuration: configuration object.
+            :type configuration: <Python object(s)>
+            :return: json content.
+            :rtype: <str>
+            :exceptions: TypeError | ValueError
+        '''
+        if JsonBackend.__encoder != JsonBackend.STDLIB:
+            encoder = JsonBackend.__backends[JsonBackend.__encoder][1]
+            try:
+                content = encoder(configuration)
+                if isinstance(content, bytes):
+                    content = content.decode('utf-8')
+                return content
+            except (ValueError, TypeError, OverflowError):
+                pass
+        return dumps(configuration)
+
+    @staticmethod
+    def __is_wide(content):
+        '''
+            Content has integer out of 64-bit range (19 digits or more).
+            Content is scanned in chunks (translate and find), chunks are
+            overlapped so digit run on border of chunks is not missed.
+
+            :param content: json content.
+            :type content: <str> | <bytes> | <memoryview>
+            :return: boolean status, True (wide integer) | False.
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        if isinstance(content, type(u'')):
+            content = content.encode('utf-8')
+        view, size = memoryview(content), JsonBackend.CHUNK_SIZE
+        overlap = len(JsonBackend.__WIDE) - 1
+        for start in range(0, len(view), size):
+            chunk = view[start:start + size + overlap].tobytes()
+            if JsonBackend.__WIDE in chunk.translate(JsonBackend.__DIGITS):
+                return True
+        return False
+
+
+# json backends register to class JsonBackend, import after class definition
+try:
+    from ats_utilities.config_io.json import json_codecs
+except ImportError as ats_error_message:
+    MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
+    sys.exit(MESSAGE)  # Force close python ATS ##############################
@@ -0,0 +1,75 @@
+# -*- coding: UTF-8 -*-
+
+'''
+ Module
+     json_codecs.py
+ Copyright
+     Copyright (C) 2017 Vladimir Roncevic <elektron.ronca@gmail.com>
+     ats_utilities is free software: you can redistribute it and/or modify it
+     under the terms of the GNU General Public License as published by the
+     Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+     ats_utilities is distributed in the hope that it will be useful, but
+     WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+     See the GNU General Public License for more details.
+     You should have received a copy of the GNU General Public License along
+     with this program. If not, see <http://www.gnu.org/licenses/>.
+ Info
+     Registered installed json backends (json, orjson, simdjson, ujson).
+     Selected fastest installed backend or backend from environment.
+'''
+
+import sys
+from os import environ
+from json import loads, dumps
+
+try:
+    from ats_utilities.config_io.json.json_backend import JsonBackend
+except ImportError as ats_error_message:
+    MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
+    sys.exit(MESSAGE)  # Force close python ATS ##############################
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = 'Copyright 2017, https://vroncevic.github.io/ats_utilities'
+__credits__ = ['Vladimir Roncevic']
+__license__ = 'https://github.com/vroncevic/ats_utilities/blob/dev/LICENSE'
+__version__ = '1.8.8'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+JsonBackend.register(JsonBackend.STDLIB, loads, dumps, exact=True)
+if orjson is not None:
+    JsonBackend.register(
+        JsonBackend.ORJSON, orjson.loads, lambda configuration: orjson.dumps(
+            configuration, option=orjson.OPT_NON_STR_KEYS
+        ), buffer=True
+    )
+if simdjson is not None:
+    JsonBackend.register(JsonBackend.SIMDJSON, simdjson.loads)
+if ujson is not None:
+    JsonBackend.register(
+        JsonBackend.UJSON, ujson.loads, lambda configuration: ujson.dumps(
+            configuration, ensure_ascii=True, escape_forward_slashes=False
+        ), exact=True
+    )
+if environ.get(JsonBackend.BACKEND_ENV) in JsonBackend.available():
+    JsonBackend.select(environ.get(JsonBackend.BACKEND_ENV))
+else:
+    JsonBackend.select()
@@ -0,0 +1,286 @@
+# -*- coding: UTF-8 -*-
+
+'''
+ Module
+     json_index.py
+ Copyright
+     Copyright (C) 2017 Vladimir Roncevic <elektron.ronca@gmail.com>
+     ats_utilities is free software: you can redistribute it and/or modify it
+     under the terms of the GNU General Public License as published by the
+     Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+     ats_utilities is distributed in the hope that it will be useful, but
+     WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+     See the GNU General Public License for more details.
+     You should have received a copy of the GNU General Public License along
+     with this program. If not, see <http://www.gnu.org/licenses/>.
+ Info
+     Defined class JsonIndex with attribute(s) and method(s).
+     Created API for random access into json file (offset index).
+'''
+
+import sys
+from mmap import mmap, ACCESS_READ
+
+try:
+    from ats_utilities.final import ATSFinal
+    from ats_utilities.config_io.config_cache import ConfigCache
+    from ats_utilities.config_io.atomic_write import AtomicWrite
+    from ats_utilities.config_io.json.json_scan import JsonScan
+    from ats_utilities.config_io.json.json_backend import JsonBackend
+    from ats_utilities.exceptions.ats_key_error import ATSKeyError
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+except ImportError as ats_error_message:
+    MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
+    sys.exit(MESSAGE)  # Force close python ATS ##############################
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = 'Copyright 2017, https://vroncevic.github.io/ats_utilities'
+__credits__ = ['Vladimir Roncevic']
+__license__ = 'https://github.com/vroncevic/ats_utilities/blob/dev/LICENSE'
+__version__ = '1.8.8'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+
+class JsonIndex:
+    '''
+        Defined class JsonIndex with attribute(s) and method(s).
+        Created API for random access into json file (offset index).
+        Index maps json pointers (RFC 6901) of values up to depth (1 is
+        top-level keys and array elements) to byte offsets in file, it is
+        stored in sidecar file with stat signature of json file. Value is
+        read by decoding only indexed subtree (memory map) and walking
+        rest of pointer, stale sidecar is rebuilt.
+        It defines:
+
+            :attributes:
+                | __metaclass__ - setting class JsonIndex as final.
+                | EXTENSION - extension of sidecar file.
+                | FORMAT_VERSION - version of sidecar format.
+                | DEPTH - default depth of indexed values.
+                | __file_path - json file path.
+                | __index_path - sidecar file path.
+                | __depth - depth of indexed values.
+                | __entries - json pointer to (start, end) byte offsets.
+                | __signature - stat signature of indexed json file.
+            :methods:
+                | __init__ - initial constructor.
+                | split - split json pointer to reference tokens.
+                | build - build index and write sidecar file.
+                | load - load index from sidecar file (if not stale).
+                | pointers - indexed json pointers.
+                | get - value for json pointer.
+                | __lookup - walk reference tokens in decoded value.
+                | __str__ - dunder method for JsonIndex.
+    '''
+
+    __metaclass__ = ATSFinal
+    EXTENSION = '.idx'
+    FORMAT_VERSION = 1
+    DEPTH = 1
+
+    def __init__(self, file_path, depth=DEPTH, index_path=None):
+        '''
+            Initial constructor.
+
+            :param file_path: json file path.
+            :type file_path: <str>
+            :param depth: depth of indexed values.
+            :type depth: <int>
+            :param index_path: sidecar file path | None (next to json).
+            :type index_path: <str> | <NoneType>
+            :exceptions: None
+        '''
+        self.__file_path = file_path
+        self.__index_path = index_path or '{0}{1}'.format(
+            file_path, JsonIndex.EXTENSION
+        )
+        self.__depth = depth
+        self.__entries = None
+        self.__signature = None
+
+    @staticmethod
+    def split(pointer):
+        '''
+            Split json pointer to reference tokens.
+
+            :param pointer: json pointer ('' | '/a/0/b').
+            :type pointer: <str>
+            :return: reference tokens.
+            :rtype: <list>
+            :exceptions: ATSValueError
+        '''
+        if pointer == '':
+            return []
+        if not pointer.startswith('/'):
+            raise ATSValueError(
+                '{0} [{1}]'.format('not valid json pointer', pointer)
+            )
+        return [
+            token.replace('~1', '/').replace('~0', '~')
+            for token in pointer[1:].split('/')
+        ]
+
+    def build(self):
+        '''
+            Build index and write sidecar file (temporary file, replace).
+            Sidecar is not written if directory is not writable.
+
+            :return: number of indexed values.
+            :rtype: <int>
+            :exceptions: IOError | OSError | ATSValueError
+        '''
+        signature = ConfigCache.signature(self.__file_path)
+        with open(self.__file_path, 'rb') as json_file:
+            try:
+                content = mmap(json_file.fileno(), 0, access=ACCESS_READ)
+            except ValueError:
+                content = b''
+            try:
+                entries = JsonScan.scan(content, self.__depth)
+            finally:
+                if not isinstance(content, bytes):
+                    content.close()
+        self.__entries, self.__signature = entries, signature
+        pointers = list(entries)
+        sidecar = JsonBackend.dumps({
+            'version': JsonIndex.FORMAT_VERSION, 'depth': self.__depth,
+            'signature': list(signature), 'pointers': pointers,
+            'offsets': [
+                offset for pointer in pointers for offset in entries[pointer]
+            ]
+        })
+        try:
+            AtomicWrite.write(
+                self.__index_path, sidecar, fsync_file=False,
+                skip_unchanged=False
+            )
+        except (IOError, OSError):
+            pass
+        return len(entries)
+
+    def load(self):
+        '''
+            Load index from sidecar file (if not stale).
+
+            :return: boolean status, True (index loaded) | False.
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        signature = ConfigCache.signature(self.__file_path)
+        try:
+            with open(self.__index_path, 'rb') as index_file:
+                sidecar = JsonBackend.loads(index_file.read())
+            if all([
+                sidecar['version'] == JsonIndex.FORMAT_VERSION,
+                sidecar['depth'] == self.__depth,
+                tuple(sidecar['signature']) == signature
+            ]):
+                self.__signature = signature
+                offsets = sidecar['offsets']
+                self.__entries = dict(zip(
+                    sidecar['pointers'], zip(offsets[0::2], offsets[1::2])
+                ))
+                return True
+        except (IOError, OSError, ValueError, KeyError, TypeError):
+            pass
+        return False
+
+    def pointers(self):
+        '''
+            Indexed json pointers (index is loaded or built if needed).
+
+            :return: sorted json pointers.
+            :rtype: <list>
+            :exceptions: IOError | OSError | ATSValueError
+        '''
+        if self.__signature != ConfigCache.signature(self.__file_path):
+            if not self.load():
+                self.build()
+        return sorted(self.__entries)
+
+    def get(self, pointer):
+        '''
+            Value for json pointer, only longest indexed prefix of pointer
+            is decoded (memory map, zero-copy view for buffer decoders).
+            Whole document is decoded only for pointer '', pointer with
+            first token out of index is not found without decoding.
+
+            :param pointer: json pointer ('' is whole document).
+            :type pointer: <str>
+            :return: value for json pointer.
+            :rtype: <Python object(s)>
+            :exceptions: ATSKeyError | ATSValueError | IOError | OSError
+        '''
+        tokens = JsonIndex.split(pointer)
+        if self.__signature != ConfigCache.signature(self.__file_path):
+            if not self.load():
+                self.build()
+        depth, offsets = len(tokens), None
+        while depth > 0 and offsets is None:
+            offsets = self.__entries.get('/{0}'.format('/'.join([
+                JsonScan.escape(token) for token in tokens[:depth]
+            ])))
+            if offsets is None:
+                depth -= 1
+        if offsets is None and tokens and self.__depth > 0:
+            raise ATSKeyError(
+                '{0} [{1}]'.format('not found json pointer', pointer)
+            )
+        with open(self.__file_path, 'rb') as json_file:
+            if offsets is None:
+                value = JsonBackend.loads(json_file.read())
+            else:
+                content = mmap(json_file.fileno(), 0, access=ACCESS_READ)
+                try:
+                    view = memoryview(content)[offsets[0]:offsets[1]]
+                    try:
+                        value = JsonBackend.loads(view)
+                    finally:
+                        view.release()
+                finally:
+                    content.close()
+        return JsonIndex.__lookup(value, tokens[depth:], pointer)
+
+    @staticmethod
+    def __lookup(value, tokens, pointer):
+        '''
+            Walk reference tokens in decoded value.
+
+            :param value: decoded json value.
+            :type value: <Python object(s)>
+            :param tokens: rest of reference tokens.
+            :type tokens: <list>
+            :param pointer: json pointer (error message).
+            :type pointer: <str>
+            :return: value for reference tokens.
+            :rtype: <Python object(s)>
+            :exceptions: ATSKeyError
+        '''
+        for token in tokens:
+            try:
+                if isinstance(value, list):
+                    value = value[int(token)]
+                else:
+                    value = value[token]
+            except (KeyError, IndexError, ValueError, TypeError):
+                raise ATSKeyError(
+                    '{0} [{1}]'.format('not found json pointer', pointer)
+                )
+        return value
+
+    def __str__(self):
+        '''
+            Dunder method for JsonIndex.
+
+            :return: object in a human-readable format.
+            :rtype: <str>
+            :exceptions: None
+        '''
+        return '{0} ({1}, {2}, {3})'.format(
+            self.__class__.__name__, self.__file_path, self.__index_path,
+            str(self.__depth)
+        )
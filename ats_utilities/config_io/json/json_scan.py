@@ -0,0 +1,173 @@
+# -*- coding: UTF-8 -*-
+
+'''
+ Module
+     json_scan.py
+ Copyright
+     Copyright (C) 2017 Vladimir Roncevic <elektron.ronca@gmail.com>
+     ats_utilities is free software: you can redistribute it and/or modify it
+     under the terms of the GNU General Public License as published by the
+     Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+     ats_utilities is distributed in the hope that it will be useful, but
+     WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+     See the GNU General Public License for more details.
+     You should have received a copy of the GNU General Public License along
+     with this program. If not, see <http://www.gnu.org/licenses/>.
+ Info
+     Defined class JsonScan with attribute(s) and method(s).
+     Created API for scanning json content for offsets of values.
+'''
+
+import sys
+import re
+from json import loads
+
+try:
+    from ats_utilities.final import ATSFinal
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+except ImportError as ats_error_message:
+    MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
+    sys.exit(MESSAGE)  # Force close python ATS ##############################
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = 'Copyright 2017, https://vroncevic.github.io/ats_utilities'
+__credits__ = ['Vladimir Roncevic']
+__license__ = 'https://github.com/vroncevic/ats_utilities/blob/dev/LICENSE'
+__version__ = '1.8.8'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+
+class JsonScan:
+    '''
+        Defined class JsonScan with attribute(s) and method(s).
+        Created API for scanning json content for offsets of values.
+        Values up to depth are located by structural characters and
+        strings only (no decoding), deeper containers are skipped
+        bracket by bracket.
+        It defines:
+
+            :attributes:
+                | __metaclass__ - setting class JsonScan as final.
+                | __STRING - pattern of json string.
+                | __TOKEN - string | structural character (indexed level).
+                | __NESTING - content up to next bracket (skipped level).
+                | __VALUE - non-whitespace character (non-empty array).
+            :methods:
+                | escape - escape reference token of json pointer.
+                | scan - scan json content for offsets of values.
+                | __skip - skip container below depth.
+    '''
+
+    __metaclass__ = ATSFinal
+    __STRING = br'"[^"\\]*(?:\\.[^"\\]*)*"'
+    __TOKEN = re.compile(__STRING + br'|["\[\]{},:]', re.DOTALL)
+    __NESTING = re.compile(
+        br'[^"\[\]{}]*(?:' + __STRING + br'[^"\[\]{}]*)*[\[\]{}]', re.DOTALL
+    )
+    __VALUE = re.compile(br'\S')
+
+    @staticmethod
+    def escape(token):
+        '''
+            Escape reference token of json pointer ('~' and '/').
+
+            :param token: reference token.
+            :type token: <str>
+            :return: escaped reference token.
+            :rtype: <str>
+            :exceptions: None
+        '''
+        return token.replace('~', '~0').replace('/', '~1')
+
+    @staticmethod
+    def scan(content, depth):
+        '''
+            Scan json content for offsets of values up to depth.
+            Containers below depth are skipped bracket by bracket.
+
+            :param content: json content.
+            :type content: <mmap> | <bytes>
+            :param depth: depth of indexed values.
+            :type depth: <int>
+            :return: json pointer to (start, end) byte offsets.
+            :rtype: <dict>
+            :exceptions: ATSValueError
+        '''
+        entries, frames, position = {}, [], 0
+        while True:
+            match = JsonScan.__TOKEN.search(content, position)
+            if match is None:
+                break
+            position = match.end()
+            char = content[position - 1:position]
+            frame = frames[-1] if frames else None
+            if char == b'"':
+                if position - match.start() == 1:
+                    raise ATSValueError('not terminated json string')
+                if frame is not None and frame[4]:
+                    frame[2] = loads(match.group().decode('utf-8'))
+            elif char in b'{[' and len(frames) >= depth:
+                position = JsonScan.__skip(content, position)
+            elif char in b'{[':
+                pointer = ''
+                if frame is not None:
+                    pointer = '{0}/{1}'.format(
+                        frame[1], JsonScan.escape(str(frame[2]))
+                    )
+                frames.append([
+                    char, pointer, 0 if char == b'[' else None, position,
+                    char == b'{'
+                ])
+            elif char == b':':
+                frame[3], frame[4] = position, False
+            elif char == b',':
+                entries['{0}/{1}'.format(
+                    frame[1], JsonScan.escape(str(frame[2]))
+                )] = (frame[3], match.start())
+                if frame[0] == b'[':
+                    frame[2], frame[3] = frame[2] + 1, position
+                else:
+                    frame[2], frame[4] = None, True
+            elif frame is not None:
+                frames.pop()
+                if any([
+                    frame[0] == b'{' and frame[2] is not None,
+                    frame[0] == b'[' and JsonScan.__VALUE.search(
+                        content, frame[3], match.start()
+                    ) is not None
+                ]):
+                    entries['{0}/{1}'.format(
+                        frame[1], JsonScan.escape(str(frame[2]))
+                    )] = (frame[3], match.start())
+        if frames:
+            raise ATSValueError('not complete json content')
+        return entries
+
+    @staticmethod
+    def __skip(content, position):
+        '''
+            Skip container (opening bracket is consumed).
+
+            :param content: json content.
+            :type content: <mmap> | <bytes>
+            :param position: position after opening bracket.
+            :type position: <int>
+            :return: position after closing bracket.
+            :rtype: <int>
+            :exceptions: ATSValueError
+        '''
+        nesting, match_nesting = 1, JsonScan.__NESTING.match
+        while nesting:
+            match = match_nesting(content, position)
+            if match is None:
+                raise ATSValueError('not complete json content')
+            position = match.end()
+            if content[position - 1:position] in b'{[':
+                nesting += 1
+            else:
+                nesting -= 1
+        return position
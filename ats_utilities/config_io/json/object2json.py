@@ -21,16 +21,13 @@
 '''
 
 import sys
-from json import dump
 
 try:
     from ats_utilities import VerboseRoot
-    from ats_utilities.checker import ATSChecker
-    from ats_utilities.config_io import ConfigFile
+    from ats_utilities.checker import checked
     from ats_utilities.console_io.verbose import verbose_message
     from ats_utilities.config_io.base_write import BaseWriteConfig
-    from ats_utilities.exceptions.ats_type_error import ATSTypeError
-    from ats_utilities.exceptions.ats_bad_call_error import ATSBadCallError
+    from ats_utilities.config_io.json.json_backend import JsonBackend
 except ImportError as ats_error_message:
     MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
     sys.exit(MESSAGE)  # Force close python ATS ##############################
@@ -64,6 +61,7 @@ class Object2Json(BaseWriteConfig):
     __metaclass__ = VerboseRoot
     __FORMAT = 'json'
 
+    @checked('str:configuration_file')
     def __init__(self, configuration_file, verbose=False):
         '''
             Initial constructor.
@@ -74,14 +72,6 @@ class Object2Json(BaseWriteConfig):
             :type verbose: <bool>
             :exceptions: ATSTypeError | ATSBadCallError
         '''
-        checker, error, status = ATSChecker(), None, False
-        error, status = checker.check_params([
-            ('str:configuration_file', configuration_file)
-        ])
-        if status == ATSChecker.TYPE_ERROR:
-            raise ATSTypeError(error)
-        if status == ATSChecker.VALUE_ERROR:
-            raise ATSBadCallError(error)
         BaseWriteConfig.__init__(self, verbose=verbose)
         self.__verbose = verbose
         self.file_path = configuration_file
@@ -95,18 +85,16 @@ class Object2Json(BaseWriteConfig):
             :type verbose: <bool>
             :param configuration: configuration object.
             :type: <Python object(s)>
-            :return: boolean status, True (success) | False.
-            :rtype: <bool>
+            :return: status, 0 (failed) | 1 (written) | 2 (skipped).
+            :rtype: <int>
             :exception: None
         '''
-        status = False
+        status = BaseWriteConfig.STATUS_FAILED
         verbose_message(Object2Json.VERBOSE, verbose, configuration)
         if configuration is None:
             return status
-        with ConfigFile(self.file_path, 'w', Object2Json.__FORMAT) as json:
-            if bool(json):
-                dump(configuration, json)
-                status = True
+        content = JsonBackend.dumps(configuration)
+        status = self.write_atomic(content, Object2Json.__FORMAT, verbose)
         return status
 
     def __str__(self):
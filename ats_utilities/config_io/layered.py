@@ -0,0 +1,287 @@
+# -*- coding: UTF-8 -*-
+
+'''
+ Module
+     layered.py
+ Copyright
+     Copyright (C) 2017 Vladimir Roncevic <elektron.ronca@gmail.com>
+     ats_utilities is free software: you can redistribute it and/or modify it
+     under the terms of the GNU General Public License as published by the
+     Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+     ats_utilities is distributed in the hope that it will be useful, but
+     WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+     See the GNU General Public License for more details.
+     You should have received a copy of the GNU General Public License along
+     with this program. If not, see <http://www.gnu.org/licenses/>.
+ Info
+     Defined class LayeredConfig with attribute(s) and method(s).
+     Created API for layered configuration with flattened key index.
+'''
+
+import sys
+from threading import Lock
+from collections import OrderedDict
+
+try:
+    from ats_utilities.final import ATSFinal
+    from ats_utilities.config_io.config_pairs import load_mapping
+    from ats_utilities.config_io.flat_index import FlatIndex
+    from ats_utilities.exceptions.ats_key_error import ATSKeyError
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+except ImportError as ats_error_message:
+    MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
+    sys.exit(MESSAGE)  # Force close python ATS ##############################
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = 'Copyright 2017, https://vroncevic.github.io/ats_utilities'
+__credits__ = ['Vladimir Roncevic']
+__license__ = 'https://github.com/vroncevic/ats_utilities/blob/dev/LICENSE'
+__version__ = '1.8.8'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+
+class LayeredConfig:
+    '''
+        Defined class LayeredConfig with attribute(s) and method(s).
+        Created API for layered configuration with flattened key index.
+        Layers (configuration files of any supported format or mappings)
+        are deep merged, later layer has higher priority, dict is merged
+        key by key, other values replace lower values (and subtrees).
+        Merged leaves are kept in flattened index (FlatIndex, dotted keys),
+        so leaf lookup is one dict lookup. Reload of one layer recomputes only
+        keys of that layer (old and new) and keys shadowed by them.
+        It defines:
+
+            :attributes:
+                | __metaclass__ - setting class LayeredConfig as final.
+                | SEPARATOR - default separator of flattened keys.
+                | __separator - separator of flattened keys.
+                | __verbose - enable/disable verbose option.
+                | __lock - lock for updates of layers and index.
+                | __layers - layer name to (source, leaves, nodes).
+                | __index - flattened key to (value, layer name).
+            :methods:
+                | __init__ - initial constructor.
+                | add_layer - add layer with highest priority.
+                | update_layer - replace mapping of layer.
+                | reload - reload layer(s) from configuration file(s).
+                | layers - names of layers (lowest priority first).
+                | source_of - name of layer which sets value for key.
+                | get - value for key or default value.
+                | keys - flattened keys of leaves.
+                | as_dict - merged configuration (nested dicts).
+                | __getitem__ - value for key (leaf or subtree).
+                | __contains__ - checking is key leaf or subtree.
+                | __len__ - number of leaves.
+                | __str__ - dunder method for LayeredConfig.
+    '''
+
+    __metaclass__ = ATSFinal
+    SEPARATOR = '.'
+
+    def __init__(self, sources=None, separator=SEPARATOR, verbose=False):
+        '''
+            Initial constructor.
+
+            :param sources: configuration files | mappings (low first).
+            :type sources: <list> | <NoneType>
+            :param separator: separator of flattened keys.
+            :type separator: <str>
+            :param verbose: enable/disable verbose option.
+            :type verbose: <bool>
+            :exceptions: ATSValueError
+        '''
+        self.__separator = separator
+        self.__verbose = verbose
+        self.__lock = Lock()
+        self.__layers = OrderedDict()
+        self.__index = {}
+        for source in sources or []:
+            self.add_layer(source)
+
+    def add_layer(self, source, name=None):
+        '''
+            Add layer with highest priority.
+
+            :param source: configuration file path | mapping.
+            :type source: <str> | <dict>
+            :param name: name of layer | None (file path, layer<N>).
+            :type name: <str> | <NoneType>
+            :return: name of layer.
+            :rtype: <str>
+            :exceptions: ATSValueError
+        '''
+        if name is None:
+            name = source if isinstance(source, str) else 'layer{0}'.format(
+                len(self.__layers)
+            )
+        if name in self.__layers:
+            raise ATSValueError('{0} [{1}]'.format('layer exists', name))
+        mapping = load_mapping(source, self.__verbose)
+        with self.__lock:
+            FlatIndex.replace(
+                self.__layers, self.__index, name, source, mapping,
+                self.__separator
+            )
+        return name
+
+    def update_layer(self, name, mapping):
+        '''
+            Replace mapping of layer (recompute affected keys only).
+
+            :param name: name of layer.
+            :type name: <str>
+            :param mapping: new configuration of layer.
+            :type mapping: <dict>
+            :exceptions: ATSKeyError
+        '''
+        if name not in self.__layers:
+            raise ATSKeyError('{0} [{1}]'.format('not found layer', name))
+        with self.__lock:
+            FlatIndex.replace(
+                self.__layers, self.__index, name, self.__layers[name][0],
+                mapping, self.__separator
+            )
+
+    def reload(self, name=None):
+        '''
+            Reload layer(s) from configuration file(s).
+            Usable as callback of ConfigWatcher for layer file.
+
+            :param name: name of layer | None (all file layers).
+            :type name: <str> | <NoneType>
+            :exceptions: ATSKeyError | ATSValueError
+        '''
+        names = list(self.__layers) if name is None else [name]
+        for layer_name in names:
+            if layer_name not in self.__layers:
+                raise ATSKeyError(
+                    '{0} [{1}]'.format('not found layer', layer_name)
+                )
+            source = self.__layers[layer_name][0]
+            if isinstance(source, str):
+                self.update_layer(
+                    layer_name, load_mapping(source, self.__verbose)
+                )
+
+    def layers(self):
+        '''
+            Names of layers (lowest priority first).
+
+            :return: names of layers.
+            :rtype: <list>
+            :exceptions: None
+        '''
+        return list(self.__layers)
+
+    def source_of(self, key):
+        '''
+            Name of layer which sets value for key.
+
+            :param key: flattened key.
+            :type key: <str>
+            :return: name of layer.
+            :rtype: <str>
+            :exceptions: ATSKeyError
+        '''
+        try:
+            return self.__index[key][1]
+        except KeyError:
+            raise ATSKeyError('{0} [{1}]'.format('not found key', key))
+
+    def get(self, key, default=None):
+        '''
+            Value for key (leaf or subtree) or default value.
+
+            :param key: flattened key.
+            :type key: <str>
+            :param default: default value.
+            :type default: <Python object(s)>
+            :return: value for key | default value.
+            :rtype: <Python object(s)>
+            :exceptions: None
+        '''
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):
+        '''
+            Flattened keys of leaves.
+
+            :return: sorted flattened keys.
+            :rtype: <list>
+            :exceptions: None
+        '''
+        return sorted(self.__index)
+
+    def as_dict(self):
+        '''
+            Merged configuration (nested dicts).
+
+            :return: merged configuration.
+            :rtype: <dict>
+            :exceptions: None
+        '''
+        return FlatIndex.subtree(
+            self.__index, None, list(self.__index), self.__separator
+        )
+
+    def __getitem__(self, key):
+        '''
+            Value for key, leaf is one lookup in flattened index,
+            node key returns merged subtree (nested dicts).
+
+            :param key: flattened key.
+            :type key: <str>
+            :return: value for key.
+            :rtype: <Python object(s)>
+            :exceptions: ATSKeyError
+        '''
+        return FlatIndex.lookup(
+            self.__layers, self.__index, key, self.__separator
+        )
+
+    def __contains__(self, key):
+        '''
+            Checking is key leaf or subtree.
+
+            :param key: flattened key.
+            :type key: <str>
+            :return: boolean status, True (key exists) | False.
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def __len__(self):
+        '''
+            Number of leaves.
+
+            :return: number of leaves.
+            :rtype: <int>
+            :exceptions: None
+        '''
+        return len(self.__index)
+
+    def __str__(self):
+        '''
+            Dunder method for LayeredConfig.
+
+            :return: object in a human-readable format.
+            :rtype: <str>
+            :exceptions: None
+        '''
+        return '{0} ({1}, {2}, {3})'.format(
+            self.__class__.__name__, str(self.layers()),
+            str(len(self.__index)), self.__separator
+        )
@@ -0,0 +1,240 @@
+# -*- coding: UTF-8 -*-
+
+'''
+ Module
+     path_cache.py
+ Copyright
+     Copyright (C) 2017 Vladimir Roncevic <elektron.ronca@gmail.com>
+     ats_utilities is free software: you can redistribute it and/or modify it
+     under the terms of the GNU General Public License as published by the
+     Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+     ats_utilities is distributed in the hope that it will be useful, but
+     WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+     See the GNU General Public License for more details.
+     You should have received a copy of the GNU General Public License along
+     with this program. If not, see <http://www.gnu.org/licenses/>.
+ Info
+     Defined class PathMetadataCache with attribute(s) and method(s).
+     Created API for caching path metadata (stat, extension) with TTL.
+'''
+
+import sys
+from os import stat
+from stat import S_ISREG
+from os.path import splitext
+from threading import Lock
+from collections import OrderedDict
+
+try:
+    from ats_utilities.final import ATSFinal
+except ImportError as ats_error_message:
+    MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
+    sys.exit(MESSAGE)  # Force close python ATS ##############################
+
+try:
+    from time import monotonic
+except ImportError:
+    from time import time as monotonic
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = 'Copyright 2017, https://vroncevic.github.io/ats_utilities'
+__credits__ = ['Vladimir Roncevic']
+__license__ = 'https://github.com/vroncevic/ats_utilities/blob/dev/LICENSE'
+__version__ = '1.8.8'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+
+class PathMetadataCache:
+    '''
+        Defined class PathMetadataCache with attribute(s) and method(s).
+        Created API for caching path metadata (stat, extension) with TTL.
+        Entry holds stat result and parsed file extension of existing
+        path (missing path is not cached), entry expires after TTL seconds
+        (TTL 0 disables cache), least recently used entry is evicted.
+        It defines:
+
+            :attributes:
+                | __metaclass__ - setting class PathMetadataCache as final.
+                | TTL - default time to live of entry (seconds).
+                | MAX_ENTRIES - default max number of entries.
+                | __lock - lock for entries.
+                | __entries - cached entries by path in LRU order.
+                | __ttl - time to live of entry (seconds).
+                | __max_entries - max number of entries.
+                | __hits - number of cache hits.
+                | __misses - number of cache misses.
+            :methods:
+                | __init__ - initial constructor.
+                | configure - setup TTL and max number of entries.
+                | lookup - metadata of path (stat result, extension).
+                | stat - stat result of path.
+                | is_file - path is regular file.
+                | extension - file extension of path.
+                | invalidate - remove entry for path (or all entries).
+                | statistics - cache statistics.
+                | __len__ - number of cached entries.
+                | __str__ - dunder method for PathMetadataCache.
+    '''
+
+    __metaclass__ = ATSFinal
+    TTL = 1.0
+    MAX_ENTRIES = 1024
+
+    def __init__(self, ttl=TTL, max_entries=MAX_ENTRIES):
+        '''
+            Initial constructor.
+
+            :param ttl: time to live of entry (seconds).
+            :type ttl: <float>
+            :param max_entries: max number of entries.
+            :type max_entries: <int>
+            :exceptions: None
+        '''
+        self.__lock = Lock()
+        self.__entries = OrderedDict()
+        self.__ttl = ttl
+        self.__max_entries = max_entries
+        self.__hits = 0
+        self.__misses = 0
+
+    def configure(self, ttl=None, max_entries=None):
+        '''
+            Setup TTL and max number of entries.
+
+            :param ttl: time to live of entry (seconds) | None.
+            :type ttl: <float> | <NoneType>
+            :param max_entries: max number of entries | None.
+            :type max_entries: <int> | <NoneType>
+            :exceptions: None
+        '''
+        with self.__lock:
+            if ttl is not None:
+                self.__ttl = ttl
+            if max_entries is not None:
+                self.__max_entries = max_entries
+        self.invalidate()
+
+    def lookup(self, file_path):
+        '''
+            Metadata of path (stat result, extension).
+
+            :param file_path: file path.
+            :type file_path: <str>
+            :return: (stat result | None, extension without dot).
+            :rtype: <tuple>
+            :exceptions: None
+        '''
+        now = monotonic()
+        with self.__lock:
+            entry = self.__entries.get(file_path)
+            if entry is not None and entry[0] > now:
+                self.__hits += 1
+                self.__entries.pop(file_path)
+                self.__entries[file_path] = entry
+                return entry[1]
+            self.__misses += 1
+        try:
+            file_stat = stat(file_path)
+        except (IOError, OSError, TypeError, ValueError):
+            file_stat = None
+        metadata = (file_stat, splitext(file_path)[1].replace('.', ''))
+        if file_stat is None or self.__ttl <= 0:
+            return metadata
+        with self.__lock:
+            self.__entries.pop(file_path, None)
+            self.__entries[file_path] = (now + self.__ttl, metadata)
+            while len(self.__entries) > self.__max_entries:
+                self.__entries.popitem(last=False)
+        return metadata
+
+    def stat(self, file_path):
+        '''
+            Stat result of path.
+
+            :param file_path: file path.
+            :type file_path: <str>
+            :return: stat result | None (missing path).
+            :rtype: <os.stat_result> | <NoneType>
+            :exceptions: None
+        '''
+        return self.lookup(file_path)[0]
+
+    def is_file(self, file_path):
+        '''
+            Path is regular file.
+
+            :param file_path: file path.
+            :type file_path: <str>
+            :return: boolean status, True (regular file) | False.
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        file_stat = self.lookup(file_path)[0]
+        return file_stat is not None and S_ISREG(file_stat.st_mode)
+
+    def extension(self, file_path):
+        '''
+            File extension of path.
+
+            :param file_path: file path.
+            :type file_path: <str>
+            :return: file extension without dot.
+            :rtype: <str>
+            :exceptions: None
+        '''
+        return self.lookup(file_path)[1]
+
+    def invalidate(self, file_path=None):
+        '''
+            Remove entry for path (or all entries).
+
+            :param file_path: file path | None (all entries).
+            :type file_path: <str> | <NoneType>
+            :exceptions: None
+        '''
+        with self.__lock:
+            if file_path is None:
+                self.__entries.clear()
+            else:
+                self.__entries.pop(file_path, None)
+
+    def statistics(self):
+        '''
+            Cache statistics.
+
+            :return: entries, hits and misses of cache.
+            :rtype: <dict>
+            :exceptions: None
+        '''
+        with self.__lock:
+            return {
+                'entries': len(self.__entries),
+                'hits': self.__hits, 'misses': self.__misses
+            }
+
+    def __len__(self):
+        '''
+            Number of cached entries.
+
+            :return: number of cached entries.
+            :rtype: <int>
+            :exceptions: None
+        '''
+        return len(self.__entries)
+
+    def __str__(self):
+        '''
+            Dunder method for PathMetadataCache.
+
+            :return: object in a human-readable format.
+            :rtype: <str>
+            :exceptions: None
+        '''
+        return '{0} ({1}, {2}, {3})'.format(
+            self.__class__.__name__, str(self.__ttl),
+            str(self.__max_entries), str(self.statistics())
+        )
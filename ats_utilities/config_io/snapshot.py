@@ -0,0 +1,232 @@
+# -*- coding: UTF-8 -*-
+
+'''
+ Module
+     snapshot.py
+ Copyright
+     Copyright (C) 2017 Vladimir Roncevic <elektron.ronca@gmail.com>
+     ats_utilities is free software: you can redistribute it and/or modify it
+     under the terms of the GNU General Public License as published by the
+     Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+     ats_utilities is distributed in the hope that it will be useful, but
+     WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+     See the GNU General Public License for more details.
+     You should have received a copy of the GNU General Public License along
+     with this program. If not, see <http://www.gnu.org/licenses/>.
+ Info
+     Defined class ConfigSnapshot with attribute(s) and method(s).
+     Created API for binary snapshots (.atsc) of parsed configurations.
+'''
+
+import sys
+from os import environ
+from os.path import abspath, join
+from threading import Lock
+
+try:
+    from ats_utilities.final import ATSFinal
+    from ats_utilities.config_io.atomic_write import AtomicWrite
+    from ats_utilities.config_io.snapshot_file import SnapshotFile
+except ImportError as ats_error_message:
+    MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
+    sys.exit(MESSAGE)  # Force close python ATS ##############################
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = 'Copyright 2017, https://vroncevic.github.io/ats_utilities'
+__credits__ = ['Vladimir Roncevic']
+__license__ = 'https://github.com/vroncevic/ats_utilities/blob/dev/LICENSE'
+__version__ = '1.8.8'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+
+class ConfigSnapshot:
+    '''
+        Defined class ConfigSnapshot with attribute(s) and method(s).
+        Created API for binary snapshots (.atsc) of parsed configurations.
+        Snapshot (SnapshotFile) is pickled configuration with digest of
+        parser id and content of source file, so unchanged source is
+        loaded without parsing. Stale or corrupt
+        snapshot is ignored, source is parsed and snapshot is rebuilt.
+        Snapshots are stored next to source files or in cache directory,
+        they are trusted as source files (pickle), directory must not be
+        writable by untrusted users.
+        It defines:
+
+            :attributes:
+                | __metaclass__ - setting class ConfigSnapshot as final.
+                | EXTENSION - extension of snapshot files.
+                | SNAPSHOT_ENV - 'on' (next to source) | cache directory.
+                | __lock - lock for statistics.
+                | __enabled - enable/disable snapshots.
+                | __cache_dir - cache directory | None (next to source).
+                | __hits - number of loaded snapshots.
+                | __misses - number of missing or stale snapshots.
+                | __errors - number of corrupt or not writable snapshots.
+            :methods:
+                | __init__ - initial constructor.
+                | configure - enable/disable snapshots, set cache directory.
+                | is_enabled - checking are snapshots enabled.
+                | path - snapshot file path for source file and parser.
+                | load - load configuration from snapshot or parse source.
+                | statistics - snapshot statistics.
+                | __count - increment statistics counter.
+                | __str__ - dunder method for ConfigSnapshot.
+    '''
+
+    __metaclass__ = ATSFinal
+    EXTENSION = '.atsc'
+    SNAPSHOT_ENV = 'ATS_SNAPSHOT'
+
+    def __init__(self, enabled=False, cache_dir=None):
+        '''
+            Initial constructor.
+            Environment variable ATS_SNAPSHOT enables snapshots, value
+            'on' stores snapshots next to source, other value is cache
+            directory.
+
+            :param enabled: enable/disable snapshots.
+            :type enabled: <bool>
+            :param cache_dir: cache directory | None (next to source).
+            :type cache_dir: <str> | <NoneType>
+            :exceptions: None
+        '''
+        self.__lock = Lock()
+        self.__enabled = enabled
+        self.__cache_dir = cache_dir
+        self.__hits, self.__misses, self.__errors = 0, 0, 0
+        snapshot_env = environ.get(ConfigSnapshot.SNAPSHOT_ENV, '')
+        if snapshot_env and snapshot_env.lower() != 'off':
+            self.__enabled = True
+            if snapshot_env.lower() != 'on':
+                self.__cache_dir = snapshot_env
+
+    def configure(self, enabled=None, cache_dir=None):
+        '''
+            Enable/disable snapshots, set cache directory.
+
+            :param enabled: enable/disable snapshots | None.
+            :type enabled: <bool> | <NoneType>
+            :param cache_dir: cache directory | None (not changed).
+            :type cache_dir: <str> | <NoneType>
+            :exceptions: None
+        '''
+        if enabled is not None:
+            self.__enabled = enabled
+        if cache_dir is not None:
+            self.__cache_dir = cache_dir or None
+
+    def is_enabled(self):
+        '''
+            Checking are snapshots enabled.
+
+            :return: boolean status, True (enabled) | False.
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        return self.__enabled
+
+    def path(self, file_path, parser_id):
+        '''
+            Snapshot file path for source file and parser.
+
+            :param file_path: configuration file path.
+            :type file_path: <str>
+            :param parser_id: id of parser (class, mode, version).
+            :type parser_id: <str>
+            :return: snapshot file path.
+            :rtype: <str>
+            :exceptions: None
+        '''
+        file_path = abspath(file_path)
+        if self.__cache_dir is None:
+            tag = AtomicWrite.new_digest(4, parser_id.encode('utf-8'))
+            return '{0}.{1}{2}'.format(
+                file_path, tag.hexdigest()[:8], ConfigSnapshot.EXTENSION
+            )
+        tag = AtomicWrite.new_digest(16, file_path.encode('utf-8'))
+        tag.update(parser_id.encode('utf-8'))
+        return join(self.__cache_dir, '{0}{1}'.format(
+            tag.hexdigest()[:32], ConfigSnapshot.EXTENSION
+        ))
+
+    def load(self, file_path, parser, parser_id):
+        '''
+            Load configuration from snapshot or parse source file.
+            Source is hashed before parsing, snapshot written for changed
+            source is stale on next load (never used for new content).
+
+            :param file_path: configuration file path.
+            :type file_path: <str>
+            :param parser: callable which parses configuration file.
+            :type parser: <function>
+            :param parser_id: id of parser (class, mode, version).
+            :type parser_id: <str>
+            :return: configuration object | None.
+            :rtype: <Python object(s)> | <NoneType>
+            :exceptions: None
+        '''
+        if not self.__enabled:
+            return parser()
+        digest = SnapshotFile.digest(file_path, parser_id)
+        if digest is None:
+            return parser()
+        snapshot_path = self.path(file_path, parser_id)
+        status, configuration = SnapshotFile.read(snapshot_path, digest)
+        if status == SnapshotFile.VALID:
+            self.__count('hits')
+            return configuration
+        if status == SnapshotFile.CORRUPT:
+            self.__count('errors')
+        self.__count('misses')
+        configuration = parser()
+        if configuration is not None:
+            if not SnapshotFile.write(snapshot_path, digest, configuration):
+                self.__count('errors')
+        return configuration
+
+    def statistics(self):
+        '''
+            Snapshot statistics.
+
+            :return: hits, misses and errors of snapshots.
+            :rtype: <dict>
+            :exceptions: None
+        '''
+        with self.__lock:
+            return {
+                'hits': self.__hits, 'misses': self.__misses,
+                'errors': self.__errors
+            }
+
+    def __count(self, counter):
+        '''
+            Increment statistics counter.
+
+            :param counter: 'hits' | 'misses' | 'errors'.
+            :type counter: <str>
+            :exceptions: None
+        '''
+        with self.__lock:
+            if counter == 'hits':
+                self.__hits += 1
+            elif counter == 'misses':
+                self.__misses += 1
+            else:
+                self.__errors += 1
+
+    def __str__(self):
+        '''
+            Dunder method for ConfigSnapshot.
+
+            :return: object in a human-readable format.
+            :rtype: <str>
+            :exceptions: None
+        '''
+        return '{0} ({1}, {2}, {3})'.format(
+            self.__class__.__name__, str(self.__enabled),
+            self.__cache_dir, str(self.statistics())
+        )
@@ -0,0 +1,112 @@
+# -*- coding: UTF-8 -*-
+
+'''
+ Module
+     snapshot_cli.py
+ Copyright
+     Copyright (C) 2017 Vladimir Roncevic <elektron.ronca@gmail.com>
+     ats_utilities is free software: you can redistribute it and/or modify it
+     under the terms of the GNU General Public License as published by the
+     Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+     ats_utilities is distributed in the hope that it will be useful, but
+     WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+     See the GNU General Public License for more details.
+     You should have received a copy of the GNU General Public License along
+     with this program. If not, see <http://www.gnu.org/licenses/>.
+ Info
+     Defined functions prebuild and main for prebuilding snapshots.
+     Created command line tool for binary snapshots of configurations.
+ Execute
+     ats-snapshot [-d CACHE_DIR] [-v] FILE [FILE ...]
+'''
+
+import sys
+from collections import OrderedDict
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = 'Copyright 2017, https://vroncevic.github.io/ats_utilities'
+__credits__ = ['Vladimir Roncevic']
+__license__ = 'https://github.com/vroncevic/ats_utilities/blob/dev/LICENSE'
+__version__ = '1.8.8'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+
+def prebuild(file_paths, cache_dir=None, verbose=False):
+    '''
+        Prebuild snapshots of configuration files (deploy time).
+
+        :param file_paths: configuration file paths.
+        :type file_paths: <list>
+        :param cache_dir: cache directory | None (next to source).
+        :type cache_dir: <str> | <NoneType>
+        :param verbose: enable/disable verbose option.
+        :type verbose: <bool>
+        :return: status per source file, True (snapshot built) | False.
+        :rtype: <OrderedDict>
+        :exceptions: None
+    '''
+    from ats_utilities.config_io.base_read import BaseReadConfig
+    from ats_utilities.config_io.bulk_read import READERS, file_format
+    snapshots = BaseReadConfig.SNAPSHOTS
+    snapshots.configure(enabled=True, cache_dir=cache_dir)
+    built = OrderedDict()
+    for file_path in file_paths:
+        built[file_path] = False
+        reader = READERS.get(file_format(file_path))
+        if reader is None:
+            continue
+        errors = snapshots.statistics()['errors']
+        BaseReadConfig.CACHE.invalidate(file_path)
+        try:
+            configuration = reader(
+                file_path, verbose=verbose
+            ).read_configuration(verbose=verbose)
+        except Exception:
+            continue
+        built[file_path] = all([
+            configuration is not None,
+            snapshots.statistics()['errors'] == errors
+        ])
+    return built
+
+
+def main(argv=None):
+    '''
+        Command line tool for prebuilding snapshots.
+
+        :param argv: command line arguments | None (sys.argv).
+        :type argv: <list> | <NoneType>
+        :return: exit status, 0 (all snapshots built) | 1.
+        :rtype: <int>
+        :exceptions: None
+    '''
+    from argparse import ArgumentParser
+    parser = ArgumentParser(
+        prog='ats-snapshot',
+        description='prebuild binary snapshots of configuration files'
+    )
+    parser.add_argument('files', nargs='+', metavar='FILE')
+    parser.add_argument(
+        '-d', '--cache-dir', default=None, help='snapshot cache directory'
+    )
+    parser.add_argument(
+        '-v', '--verbose', action='store_true', help='verbose output'
+    )
+    args = parser.parse_args(argv)
+    status = 0
+    built = prebuild(args.files, args.cache_dir, args.verbose)
+    for file_path, status_ok in built.items():
+        if not status_ok:
+            status = 1
+            sys.stderr.write('{0}: not built\n'.format(file_path))
+        elif args.verbose:
+            sys.stdout.write('{0}: built\n'.format(file_path))
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
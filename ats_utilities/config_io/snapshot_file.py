@@ -0,0 +1,209 @@
+# -*- coding: UTF-8 -*-
+
+'''
+ Module
+     snapshot_file.py
+ Copyright
+     Copyright (C) 2017 Vladimir Roncevic <elektron.ronca@gmail.com>
+     ats_utilities is free software: you can redistribute it and/or modify it
+     under the terms of the GNU General Public License as published by the
+     Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+     ats_utilities is distributed in the hope that it will be useful, but
+     WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+     See the GNU General Public License for more details.
+     You should have received a copy of the GNU General Public License along
+     with this program. If not, see <http://www.gnu.org/licenses/>.
+ Info
+     Defined class SnapshotFile with attribute(s) and method(s).
+     Created API for format of binary snapshot files (.atsc).
+'''
+
+import sys
+from os import fdopen, remove
+from os.path import basename, dirname, isdir
+from importlib import import_module
+
+try:
+    from ats_utilities.final import ATSFinal
+    from ats_utilities.config_io.atomic_write import AtomicWrite
+except ImportError as ats_error_message:
+    MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
+    sys.exit(MESSAGE)  # Force close python ATS ##############################
+
+try:
+    from os import replace
+except ImportError:
+    from os import rename as replace
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = 'Copyright 2017, https://vroncevic.github.io/ats_utilities'
+__credits__ = ['Vladimir Roncevic']
+__license__ = 'https://github.com/vroncevic/ats_utilities/blob/dev/LICENSE'
+__version__ = '1.8.8'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+
+class SnapshotFile:
+    '''
+        Defined class SnapshotFile with attribute(s) and method(s).
+        Created API for format of binary snapshot files (.atsc).
+        Snapshot is header (magic, format version, digest of parser id
+        and content of source file) followed by pickled configuration.
+        It defines:
+
+            :attributes:
+                | __metaclass__ - setting class SnapshotFile as final.
+                | MAGIC - magic bytes of snapshot files.
+                | FORMAT_VERSION - version of snapshot format.
+                | CHUNK_SIZE - size of chunk for hashing source file.
+                | VALID - status of valid snapshot.
+                | STALE - status of missing or stale snapshot.
+                | CORRUPT - status of corrupt snapshot.
+                | __HEADER_SIZE - size of snapshot header.
+            :methods:
+                | library_version - version of parser library.
+                | digest - digest of parser id and content of source file.
+                | write - write snapshot of configuration (atomic replace).
+                | read - read snapshot of configuration.
+                | __header - header of snapshot (magic, version, digest).
+    '''
+
+    __metaclass__ = ATSFinal
+    MAGIC = b'ATSC'
+    FORMAT_VERSION = 1
+    CHUNK_SIZE = 1024 * 1024
+    VALID, STALE, CORRUPT = 0, 1, 2
+    __HEADER_SIZE = len(MAGIC) + 1 + 32
+
+    @staticmethod
+    def library_version(module):
+        '''
+            Version of parser library (part of parser id).
+
+            :param module: name of module.
+            :type module: <str>
+            :return: name and version of module ('yaml-6.0').
+            :rtype: <str>
+            :exceptions: None
+        '''
+        try:
+            library = import_module(module)
+        except ImportError:
+            return '{0}-missing'.format(module)
+        return '{0}-{1}'.format(module, getattr(
+            library, '__version__', getattr(library, 'VERSION', None)
+        ))
+
+    @staticmethod
+    def digest(file_path, parser_id):
+        '''
+            Digest of parser id and content of source file.
+
+            :param file_path: configuration file path.
+            :type file_path: <str>
+            :param parser_id: id of parser (class, mode, version).
+            :type parser_id: <str>
+            :return: digest (32 bytes) | None (file is not readable).
+            :rtype: <bytes> | <NoneType>
+            :exceptions: None
+        '''
+        digest = AtomicWrite.new_digest(32, parser_id.encode('utf-8'))
+        try:
+            with open(file_path, 'rb') as source:
+                for chunk in iter(
+                    lambda: source.read(SnapshotFile.CHUNK_SIZE), b''
+                ):
+                    digest.update(chunk)
+        except (IOError, OSError, TypeError):
+            return None
+        return digest.digest()
+
+    @staticmethod
+    def write(snapshot_path, digest, configuration):
+        '''
+            Write snapshot of configuration (temporary file, replace).
+
+            :param snapshot_path: snapshot file path.
+            :type snapshot_path: <str>
+            :param digest: digest of parser id and content of source file.
+            :type digest: <bytes>
+            :param configuration: configuration object.
+            :type configuration: <Python object(s)>
+            :return: boolean status, True (snapshot written) | False.
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        from pickle import dumps, HIGHEST_PROTOCOL
+        from tempfile import mkstemp
+        header = SnapshotFile.__header(digest)
+        try:
+            content = dumps(configuration, HIGHEST_PROTOCOL)
+        except Exception:
+            return False
+        directory, temp_path = dirname(snapshot_path), None
+        try:
+            if not isdir(directory):
+                raise OSError('missing directory {0}'.format(directory))
+            file_descriptor, temp_path = mkstemp(
+                prefix='.{0}.'.format(basename(snapshot_path)),
+                suffix='.tmp', dir=directory
+            )
+            with fdopen(file_descriptor, 'wb') as snapshot:
+                snapshot.write(header)
+                snapshot.write(content)
+            replace(temp_path, snapshot_path)
+            temp_path = None
+        except (IOError, OSError):
+            return False
+        finally:
+            if temp_path is not None:
+                remove(temp_path)
+        return True
+
+    @staticmethod
+    def read(snapshot_path, digest):
+        '''
+            Read snapshot of configuration (valid header, unpickle).
+
+            :param snapshot_path: snapshot file path.
+            :type snapshot_path: <str>
+            :param digest: digest of parser id and content of source file.
+            :type digest: <bytes>
+            :return: status (VALID | STALE | CORRUPT), configuration.
+            :rtype: <int>, <Python object(s)>
+            :exceptions: None
+        '''
+        from pickle import loads
+        try:
+            with open(snapshot_path, 'rb') as snapshot:
+                content = snapshot.read()
+        except (IOError, OSError):
+            return SnapshotFile.STALE, None
+        header = SnapshotFile.__header(digest)
+        if content[:SnapshotFile.__HEADER_SIZE] != header:
+            return SnapshotFile.STALE, None
+        try:
+            return SnapshotFile.VALID, loads(
+                memoryview(content)[SnapshotFile.__HEADER_SIZE:]
+            )
+        except Exception:
+            return SnapshotFile.CORRUPT, None
+
+    @staticmethod
+    def __header(digest):
+        '''
+            Header of snapshot (magic, format version, digest).
+
+            :param digest: digest of parser id and content of source file.
+            :type digest: <bytes>
+            :return: header of snapshot.
+            :rtype: <bytes>
+            :exceptions: None
+        '''
+        return SnapshotFile.MAGIC + bytes(
+            bytearray([SnapshotFile.FORMAT_VERSION])
+        ) + digest
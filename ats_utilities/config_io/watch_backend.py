@@ -0,0 +1,198 @@
+# -*- coding: UTF-8 -*-
+
+'''
+ Module
+     watch_backend.py
+ Copyright
+     Copyright (C) 2017 Vladimir Roncevic <elektron.ronca@gmail.com>
+     ats_utilities is free software: you can redistribute it and/or modify it
+     under the terms of the GNU General Public License as published by the
+     Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+     ats_utilities is distributed in the hope that it will be useful, but
+     WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+     See the GNU General Public License for more details.
+     You should have received a copy of the GNU General Public License along
+     with this program. If not, see <http://www.gnu.org/licenses/>.
+ Info
+     Defined class WatchBackend with attribute(s) and method(s).
+     Created API for watching configuration file (inotify, polling).
+'''
+
+import sys
+from os import read, close
+from select import select
+from os.path import basename
+from struct import calcsize, unpack_from
+
+try:
+    from ats_utilities.final import ATSFinal
+    from ats_utilities.config_io.config_cache import ConfigCache
+except ImportError as ats_error_message:
+    MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
+    sys.exit(MESSAGE)  # Force close python ATS ##############################
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = 'Copyright 2017, https://vroncevic.github.io/ats_utilities'
+__credits__ = ['Vladimir Roncevic']
+__license__ = 'https://github.com/vroncevic/ats_utilities/blob/dev/LICENSE'
+__version__ = '1.8.8'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+
+class WatchBackend:
+    '''
+        Defined class WatchBackend with attribute(s) and method(s).
+        Created API for watching configuration file (inotify, polling).
+        Inotify (Linux, ctypes) watches directory instead of file, so
+        atomic replace of file (rename of temporary file) keeps working.
+        Both loops call check after quiet time (debounce) of changes.
+        It defines:
+
+            :attributes:
+                | __metaclass__ - setting class WatchBackend as final.
+                | BUFFER_SIZE - size of buffer for reading events.
+                | __IN_MASK - inotify events for directory.
+                | __IN_Q_OVERFLOW - inotify event queue overflow.
+                | __IN_FLAGS - inotify flags (non-blocking, close-on-exec).
+                | __IN_EVENT - inotify event structure.
+                | __IN_EVENT_SIZE - size of inotify event structure.
+            :methods:
+                | inotify_open - create inotify watch for directory.
+                | is_relevant - inotify events concern file.
+                | watch_inotify - wait for inotify events (debounced).
+                | watch_polling - poll stat signature (debounced).
+    '''
+
+    __metaclass__ = ATSFinal
+    BUFFER_SIZE = 65536
+    __IN_MASK = 0x2 | 0x4 | 0x8 | 0x40 | 0x80 | 0x100 | 0x200
+    __IN_Q_OVERFLOW = 0x4000
+    __IN_FLAGS = 0o4000 | 0o2000000
+    __IN_EVENT = 'iIII'
+    __IN_EVENT_SIZE = calcsize(__IN_EVENT)
+
+    @staticmethod
+    def inotify_open(directory):
+        '''
+            Create inotify watch for directory.
+
+            :param directory: absolute path of directory.
+            :type directory: <str>
+            :return: inotify file descriptor | None (not available).
+            :rtype: <int> | <NoneType>
+            :exceptions: None
+        '''
+        if not sys.platform.startswith('linux'):
+            return None
+        from ctypes import CDLL
+        from ctypes.util import find_library
+        try:
+            libc = CDLL(find_library('c') or 'libc.so.6', use_errno=True)
+            inotify = libc.inotify_init1(WatchBackend.__IN_FLAGS)
+            if inotify < 0:
+                return None
+            watch = libc.inotify_add_watch(
+                inotify, directory.encode(sys.getfilesystemencoding()),
+                WatchBackend.__IN_MASK
+            )
+        except (AttributeError, OSError):
+            return None
+        if watch < 0:
+            close(inotify)
+            return None
+        return inotify
+
+    @staticmethod
+    def is_relevant(events, file_name):
+        '''
+            Inotify events concern file (or queue overflow).
+
+            :param events: content of inotify events.
+            :type events: <bytes>
+            :param file_name: name of file in watched directory.
+            :type file_name: <str>
+            :return: boolean status, True (relevant events) | False.
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        name = file_name.encode(sys.getfilesystemencoding())
+        offset, size = 0, WatchBackend.__IN_EVENT_SIZE
+        while offset + size <= len(events):
+            _, mask, _, length = unpack_from(
+                WatchBackend.__IN_EVENT, events, offset
+            )
+            event_name = events[offset + size:offset + size + length]
+            offset += size + length
+            if mask & WatchBackend.__IN_Q_OVERFLOW:
+                return True
+            if event_name.rstrip(b'\0') == name:
+                return True
+        return False
+
+    @staticmethod
+    def watch_inotify(inotify, file_path, stop, interval, debounce, check):
+        '''
+            Wait for inotify events, check after quiet time (closes watch).
+
+            :param inotify: inotify file descriptor.
+            :type inotify: <int>
+            :param file_path: configuration file path.
+            :type file_path: <str>
+            :param stop: event for stopping loop.
+            :type stop: <Event>
+            :param interval: timeout of waiting for events (seconds).
+            :type interval: <float>
+            :param debounce: quiet time before check (seconds).
+            :type debounce: <float>
+            :param check: called after relevant changes.
+            :type check: <function>
+            :exceptions: None
+        '''
+        file_name = basename(file_path)
+        try:
+            while not stop.is_set():
+                if not select([inotify], [], [], interval)[0]:
+                    continue
+                if not WatchBackend.is_relevant(
+                    read(inotify, WatchBackend.BUFFER_SIZE), file_name
+                ):
+                    continue
+                while select([inotify], [], [], debounce)[0]:
+                    read(inotify, WatchBackend.BUFFER_SIZE)
+                check()
+        finally:
+            close(inotify)
+
+    @staticmethod
+    def watch_polling(file_path, signature, stop, interval, debounce, check):
+        '''
+            Poll stat signature, check after signature is stable.
+
+            :param file_path: configuration file path.
+            :type file_path: <str>
+            :param signature: returns stat signature of current configuration.
+            :type signature: <function>
+            :param stop: event for stopping loop.
+            :type stop: <Event>
+            :param interval: polling interval (seconds).
+            :type interval: <float>
+            :param debounce: quiet time before check (seconds).
+            :type debounce: <float>
+            :param check: called after changes.
+            :type check: <function>
+            :exceptions: None
+        '''
+        while not stop.wait(interval):
+            latest = ConfigCache.signature(file_path)
+            if latest == signature():
+                continue
+            while not stop.wait(debounce):
+                current = ConfigCache.signature(file_path)
+                if current == latest:
+                    break
+                latest = current
+            check()
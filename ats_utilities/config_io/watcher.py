@@ -0,0 +1,293 @@
+# -*- coding: UTF-8 -*-
+
+'''
+ Module
+     watcher.py
+ Copyright
+     Copyright (C) 2017 Vladimir Roncevic <elektron.ronca@gmail.com>
+     ats_utilities is free software: you can redistribute it and/or modify it
+     under the terms of the GNU General Public License as published by the
+     Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+     ats_utilities is distributed in the hope that it will be useful, but
+     WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+     See the GNU General Public License for more details.
+     You should have received a copy of the GNU General Public License along
+     with this program. If not, see <http://www.gnu.org/licenses/>.
+ Info
+     Defined class ConfigWatcher with attribute(s) and method(s).
+     Created API for change driven reload of configuration (hot reload).
+'''
+
+import sys
+from threading import Event, Lock, Thread
+from os.path import abspath, dirname
+
+try:
+    from ats_utilities import VerboseRoot
+    from ats_utilities.config_io.watch_backend import WatchBackend
+    from ats_utilities.console_io.error import error_message
+    from ats_utilities.console_io.verbose import verbose_message
+    from ats_utilities.config_io.config_cache import ConfigCache
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+except ImportError as ats_error_message:
+    MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
+    sys.exit(MESSAGE)  # Force close python ATS ##############################
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = 'Copyright 2017, https://vroncevic.github.io/ats_utilities'
+__credits__ = ['Vladimir Roncevic']
+__license__ = 'https://github.com/vroncevic/ats_utilities/blob/dev/LICENSE'
+__version__ = '1.8.8'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+
+class ConfigWatcher:
+    '''
+        Defined class ConfigWatcher with attribute(s) and method(s).
+        Created API for change driven reload of configuration (hot reload).
+        Directory of configuration file is watched by inotify on Linux
+        (atomic replace keeps working), stat signature is polled on other
+        platforms. Burst of writes is debounced, configuration is parsed
+        only when stat signature of file is changed, then new
+        configuration is swapped in and registered callbacks are called
+        (from watcher thread). Content which can not be parsed is reported
+        and skipped, watcher keeps current configuration and keeps
+        watching.
+        It defines:
+
+            :attributes:
+                | __metaclass__ - setting verbose root for ConfigWatcher.
+                | AUTO - inotify if available, polling otherwise.
+                | INOTIFY - inotify backend (Linux).
+                | POLLING - polling backend (stat signature).
+                | BACKENDS - supported backends.
+                | DEBOUNCE - default quiet time before reload (seconds).
+                | INTERVAL - default polling interval (seconds).
+                | __verbose - enable/disable verbose option.
+                | __reader - reader of configuration (BaseReadConfig).
+                | __callbacks - callbacks for reloaded configuration.
+                | __debounce - quiet time before reload (seconds).
+                | __interval - polling interval (seconds).
+                | __backend - requested backend.
+                | __active - active backend | None (not started).
+                | __lock - lock for swapping configuration.
+                | __configuration - current configuration.
+                | __signature - stat signature of current configuration.
+                | __stop - event for stopping watcher thread.
+                | __thread - watcher thread | None.
+            :methods:
+                | __init__ - initial constructor.
+                | configuration - property method for current configuration.
+                | backend - property method for active backend.
+                | add_callback - register callback for reloaded configuration.
+                | remove_callback - unregister callback.
+                | start - read configuration and start watcher thread.
+                | stop - stop watcher thread.
+                | check - reload configuration if file is changed.
+                | __str__ - dunder method for ConfigWatcher.
+    '''
+
+    __metaclass__ = VerboseRoot
+    AUTO, INOTIFY, POLLING = 'auto', 'inotify', 'polling'
+    BACKENDS = [AUTO, INOTIFY, POLLING]
+    DEBOUNCE = 0.1
+    INTERVAL = 1.0
+
+    def __init__(
+        self, reader, callback=None, debounce=DEBOUNCE, interval=INTERVAL,
+        backend=AUTO, verbose=False
+    ):
+        '''
+            Initial constructor.
+
+            :param reader: reader of configuration (Cfg2Object, ...).
+            :type reader: <BaseReadConfig>
+            :param callback: called with reloaded configuration | None.
+            :type callback: <function> | <NoneType>
+            :param debounce: quiet time before reload (seconds).
+            :type debounce: <float>
+            :param interval: polling interval (seconds).
+            :type interval: <float>
+            :param backend: 'auto' | 'inotify' | 'polling'.
+            :type backend: <str>
+            :param verbose: enable/disable verbose option.
+            :type verbose: <bool>
+            :exceptions: ATSValueError
+        '''
+        if backend not in ConfigWatcher.BACKENDS:
+            raise ATSValueError(
+                '{0} [{1}]'.format('not supported watcher backend', backend)
+            )
+        self.__verbose = verbose
+        self.__reader = reader
+        self.__callbacks = [] if callback is None else [callback]
+        self.__debounce = debounce
+        self.__interval = interval
+        self.__backend = backend
+        self.__active = None
+        self.__lock = Lock()
+        self.__configuration = None
+        self.__signature = None
+        self.__stop = Event()
+        self.__thread = None
+
+    @property
+    def configuration(self):
+        '''
+            Property method for getting current configuration.
+
+            :return: current configuration | None.
+            :rtype: <Python object(s)> | <NoneType>
+            :exceptions: None
+        '''
+        return self.__configuration
+
+    @property
+    def backend(self):
+        '''
+            Property method for getting active backend.
+
+            :return: 'inotify' | 'polling' | None (not started).
+            :rtype: <str> | <NoneType>
+            :exceptions: None
+        '''
+        return self.__active
+
+    def add_callback(self, callback):
+        '''
+            Register callback for reloaded configuration.
+
+            :param callback: called with reloaded configuration.
+            :type callback: <function>
+            :exceptions: None
+        '''
+        with self.__lock:
+            self.__callbacks = self.__callbacks + [callback]
+
+    def remove_callback(self, callback):
+        '''
+            Unregister callback.
+
+            :param callback: registered callback.
+            :type callback: <function>
+            :exceptions: None
+        '''
+        with self.__lock:
+            self.__callbacks = [
+                registered for registered in self.__callbacks
+                if registered != callback
+            ]
+
+    def start(self, verbose=False):
+        '''
+            Read configuration and start watcher thread.
+
+            :param verbose: enable/disable verbose option.
+            :type verbose: <bool>
+            :return: boolean status, True (started) | False.
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        if self.__thread is not None and self.__thread.is_alive():
+            return True
+        if not self.__reader.file_path:
+            error_message(ConfigWatcher.VERBOSE, 'check file', None)
+            return False
+        self.__signature = ConfigCache.signature(self.__reader.file_path)
+        self.__configuration = self.__reader.read_configuration()
+        inotify = None
+        if self.__backend != ConfigWatcher.POLLING:
+            inotify = WatchBackend.inotify_open(
+                dirname(abspath(self.__reader.file_path))
+            )
+        if inotify is None and self.__backend == ConfigWatcher.INOTIFY:
+            error_message(
+                ConfigWatcher.VERBOSE, 'inotify not available, polling'
+            )
+        file_path = self.__reader.file_path
+        if inotify is None:
+            self.__active = ConfigWatcher.POLLING
+            target = WatchBackend.watch_polling
+            args = (file_path, lambda: self.__signature)
+        else:
+            self.__active = ConfigWatcher.INOTIFY
+            target, args = WatchBackend.watch_inotify, (inotify, file_path)
+        self.__stop.clear()
+        self.__thread = Thread(target=target, args=args + (
+            self.__stop, self.__interval, self.__debounce, self.check
+        ))
+        self.__thread.daemon = True
+        self.__thread.start()
+        verbose_message(
+            ConfigWatcher.VERBOSE, self.__verbose or verbose,
+            'watch', self.__reader.file_path, self.__active
+        )
+        return True
+
+    def stop(self):
+        '''
+            Stop watcher thread.
+
+            :exceptions: None
+        '''
+        self.__stop.set()
+        if self.__thread is not None:
+            self.__thread.join(self.__interval + self.__debounce + 1)
+        self.__thread = None
+
+    def check(self):
+        '''
+            Reload configuration if file is changed (stat signature).
+            Configuration stays unchanged when file can not be parsed
+            (parser error is reported, file is parsed again on change).
+
+            :return: boolean status, True (reloaded) | False.
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        signature = ConfigCache.signature(self.__reader.file_path)
+        if signature is None or signature == self.__signature:
+            return False
+        self.__signature = signature
+        try:
+            configuration = self.__reader.read_configuration()
+        except Exception as parser_error:
+            error_message(
+                ConfigWatcher.VERBOSE, 'reload failed',
+                self.__reader.file_path, parser_error
+            )
+            return False
+        if configuration is None:
+            return False
+        with self.__lock:
+            self.__configuration = configuration
+            callbacks = self.__callbacks
+        verbose_message(
+            ConfigWatcher.VERBOSE, self.__verbose,
+            'reloaded', self.__reader.file_path
+        )
+        for callback in callbacks:
+            try:
+                callback(configuration)
+            except Exception as callback_error:
+                error_message(
+                    ConfigWatcher.VERBOSE, 'callback failed', callback_error
+                )
+        return True
+
+    def __str__(self):
+        '''
+            Dunder method for ConfigWatcher.
+
+            :return: object in a human-readable format.
+            :rtype: <str>
+            :exceptions: None
+        '''
+        return '{0} ({1}, {2}, {3}, {4})'.format(
+            self.__class__.__name__, str(self.__verbose),
+            str(self.__reader), self.__backend, self.__active
+        )
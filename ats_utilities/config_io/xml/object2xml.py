@@ -21,19 +21,23 @@
 '''
 
 import sys
+from re import compile as re_compile
 
 try:
     from ats_utilities import VerboseRoot
-    from ats_utilities.checker import ATSChecker
-    from ats_utilities.config_io import ConfigFile
+    from ats_utilities.checker import checked
     from ats_utilities.console_io.verbose import verbose_message
     from ats_utilities.config_io.base_write import BaseWriteConfig
-    from ats_utilities.exceptions.ats_type_error import ATSTypeError
-    from ats_utilities.exceptions.ats_bad_call_error import ATSBadCallError
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
 except ImportError as ats_error_message:
     MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
     sys.exit(MESSAGE)  # Force close python ATS ##############################
 
+try:
+    from collections.abc import Iterator
+except ImportError:
+    from collections import Iterator
+
 __author__ = 'Vladimir Roncevic'
 __copyright__ = 'Copyright 2017, https://vroncevic.github.io/ats_utilities'
 __credits__ = ['Vladimir Roncevic']
@@ -48,21 +52,47 @@ class Object2Xml(BaseWriteConfig):
     '''
         Defined class Object2Xml with attribute(s) and method(s).
         Created API for writing a configuration/information to a xml file.
+        BeautifulSoup (or any object) is written as formatted string,
+        dicts, lists and generators of (key, value) pairs are serialized
+        by streaming writer in chunks (constant memory), dict is element
+        with children, list (generator) is repeated element, None is
+        empty element. Markup of chunk is built with sentinel characters
+        and text of whole chunk is escaped at once.
         It defines:
 
             :attributes:
                 | __metaclass__ - setting verbose root for Object2Xml.
                 | __FORMAT - format of configuration content.
+                | ROOT - name of root element for wrapped pairs.
+                | CHUNK_SIZE - size of chunk for streaming writer.
+                | INDENT - indentation of one level.
+                | __OPEN - sentinel for '<' in markup of chunk.
+                | __CLOSE - sentinel for '>' in markup of chunk.
+                | __NAME - pattern of valid element name.
+                | __ILLEGAL - pattern of not valid xml characters in text.
                 | __verbose - enable/disable verbose option.
             :methods:
                 | __init__ - initial constructor.
                 | write_configuration - write configuration to a xml file.
+                | iter_chunks - serialize configuration to chunks of xml.
+                | __document - name of document element and pairs.
+                | __markups - markups of element (name is checked).
+                | __flush - escape chunk and restore markup.
                 | __str__ - dunder method for object Object2Xml.
     '''
 
     __metaclass__ = VerboseRoot
     __FORMAT = 'xml'
+    ROOT = 'configuration'
+    CHUNK_SIZE = 64 * 1024
+    INDENT = '    '
+    __OPEN, __CLOSE = '\x01', '\x02'
+    __NAME = re_compile(r'^[A-Za-z_][\w.:-]*$')
+    __ILLEGAL = re_compile(
+        '[\x00\x03-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]'
+    )
 
+    @checked('str:configuration_file')
     def __init__(self, configuration_file, verbose=False):
         '''
             Initial constructor.
@@ -73,41 +103,182 @@ class Object2Xml(BaseWriteConfig):
             :type verbose: <bool>
             :exceptions: ATSTypeError | ATSBadCallError
         '''
-        checker, error, status = ATSChecker(), None, False
-        error, status = checker.check_params([
-            ('str:configuration_file', configuration_file)
-        ])
-        if status == ATSChecker.TYPE_ERROR:
-            raise ATSTypeError(error)
-        if status == ATSChecker.VALUE_ERROR:
-            raise ATSBadCallError(error)
         BaseWriteConfig.__init__(self, verbose=verbose)
         self.__verbose = verbose
         self.file_path = configuration_file
         verbose_message(Object2Xml.VERBOSE, verbose, configuration_file)
 
-    def write_configuration(self, configuration, verbose=False):
+    def write_configuration(self, configuration, verbose=False, root=None):
         '''
             Write configuration to a xml file.
 
             :param configuration: configuration object.
-            :type: <BeautifulSoup>
+            :type: <BeautifulSoup> | <dict> | <list> | <generator>
             :param verbose: enable/disable verbose option.
             :type verbose: <bool>
-            :return: boolean status, True (success) | False.
-            :rtype: <bool>
-            :exception: None
+            :param root: name of root element for pairs | None.
+            :type root: <str> | <NoneType>
+            :return: status, 0 (failed) | 1 (written) | 2 (skipped).
+            :rtype: <int>
+            :exception: ATSValueError
         '''
-        status = False
+        status = BaseWriteConfig.STATUS_FAILED
         verbose_message(Object2Xml.VERBOSE, verbose, configuration)
         if configuration is None:
             return status
-        with ConfigFile(self.file_path, 'w', Object2Xml.__FORMAT) as xml:
-            if bool(xml):
-                xml.write('{0}'.format(configuration))
-                status = True
+        if isinstance(configuration, (dict, list, tuple, Iterator)):
+            content = Object2Xml.iter_chunks(configuration, root)
+        else:
+            content = '{0}'.format(configuration)
+        status = self.write_atomic(content, Object2Xml.__FORMAT, verbose)
         return status
 
+    @staticmethod
+    def iter_chunks(configuration, root=None, chunk_size=CHUNK_SIZE):
+        '''
+            Serialize configuration to chunks of xml (streaming writer).
+            Dict with one dict value is document element, other dicts and
+            pairs are children of root element. Nested generators are
+            consumed lazily. Pairs must be (key, value) tuples, text with
+            characters not allowed in xml (control characters) raises error.
+
+            :param configuration: dict | (key, value) pairs.
+            :type configuration: <dict> | <list> | <generator>
+            :param root: name of root element for pairs | None (ROOT).
+            :type root: <str> | <NoneType>
+            :param chunk_size: size of chunk of xml.
+            :type chunk_size: <int>
+            :return: generator of chunks of xml.
+            :rtype: <generator>
+            :exceptions: ATSValueError
+        '''
+        name, pairs = Object2Xml.__document(configuration, root)
+        yield '<?xml version="1.0" encoding="UTF-8"?>\n'
+        root_markups = Object2Xml.__markups(name, '')
+        parts, markup, size, levels = [root_markups[2]], 1, 0, [{}]
+        stack = [(iter(pairs), None, 1, root_markups)]
+        while stack:
+            entries, key, depth, closing = stack[-1]
+            while len(levels) <= depth:
+                levels.append({})
+            markups = levels[depth]
+            for entry in entries:
+                if key is None:
+                    if entry.__class__ is not tuple or len(entry) != 2:
+                        raise ATSValueError(
+                            '{0} [{1}]'.format('not valid xml pair', entry)
+                        )
+                    tag, value = entry
+                else:
+                    tag, value = key, entry
+                tag_markups = markups.get(tag)
+                if tag_markups is None:
+                    tag_markups = markups[tag] = Object2Xml.__markups(
+                        tag, Object2Xml.INDENT * depth
+                    )
+                if value.__class__ is str:
+                    line = tag_markups[0] + value + tag_markups[1]
+                    markup += 2
+                elif isinstance(value, dict):
+                    parts.append(tag_markups[2])
+                    markup += 1
+                    stack.append((
+                        iter(value.items()), None, depth + 1, tag_markups
+                    ))
+                    break
+                elif isinstance(value, (list, tuple, Iterator)):
+                    stack.append((iter(value), tag, depth, None))
+                    break
+                elif value is None:
+                    line = tag_markups[4]
+                    markup += 1
+                else:
+                    line = tag_markups[0] + str(value) + tag_markups[1]
+                    markup += 2
+                parts.append(line)
+                size += len(line)
+                if size >= chunk_size:
+                    yield Object2Xml.__flush(parts, markup)
+                    parts, markup, size = [], 0, 0
+            else:
+                stack.pop()
+                if closing is not None:
+                    parts.append(closing[3])
+                    markup += 1
+        yield Object2Xml.__flush(parts, markup)
+
+    @staticmethod
+    def __markups(name, indent):
+        '''
+            Markups of element (name is checked), tags are built with
+            sentinels instead of '<', '>'.
+
+            :param name: name of element.
+            :type name: <str>
+            :param indent: indentation of element.
+            :type indent: <str>
+            :return: (leaf start, leaf end, start line, end line, empty).
+            :rtype: <tuple>
+            :exceptions: ATSValueError
+        '''
+        start, end = Object2Xml.__OPEN, Object2Xml.__CLOSE
+        if not isinstance(name, str) or not Object2Xml.__NAME.match(name):
+            raise ATSValueError(
+                '{0} [{1}]'.format('not valid xml element name', name)
+            )
+        return (
+            '{0}{1}{2}{3}'.format(indent, start, name, end),
+            '{0}/{1}{2}\n'.format(start, name, end),
+            '{0}{1}{2}{3}\n'.format(indent, start, name, end),
+            '{0}{1}/{2}{3}\n'.format(indent, start, name, end),
+            '{0}{1}{2}/{3}\n'.format(indent, start, name, end)
+        )
+
+    @staticmethod
+    def __document(configuration, root):
+        '''
+            Name of document element and pairs of its children.
+
+            :param configuration: dict | (key, value) pairs.
+            :type configuration: <dict> | <list> | <generator>
+            :param root: name of root element for pairs | None (ROOT).
+            :type root: <str> | <NoneType>
+            :return: name of document element, (key, value) pairs.
+            :rtype: <tuple>
+            :exceptions: ATSValueError
+        '''
+        if isinstance(configuration, dict):
+            if root is None and len(configuration) == 1:
+                name, value = next(iter(configuration.items()))
+                if isinstance(value, dict):
+                    return name, value.items()
+            configuration = configuration.items()
+        return root or Object2Xml.ROOT, configuration
+
+    @staticmethod
+    def __flush(parts, markup):
+        '''
+            Escape chunk and restore markup (sentinels to '<', '>').
+
+            :param parts: parts of chunk.
+            :type parts: <list>
+            :param markup: number of tags in chunk.
+            :type markup: <int>
+            :return: chunk of xml.
+            :rtype: <str>
+            :exceptions: ATSValueError
+        '''
+        chunk = ''.join(parts)
+        start, end = Object2Xml.__OPEN, Object2Xml.__CLOSE
+        if any([
+            chunk.count(start) != markup, chunk.count(end) != markup,
+            Object2Xml.__ILLEGAL.search(chunk) is not None
+        ]):
+            raise ATSValueError('not valid xml character in text')
+        chunk = chunk.replace('&', '&amp;').replace('<', '&lt;')
+        chunk = chunk.replace('>', '&gt;')
+        return chunk.replace(start, '<').replace(end, '>')
+
     def __str__(self):
         '''
             Dunder method for Object2Xml.
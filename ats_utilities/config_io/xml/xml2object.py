@@ -21,16 +21,15 @@
 '''
 
 import sys
+from functools import partial
 
 try:
-    from bs4 import BeautifulSoup
     from ats_utilities import VerboseRoot
-    from ats_utilities.checker import ATSChecker
+    from ats_utilities.checker import checked
     from ats_utilities.config_io import ConfigFile
     from ats_utilities.console_io.verbose import verbose_message
     from ats_utilities.config_io.base_read import BaseReadConfig
-    from ats_utilities.exceptions.ats_type_error import ATSTypeError
-    from ats_utilities.exceptions.ats_bad_call_error import ATSBadCallError
+    from ats_utilities.config_io.xml.xml_backend import XmlBackend
 except ImportError as ats_error_message:
     MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
     sys.exit(MESSAGE)  # Force close python ATS ##############################
@@ -49,6 +48,11 @@ class Xml2Object(BaseReadConfig):
     '''
         Defined class Xml2Object with attribute(s) and method(s).
         Created API for reading a configuration/information from a xml file.
+        BeautifulSoup tree is compatibility mode (default backend), lxml
+        and ElementTree backends return root element, plain data mode
+        returns dict/list structure without bs4 tree cost.
+        Streaming mode emits elements (ElementTree) as they close and
+        frees them afterwards. Parsers are imported on first use.
         It defines:
 
             :attributes:
@@ -58,12 +62,21 @@ class Xml2Object(BaseReadConfig):
             :methods:
                 | __init__ - initial constructor.
                 | read_configuration - read a configuration from file.
+                | read_data - read a configuration as plain data.
+                | iter_elements - iterate elements from xml file (streaming).
+                | parser_key - key of parser (active backend).
+                | parser_libraries - modules of parser libraries.
+                | is_picklable - checking can configuration be snapshot.
+                | __parse_configuration - parse configuration from file.
+                | __parse_data - parse configuration to plain data.
+                | __matcher - create matcher for tag/path filters.
                 | __str__ - dunder method for object Xml2Object.
     '''
 
     __metaclass__ = VerboseRoot
     __FORMAT = 'xml'
 
+    @checked('str:configuration_file')
     def __init__(self, configuration_file, verbose=False):
         '''
             Initial constructor.
@@ -74,40 +87,196 @@ class Xml2Object(BaseReadConfig):
             :type verbose: <bool>
             :exceptions: ATSTypeError | ATSBadCallError
         '''
-        checker, error, status = ATSChecker(), None, False
-        error, status = checker.check_params([
-            ('str:configuration_file', configuration_file)
-        ])
-        if status == ATSChecker.TYPE_ERROR:
-            raise ATSTypeError(error)
-        if status == ATSChecker.VALUE_ERROR:
-            raise ATSBadCallError(error)
         BaseReadConfig.__init__(self, verbose=verbose)
         self.__verbose = verbose
         self.file_path = configuration_file
         verbose_message(Xml2Object.VERBOSE, verbose, configuration_file)
 
-    def read_configuration(self, verbose=False):
+    def read_configuration(self, verbose=False, backend=None):
         '''
             Read a configuration from a xml file.
 
             :param verbose: enable/disable verbose option.
             :type verbose: <bool>
+            :param backend: name of xml backend | None (active backend).
+            :type backend: <str> | <NoneType>
             :return: configuration object | None.
-            :rtype: <BeautifulSoup> | <NoneType>
+            :rtype: <BeautifulSoup> | <Element> | <NoneType>
+            :exceptions: ATSValueError | ParseError | XMLSyntaxError
+        '''
+        backend = backend or XmlBackend.active()
+        config = self.read_cached(
+            partial(self.__parse_configuration, backend),
+            None if backend == XmlBackend.BS4 else backend
+        )
+        verbose_message(Xml2Object.VERBOSE, self.__verbose or verbose, config)
+        return config
+
+    def read_data(self, verbose=False):
+        '''
+            Read a configuration from a xml file as plain data.
+            Content is parsed with fastest element tree backend and
+            converted to dict/list structure {root tag: value of root}.
+
+            :param verbose: enable/disable verbose option.
+            :type verbose: <bool>
+            :return: configuration data | None.
+            :rtype: <dict> | <NoneType>
+            :exceptions: ParseError | XMLSyntaxError
+        '''
+        config = self.read_cached(self.__parse_data, 'data')
+        verbose_message(Xml2Object.VERBOSE, self.__verbose or verbose, config)
+        return config
+
+    def iter_elements(self, tags=None, path=None, verbose=False):
+        '''
+            Iterate elements from a xml file (streaming mode).
+            Element is yielded when closed and detached from its parent
+            after consumer resumes, so yielded element stays complete and
+            is freed when consumer drops it. Not matched elements are
+            cleared, only matched subtrees are materialized in memory.
+            Without filters direct children of root element are yielded.
+            Matched element nested in matched subtree is not yielded again.
+
+            :param tags: names of elements to be yielded | None.
+            :type tags: <list> | <tuple> | <set> | <NoneType>
+            :param path: slash separated path from root ('a/b/c') | None.
+            :type path: <str> | <NoneType>
+            :param verbose: enable/disable verbose option.
+            :type verbose: <bool>
+            :return: generator of closed elements.
+            :rtype: <generator>
+            :exceptions: xml.etree.ElementTree.ParseError
+        '''
+        from xml.etree.ElementTree import iterparse
+        matches, stack, depth = Xml2Object.__matcher(tags, path), [], 0
+        with ConfigFile(
+            self.file_path, 'rb', Xml2Object.__FORMAT,
+            mapped=self.is_mapped_read()
+        ) as xml:
+            if not bool(xml):
+                return
+            verbose_message(
+                Xml2Object.VERBOSE, self.__verbose or verbose,
+                'stream configuration', self.file_path
+            )
+            names = []
+            for event, element in iterparse(xml, events=('start', 'end')):
+                if event == 'start':
+                    names.append(element.tag)
+                    if depth or matches(names):
+                        depth += 1
+                    stack.append(element)
+                    continue
+                names.pop()
+                stack.pop()
+                if depth:
+                    depth -= 1
+                    if depth:
+                        continue
+                    yield element
+                else:
+                    element.clear()
+                if stack:
+                    stack[-1].remove(element)
+
+    @staticmethod
+    def __matcher(tags, path):
+        '''
+            Create matcher for tag/path filters.
+
+            :param tags: names of elements to be matched | None.
+            :type tags: <list> | <tuple> | <set> | <NoneType>
+            :param path: slash separated path from root ('a/b/c') | None.
+            :type path: <str> | <NoneType>
+            :return: matcher for stack of element names.
+            :rtype: <function>
+            :exceptions: None
+        '''
+        tags = frozenset(tags) if tags is not None else None
+        path = path.strip('/').split('/') if path is not None else None
+        if tags is None and path is None:
+            return lambda names: len(names) == 2
+        return lambda names: all([
+            tags is None or names[-1] in tags,
+            path is None or names == path
+        ])
+
+    def parser_key(self):
+        '''
+            Key of parser (active backend) of read_configuration.
+
+            :return: name of backend | None (bs4).
+            :rtype: <str> | <NoneType>
+            :exceptions: None
+        '''
+        backend = XmlBackend.active()
+        return None if backend == XmlBackend.BS4 else backend
+
+    def parser_libraries(self, parser_key=None):
+        '''
+            Modules of parser libraries (bs4, lxml) for backend of key.
+
+            :param parser_key: name of backend | 'data' | None (bs4).
+            :type parser_key: <str> | <NoneType>
+            :return: names of modules.
+            :rtype: <list>
+            :exceptions: None
+        '''
+        if parser_key == 'data':
+            parser_key = XmlBackend.data_backend()
+        return {
+            None: ['bs4', 'lxml'], XmlBackend.LXML: ['lxml']
+        }.get(parser_key, [])
+
+    def is_picklable(self, parser_key=None):
+        '''
+            Checking can configuration be pickled (lxml tree can not).
+
+            :param parser_key: name of backend | 'data' | None (bs4).
+            :type parser_key: <str> | <NoneType>
+            :return: boolean status, True (snapshots used) | False.
+            :rtype: <bool>
             :exceptions: None
         '''
-        content, config = None, None
+        return parser_key != XmlBackend.LXML
+
+    def __parse_configuration(self, backend):
+        '''
+            Parse a configuration from an xml file.
+
+            :param backend: name of xml backend.
+            :type backend: <str>
+            :return: configuration object | None.
+            :rtype: <BeautifulSoup> | <Element> | <NoneType>
+            :exceptions: ATSValueError | ParseError | XMLSyntaxError
+        '''
+        config, file_mode, mapped = None, 'r', False
+        if backend != XmlBackend.BS4:
+            file_mode, mapped = 'rb', self.is_mapped_read()
         try:
-            with ConfigFile(self.file_path, 'r', Xml2Object.__FORMAT) as xml:
+            with ConfigFile(
+                self.file_path, file_mode, Xml2Object.__FORMAT, mapped=mapped
+            ) as xml:
                 if bool(xml):
-                    content = xml.read()
-                    config = BeautifulSoup(content, Xml2Object.__FORMAT)
+                    config = XmlBackend.parse(xml, backend)
         except AttributeError:
             pass
-        verbose_message(Xml2Object.VERBOSE, self.__verbose or verbose, config)
         return config
 
+    def __parse_data(self):
+        '''
+            Parse a configuration from an xml file to plain data.
+
+            :return: configuration data | None.
+            :rtype: <dict> | <NoneType>
+            :exceptions: ParseError | XMLSyntaxError
+        '''
+        config = self.__parse_configuration(XmlBackend.data_backend())
+        if config is None:
+            return None
+        return XmlBackend.to_data(config)
+
     def __str__(self):
         '''
             Dunder method for Xml2Object.
@@ -0,0 +1,300 @@
+# -*- coding: UTF-8 -*-
+
+'''
+ Module
+     xml_backend.py
+ Copyright
+     Copyright (C) 2017 Vladimir Roncevic <elektron.ronca@gmail.com>
+     ats_utilities is free software: you can redistribute it and/or modify it
+     under the terms of the GNU General Public License as published by the
+     Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+     ats_utilities is distributed in the hope that it will be useful, but
+     WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+     See the GNU General Public License for more details.
+     You should have received a copy of the GNU General Public License along
+     with this program. If not, see <http://www.gnu.org/licenses/>.
+ Info
+     Defined class XmlBackend with attribute(s) and method(s).
+     Created API for selecting xml parser (bs4 | lxml | etree).
+'''
+
+import sys
+from os import environ
+from threading import Lock
+
+try:
+    from ats_utilities.final import ATSFinal
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+except ImportError as ats_error_message:
+    MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
+    sys.exit(MESSAGE)  # Force close python ATS ##############################
+
+try:
+    from importlib.util import find_spec
+except ImportError:
+    from imp import find_module as find_spec
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = 'Copyright 2017, https://vroncevic.github.io/ats_utilities'
+__credits__ = ['Vladimir Roncevic']
+__license__ = 'https://github.com/vroncevic/ats_utilities/blob/dev/LICENSE'
+__version__ = '1.8.8'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+
+class XmlBackend:
+    '''
+        Defined class XmlBackend with attribute(s) and method(s).
+        Created API for selecting xml parser (bs4 | lxml | etree).
+        BeautifulSoup (bs4 with lxml 'xml' feature) stays default backend,
+        lxml and ElementTree (C accelerated) build element trees without
+        bs4 cost, ElementTree is fastest for plain data. Any tree converts
+        to plain data (dict/list/str), leaf is stripped text, children are
+        dict by tag, repeated tags are list, attributes are not part of
+        plain data.
+        Parsers are detected without import, imported on first use.
+        It defines:
+
+            :attributes:
+                | __metaclass__ - setting class XmlBackend as final.
+                | BS4 - name of BeautifulSoup backend.
+                | LXML - name of lxml backend.
+                | ETREE - name of ElementTree backend.
+                | PREFERENCE - backends in order of preference.
+                | DATA_PREFERENCE - backends for plain data in order.
+                | BACKEND_ENV - environment variable for explicit backend.
+                | __MODULES - modules required by backends.
+                | __available - available backends | None (not resolved).
+                | __backend - name of active backend | None (not resolved).
+                | __lock - lock for first resolving of backend.
+            :methods:
+                | available - names of available backends.
+                | select - select backend (explicit or automatic).
+                | active - name of active backend.
+                | data_backend - name of fastest backend for plain data.
+                | parse - parse xml file with backend.
+                | to_data - convert xml tree to plain data.
+                | element_value - plain value of element (etree | lxml).
+                | local_name - name of tag without namespace.
+                | tag_value - plain value of tag (bs4).
+                | __resolve - detect parsers, select backend.
+    '''
+
+    __metaclass__ = ATSFinal
+    BS4, LXML, ETREE = 'bs4', 'lxml', 'etree'
+    PREFERENCE = [BS4, LXML, ETREE]
+    DATA_PREFERENCE = [ETREE, LXML]
+    BACKEND_ENV = 'ATS_XML_BACKEND'
+    __MODULES = {BS4: ['bs4', 'lxml'], LXML: ['lxml'], ETREE: ['xml']}
+    __available = None
+    __backend = None
+    __lock = Lock()
+
+    @staticmethod
+    def available():
+        '''
+            Names of available backends.
+
+            :return: names of available backends.
+            :rtype: <list>
+            :exceptions: None
+        '''
+        XmlBackend.__resolve()
+        return list(XmlBackend.__available)
+
+    @staticmethod
+    def select(name=None):
+        '''
+            Select backend (explicit or automatic).
+
+            :param name: name of backend | None (bs4 if available).
+            :type name: <str> | <NoneType>
+            :exceptions: ATSValueError
+        '''
+        XmlBackend.__resolve()
+        if name is None:
+            name = XmlBackend.__available[0]
+        if name not in XmlBackend.__available:
+            raise ATSValueError(
+                '{0} [{1}]'.format('not supported xml backend', name)
+            )
+        XmlBackend.__backend = name
+
+    @staticmethod
+    def active():
+        '''
+            Name of active backend.
+
+            :return: 'bs4' | 'lxml' | 'etree'.
+            :rtype: <str>
+            :exceptions: None
+        '''
+        XmlBackend.__resolve()
+        return XmlBackend.__backend
+
+    @staticmethod
+    def data_backend():
+        '''
+            Name of fastest available backend for plain data.
+
+            :return: 'etree' | 'lxml'.
+            :rtype: <str>
+            :exceptions: None
+        '''
+        XmlBackend.__resolve()
+        return [
+            name for name in XmlBackend.DATA_PREFERENCE
+            if name in XmlBackend.__available
+        ][0]
+
+    @staticmethod
+    def parse(xml_file, name=None):
+        '''
+            Parse xml file with backend.
+
+            :param xml_file: opened xml file | memory map of xml file.
+            :type xml_file: <file> | <mmap>
+            :param name: name of backend | None (active backend).
+            :type name: <str> | <NoneType>
+            :return: BeautifulSoup | root element.
+            :rtype: <BeautifulSoup> | <Element>
+            :exceptions: ATSValueError | ParseError | XMLSyntaxError
+        '''
+        name = name or XmlBackend.active()
+        if name not in XmlBackend.available():
+            raise ATSValueError(
+                '{0} [{1}]'.format('not supported xml backend', name)
+            )
+        if name == XmlBackend.BS4:
+            from bs4 import BeautifulSoup
+            return BeautifulSoup(xml_file.read(), 'xml')
+        if name == XmlBackend.LXML:
+            from lxml.etree import parse
+        else:
+            from xml.etree.ElementTree import parse
+        return parse(xml_file).getroot()
+
+    @staticmethod
+    def to_data(tree):
+        '''
+            Convert xml tree to plain data {root tag: value of root}.
+            Tags are local names (namespaces are dropped) for all backends.
+
+            :param tree: BeautifulSoup | root element.
+            :type tree: <BeautifulSoup> | <Element>
+            :return: plain data of xml tree.
+            :rtype: <dict>
+            :exceptions: None
+        '''
+        if hasattr(tree, 'find_all'):
+            root = tree.find(True, recursive=False)
+            if root is None:
+                return {}
+            return {root.name: XmlBackend.tag_value(root)}
+        return {
+            XmlBackend.local_name(tree.tag): XmlBackend.element_value(tree)
+        }
+
+    @staticmethod
+    def element_value(element):
+        '''
+            Plain value of element (ElementTree | lxml).
+            Comments and processing instructions (lxml) are skipped, keys
+            are local names ('{urn:x}r' is 'r') same as names of bs4 tags.
+
+            :param element: xml element.
+            :type element: <Element>
+            :return: text of element | children of element.
+            :rtype: <str> | <dict>
+            :exceptions: None
+        '''
+        value = {}
+        for child in element:
+            tag = child.tag
+            if not isinstance(tag, str):
+                continue
+            if tag[:1] == '{':
+                tag = XmlBackend.local_name(tag)
+            child_value = XmlBackend.element_value(child)
+            if tag not in value:
+                value[tag] = child_value
+            elif isinstance(value[tag], list):
+                value[tag].append(child_value)
+            else:
+                value[tag] = [value[tag], child_value]
+        if not value:
+            return (element.text or '').strip()
+        return value
+
+    @staticmethod
+    def local_name(tag):
+        '''
+            Name of tag without namespace ('{urn:x}r' is 'r').
+
+            :param tag: tag of element.
+            :type tag: <str>
+            :return: local name of tag.
+            :rtype: <str>
+            :exceptions: None
+        '''
+        return tag.rpartition('}')[2]
+
+    @staticmethod
+    def tag_value(tag):
+        '''
+            Plain value of tag (BeautifulSoup).
+
+            :param tag: bs4 tag.
+            :type tag: <Tag>
+            :return: text of tag | children of tag.
+            :rtype: <str> | <dict>
+            :exceptions: None
+        '''
+        children = tag.find_all(True, recursive=False)
+        if not children:
+            return tag.get_text().strip()
+        value = {}
+        for child in children:
+            child_value = XmlBackend.tag_value(child)
+            if child.name not in value:
+                value[child.name] = child_value
+            elif isinstance(value[child.name], list):
+                value[child.name].append(child_value)
+            else:
+                value[child.name] = [value[child.name], child_value]
+        return value
+
+    @staticmethod
+    def __resolve():
+        '''
+            Detect parsers (without import), select backend (once).
+            Backend from environment variable is used when available.
+            Resolved backend is published last, available backends are
+            complete for any thread which sees backend.
+
+            :exceptions: None
+        '''
+        if XmlBackend.__backend is not None:
+            return
+        with XmlBackend.__lock:
+            if XmlBackend.__backend is not None:
+                return
+            available = []
+            for name in XmlBackend.PREFERENCE:
+                try:
+                    if all([
+                        find_spec(module)
+                        for module in XmlBackend.__MODULES[name]
+                    ]):
+                        available.append(name)
+                except ImportError:
+                    pass
+            backend = environ.get(XmlBackend.BACKEND_ENV)
+            if backend not in available:
+                backend = available[0]
+            XmlBackend.__available = available
+            XmlBackend.__backend = backend
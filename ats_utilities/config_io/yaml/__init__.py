@@ -25,13 +25,12 @@ import sys
 try:
     from ats_utilities import VerboseRoot
     from ats_utilities.info import ATSInfo
-    from ats_utilities.checker import ATSChecker
+    from ats_utilities.checker import checked
     from ats_utilities.option import ATSOptionParser
     from ats_utilities.console_io.verbose import verbose_message
     from ats_utilities.config_io.yaml.yaml2object import Yaml2Object
     from ats_utilities.config_io.yaml.object2yaml import Object2Yaml
-    from ats_utilities.exceptions.ats_type_error import ATSTypeError
-    from ats_utilities.exceptions.ats_bad_call_error import ATSBadCallError
+    from ats_utilities.config_io.watcher import ConfigWatcher
 except ImportError as ats_error_message:
     MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
     sys.exit(MESSAGE)  # Force close python ATS ##############################
@@ -62,11 +61,14 @@ class YamlBase:
             :methods:
                 | __init__ - initial constructor.
                 | is_tool_ok - checking is tool operational.
+                | reload_info - reload ATS informations, refresh tool state.
+                | watch - watch informations file (hot reload).
                 | __str__ - dunder method for object YamlBase.
     '''
 
     __metaclass__ = VerboseRoot
 
+    @checked('str:informations_file')
     def __init__(self, informations_file, verbose=False):
         '''
             Initial constructor.
@@ -77,14 +79,6 @@ class YamlBase:
             :type verbose: <bool>
             :exceptions: ATSTypeError | ATSBadCallError
         '''
-        checker, error, status = ATSChecker(), None, False
-        error, status = checker.check_params([
-            ('str:informations_file', informations_file)
-        ])
-        if status == ATSChecker.TYPE_ERROR:
-            raise ATSTypeError(error)
-        if status == ATSChecker.VALUE_ERROR:
-            raise ATSBadCallError(error)
         self.__verbose = verbose
         informations = None
         self.tool_operational = False
@@ -92,27 +86,71 @@ class YamlBase:
         self.obj2yaml = Object2Yaml(informations_file, verbose=verbose)
         if all([self.yaml2obj, self.obj2yaml]):
             informations = self.yaml2obj.read_configuration(verbose=verbose)
+        self.reload_info(informations, verbose=verbose)
+
+    def is_tool_ok(self):
+        '''
+            Checking is tool operational.
+
+            :return: boolean status, True (yes) | False.
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        return self.tool_operational
+
+    def reload_info(self, informations, verbose=False):
+        '''
+            Reload ATS informations, refresh tool state and ATS CL interface.
+
+            :param informations: ATS informations | None.
+            :type informations: <dict> | <NoneType>
+            :param verbose: enable/disable verbose option.
+            :type verbose: <bool>
+            :return: boolean status, True (tool operational) | False.
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        tool_operational = False
         if informations:
             info = ATSInfo(informations, verbose=verbose)
             if info.ats_info_ok:
-                self.option_parser = ATSOptionParser(
-                    '{0} {1}'.format(info.name, info.build_date),
-                    info.version, info.licence, verbose=verbose
-                )
-                self.tool_operational = True
+                version = '{0} {1}'.format(info.name, info.build_date)
+                if hasattr(self, 'option_parser'):
+                    self.option_parser.update(
+                        version, info.version, info.licence, verbose=verbose
+                    )
+                else:
+                    self.option_parser = ATSOptionParser(
+                        version, info.version, info.licence, verbose=verbose
+                    )
+                tool_operational = True
                 verbose_message(
                     YamlBase.VERBOSE, verbose, 'loaded ATS YAML base info'
                 )
+        self.tool_operational = tool_operational
+        return tool_operational
 
-    def is_tool_ok(self):
+    def watch(self, callback=None, verbose=False):
         '''
-            Checking is tool operational.
+            Watch informations file, reload informations on change.
+            Tool state and ATS CL interface are refreshed (reload_info)
+            before callback is called.
 
-            :return: boolean status, True (yes) | False.
-            :rtype: <bool>
+            :param callback: called with reloaded informations | None.
+            :type callback: <function> | <NoneType>
+            :param verbose: enable/disable verbose option.
+            :type verbose: <bool>
+            :return: started watcher of informations file.
+            :rtype: <ConfigWatcher>
             :exceptions: None
         '''
-        return self.tool_operational
+        watcher = ConfigWatcher(
+            self.yaml2obj, self.reload_info, verbose=self.__verbose or verbose
+        )
+        if callback is not None:
+            watcher.add_callback(callback)
+        watcher.start(verbose=verbose)
+        return watcher
 
     def __str__(self):
         '''
@@ -23,14 +23,11 @@
 import sys
 
 try:
-    from yaml import dump
     from ats_utilities import VerboseRoot
-    from ats_utilities.checker import ATSChecker
-    from ats_utilities.config_io import ConfigFile
+    from ats_utilities.checker import checked
     from ats_utilities.console_io.verbose import verbose_message
     from ats_utilities.config_io.base_write import BaseWriteConfig
-    from ats_utilities.exceptions.ats_type_error import ATSTypeError
-    from ats_utilities.exceptions.ats_bad_call_error import ATSBadCallError
+    from ats_utilities.config_io.yaml.yaml_backend import YamlBackend
 except ImportError as ats_error_message:
     MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
     sys.exit(MESSAGE)  # Force close python ATS ##############################
@@ -55,16 +52,19 @@ class Object2Yaml(BaseWriteConfig):
                 | __metaclass__ - setting verbose root for Object2Yaml.
                 | __FORMAT - format of configuration content.
                 | __verbose - enable/disable verbose option.
+                | __safe - enable/disable safe mode (standard tags only).
             :methods:
                 | __init__ - initial constructor.
                 | write_configuration - write configuration to a yaml file.
+                | write_documents - write documents to a yaml file.
                 | __str__ - dunder method for object Object2Yaml.
     '''
 
     __metaclass__ = VerboseRoot
     __FORMAT = 'yaml'
 
-    def __init__(self, configuration_file, verbose=False):
+    @checked('str:configuration_file')
+    def __init__(self, configuration_file, verbose=False, safe=False):
         '''
             Initial constructor.
 
@@ -72,18 +72,13 @@ class Object2Yaml(BaseWriteConfig):
             :type configuration_file: <str>
             :param verbose: enable/disable verbose option.
             :type verbose: <bool>
+            :param safe: enable/disable safe mode (standard tags only).
+            :type safe: <bool>
             :exceptions: ATSTypeError | ATSBadCallError
         '''
-        checker, error, status = ATSChecker(), None, False
-        error, status = checker.check_params([
-            ('str:configuration_file', configuration_file)
-        ])
-        if status == ATSChecker.TYPE_ERROR:
-            raise ATSTypeError(error)
-        if status == ATSChecker.VALUE_ERROR:
-            raise ATSBadCallError(error)
         BaseWriteConfig.__init__(self, verbose=verbose)
         self.__verbose = verbose
+        self.__safe = safe
         self.file_path = configuration_file
         verbose_message(Object2Yaml.VERBOSE, verbose, configuration_file)
 
@@ -95,18 +90,43 @@ class Object2Yaml(BaseWriteConfig):
             :type configuration: <Python object(s)> | <NoneType>
             :param verbose: enable/disable verbose option.
             :type verbose: <bool>
-            :return: boolean status, True (success) | False.
-            :rtype: <bool>
+            :return: status, 0 (failed) | 1 (written) | 2 (skipped).
+            :rtype: <int>
             :exception: None
         '''
-        status = False
+        status = BaseWriteConfig.STATUS_FAILED
         verbose_message(Object2Yaml.VERBOSE, verbose, configuration)
         if configuration is None:
             return status
-        with ConfigFile(self.file_path, 'w', Object2Yaml.__FORMAT) as yaml:
-            if bool(yaml):
-                dump(configuration, yaml, default_flow_style=False)
-                status = True
+        content = YamlBackend.dump(
+            configuration, safe=self.__safe, default_flow_style=False
+        )
+        status = self.write_atomic(content, Object2Yaml.__FORMAT, verbose)
+        return status
+
+    def write_documents(self, documents, verbose=False):
+        '''
+            Write documents to a multi-document yaml file (streaming).
+            Documents are consumed lazily and written in chunks, so
+            memory is bounded by largest document instead of whole stream.
+
+            :param documents: configuration objects (list | generator).
+            :type documents: <Python object(s)>
+            :param verbose: enable/disable verbose option.
+            :type verbose: <bool>
+            :return: status, 0 (failed) | 1 (written) | 2 (skipped).
+            :rtype: <int>
+            :exception: yaml.YAMLError
+        '''
+        status = BaseWriteConfig.STATUS_FAILED
+        verbose_message(Object2Yaml.VERBOSE, verbose, 'write documents')
+        if documents is None:
+            return status
+        content = YamlBackend.iter_dump(
+            documents, safe=self.__safe, default_flow_style=False,
+            explicit_start=True
+        )
+        status = self.write_atomic(content, Object2Yaml.__FORMAT, verbose)
         return status
 
     def __str__(self):
@@ -117,7 +137,7 @@ class Object2Yaml(BaseWriteConfig):
             :rtype: <str>
             :exceptions: None
         '''
-        return '{0} ({1}, {2})'.format(
+        return '{0} ({1}, {2}, {3}, {4})'.format(
             self.__class__.__name__, BaseWriteConfig.__str__(self),
-            str(self.__verbose)
+            str(self.__verbose), str(self.__safe), YamlBackend.active()
         )
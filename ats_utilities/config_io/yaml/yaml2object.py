@@ -23,14 +23,12 @@
 import sys
 
 try:
-    from yaml import load, FullLoader
     from ats_utilities import VerboseRoot
-    from ats_utilities.checker import ATSChecker
+    from ats_utilities.checker import checked
     from ats_utilities.config_io import ConfigFile
     from ats_utilities.console_io.verbose import verbose_message
     from ats_utilities.config_io.base_read import BaseReadConfig
-    from ats_utilities.exceptions.ats_type_error import ATSTypeError
-    from ats_utilities.exceptions.ats_bad_call_error import ATSBadCallError
+    from ats_utilities.config_io.yaml.yaml_backend import YamlBackend
 except ImportError as ats_error_message:
     MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
     sys.exit(MESSAGE)  # Force close python ATS ##############################
@@ -55,16 +53,22 @@ class Yaml2Object(BaseReadConfig):
                 | __metaclass__ - setting verbose root for Yaml2Object.
                 | __FORMAT - format of configuration content.
                 | __verbose - enable/disable verbose option.
+                | __safe - enable/disable safe mode (standard tags only).
             :methods:
                 | __init__ - initial constructor.
                 | read_configuration - getting a configuration from file.
+                | iter_documents - iterate documents from file (lazy).
+                | parser_key - key of parser (safe mode, backend).
+                | parser_libraries - modules of parser libraries (PyYAML).
+                | __parse_configuration - parse configuration from file.
                 | __str__ - dunder method for object Yaml2Object.
     '''
 
     __metaclass__ = VerboseRoot
     __FORMAT = 'yaml'
 
-    def __init__(self, configuration_file, verbose=False):
+    @checked('str:configuration_file')
+    def __init__(self, configuration_file, verbose=False, safe=False):
         '''
             Initial constructor.
 
@@ -72,18 +76,13 @@ class Yaml2Object(BaseReadConfig):
             :type configuration_file: <str>
             :param verbose: enable/disable verbose option.
             :type verbose: <bool>
+            :param safe: enable/disable safe mode (standard tags only).
+            :type safe: <bool>
             :exceptions: ATSTypeError | ATSBadCallError
         '''
-        checker, error, status = ATSChecker(), None, False
-        error, status = checker.check_params([
-            ('str:configuration_file', configuration_file)
-        ])
-        if status == ATSChecker.TYPE_ERROR:
-            raise ATSTypeError(error)
-        if status == ATSChecker.VALUE_ERROR:
-            raise ATSBadCallError(error)
         BaseReadConfig.__init__(self, verbose=verbose)
         self.__verbose = verbose
+        self.__safe = safe
         self.file_path = configuration_file
         verbose_message(Yaml2Object.VERBOSE, verbose, configuration_file)
 
@@ -97,15 +96,72 @@ class Yaml2Object(BaseReadConfig):
             :rtype: <Python object(s)> | <NoneType>
             :exceptions: None
         '''
-        config = None
-        with ConfigFile(self.file_path, 'r', Yaml2Object.__FORMAT) as yaml:
-            if bool(yaml):
-                config = load(yaml, Loader=FullLoader)
+        config = self.read_cached(
+            self.__parse_configuration, self.parser_key()
+        )
         verbose_message(
             Yaml2Object.VERBOSE, self.__verbose or verbose, config
         )
         return config
 
+    def iter_documents(self, verbose=False):
+        '''
+            Iterate documents from multi-document yaml file (lazy).
+            File is parsed incrementally (libyaml when available), memory
+            is bounded by largest document instead of whole stream.
+
+            :param verbose: enable/disable verbose option.
+            :type verbose: <bool>
+            :return: generator of configuration objects.
+            :rtype: <generator>
+            :exceptions: yaml.YAMLError
+        '''
+        with ConfigFile(self.file_path, 'r', Yaml2Object.__FORMAT) as yaml:
+            if not bool(yaml):
+                return
+            verbose_message(
+                Yaml2Object.VERBOSE, self.__verbose or verbose,
+                'stream documents', self.file_path
+            )
+            for document in YamlBackend.load_all(yaml, safe=self.__safe):
+                yield document
+
+    def parser_key(self):
+        '''
+            Key of parser (safe mode, backend).
+
+            :return: key of parser (safe mode, name of backend).
+            :rtype: <tuple>
+            :exceptions: None
+        '''
+        return self.__safe, YamlBackend.active()
+
+    def parser_libraries(self, parser_key=None):
+        '''
+            Modules of parser libraries (PyYAML).
+
+            :param parser_key: key of parser (safe mode, backend) | None.
+            :type parser_key: <tuple> | <NoneType>
+            :return: names of modules.
+            :rtype: <list>
+            :exceptions: None
+        '''
+        return ['yaml']
+
+    def __parse_configuration(self):
+        '''
+            Parse a configuration from a yaml file.
+
+            :return: configuration object | None.
+            :rtype: <Python object(s)> | <NoneType>
+            :exceptions: None
+        '''
+        config = None
+        with ConfigFile(self.file_path, 'r', Yaml2Object.__FORMAT) as yaml:
+            if bool(yaml):
+                config = YamlBackend.load(yaml, safe=self.__safe)
+        return config
+
     def __str__(self):
         '''
             Dunder method for Yaml2Object.
@@ -114,7 +170,7 @@ class Yaml2Object(BaseReadConfig):
             :rtype: <str>
             :exceptions: None
         '''
-        return '{0} ({1}, {2})'.format(
+        return '{0} ({1}, {2}, {3}, {4})'.format(
             self.__class__.__name__, BaseReadConfig.__str__(self),
-            str(self.__verbose)
+            str(self.__verbose), str(self.__safe), YamlBackend.active()
         )
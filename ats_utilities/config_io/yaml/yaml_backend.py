@@ -0,0 +1,286 @@
+# -*- coding: UTF-8 -*-
+
+'''
+ Module
+     yaml_backend.py
+ Copyright
+     Copyright (C) 2017 Vladimir Roncevic <elektron.ronca@gmail.com>
+     ats_utilities is free software: you can redistribute it and/or modify it
+     under the terms of the GNU General Public License as published by the
+     Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+     ats_utilities is distributed in the hope that it will be useful, but
+     WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+     See the GNU General Public License for more details.
+     You should have received a copy of the GNU General Public License along
+     with this program. If not, see <http://www.gnu.org/licenses/>.
+ Info
+     Defined class YamlBackend with attribute(s) and method(s).
+     Created API for selecting yaml loader/dumper (libyaml | python).
+'''
+
+import sys
+from os import environ
+from threading import Lock
+
+try:
+    from ats_utilities.final import ATSFinal
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+except ImportError as ats_error_message:
+    MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
+    sys.exit(MESSAGE)  # Force close python ATS ##############################
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = 'Copyright 2017, https://vroncevic.github.io/ats_utilities'
+__credits__ = ['Vladimir Roncevic']
+__license__ = 'https://github.com/vroncevic/ats_utilities/blob/dev/LICENSE'
+__version__ = '1.8.8'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+
+class YamlBackend:
+    '''
+        Defined class YamlBackend with attribute(s) and method(s).
+        Created API for selecting yaml loader/dumper (libyaml | python).
+        C loader/dumper (libyaml) is used when PyYAML is built with libyaml,
+        python loader/dumper is used otherwise (or by explicit selection).
+        Safe mode constructs only standard yaml tags (CSafeLoader).
+        PyYAML is imported and backend is detected on first use.
+        It defines:
+
+            :attributes:
+                | __metaclass__ - setting class YamlBackend as final.
+                | LIBYAML - name of libyaml (C) backend.
+                | PYTHON - name of pure python backend.
+                | BACKEND_ENV - environment variable for explicit backend.
+                | CHUNK_SIZE - size of chunk for streaming dump.
+                | __LOADERS - loaders by (backend, safe mode).
+                | __DUMPERS - dumpers by (backend, safe mode).
+                | __backend - name of active backend | None (not resolved).
+                | __lock - lock for first resolving of backend.
+            :methods:
+                | available - names of available backends.
+                | select - select backend (explicit or automatic).
+                | active - name of active backend.
+                | loader - loader class for active backend.
+                | dumper - dumper class for active backend.
+                | load - load yaml content with active backend.
+                | load_all - iterate documents of yaml stream (lazy).
+                | dump - dump object to yaml with active backend.
+                | iter_dump - dump documents to chunks of yaml stream.
+                | __resolve - import PyYAML, detect libyaml, select backend.
+    '''
+
+    __metaclass__ = ATSFinal
+    LIBYAML, PYTHON = 'libyaml', 'python'
+    BACKEND_ENV = 'ATS_YAML_BACKEND'
+    CHUNK_SIZE = 64 * 1024
+    __LOADERS = {}
+    __DUMPERS = {}
+    __backend = None
+    __lock = Lock()
+
+    @staticmethod
+    def available():
+        '''
+            Names of available backends.
+
+            :return: names of available backends.
+            :rtype: <list>
+            :exceptions: None
+        '''
+        YamlBackend.__resolve()
+        if YamlBackend.__LOADERS[(YamlBackend.LIBYAML, False)] is None:
+            return [YamlBackend.PYTHON]
+        return [YamlBackend.LIBYAML, YamlBackend.PYTHON]
+
+    @staticmethod
+    def select(name=None):
+        '''
+            Select backend (explicit or automatic).
+
+            :param name: name of backend | None (libyaml if available).
+            :type name: <str> | <NoneType>
+            :exceptions: ATSValueError
+        '''
+        YamlBackend.__resolve()
+        if name is None:
+            name = YamlBackend.available()[0]
+        if name not in YamlBackend.available():
+            raise ATSValueError(
+                '{0} [{1}]'.format('not supported yaml backend', name)
+            )
+        YamlBackend.__backend = name
+
+    @staticmethod
+    def active():
+        '''
+            Name of active backend.
+
+            :return: 'libyaml' | 'python'.
+            :rtype: <str>
+            :exceptions: None
+        '''
+        YamlBackend.__resolve()
+        return YamlBackend.__backend
+
+    @staticmethod
+    def loader(safe=False):
+        '''
+            Loader class for active backend.
+
+            :param safe: enable/disable safe mode (standard tags only).
+            :type safe: <bool>
+            :return: loader class.
+            :rtype: <type>
+            :exceptions: None
+        '''
+        YamlBackend.__resolve()
+        return YamlBackend.__LOADERS[(YamlBackend.__backend, bool(safe))]
+
+    @staticmethod
+    def dumper(safe=False):
+        '''
+            Dumper class for active backend.
+
+            :param safe: enable/disable safe mode (standard tags only).
+            :type safe: <bool>
+            :return: dumper class.
+            :rtype: <type>
+            :exceptions: None
+        '''
+        YamlBackend.__resolve()
+        return YamlBackend.__DUMPERS[(YamlBackend.__backend, bool(safe))]
+
+    @staticmethod
+    def load(stream, safe=False):
+        '''
+            Load yaml content with active backend.
+
+            :param stream: yaml content | opened yaml file.
+            :type stream: <str> | <bytes> | <file>
+            :param safe: enable/disable safe mode (standard tags only).
+            :type safe: <bool>
+            :return: configuration object.
+            :rtype: <Python object(s)>
+            :exceptions: yaml.YAMLError
+        '''
+        from yaml import load
+        return load(stream, Loader=YamlBackend.loader(safe))
+
+    @staticmethod
+    def load_all(stream, safe=False):
+        '''
+            Iterate documents of yaml stream with active backend (lazy).
+            Stream is read incrementally, document is constructed when
+            consumer asks for it, so memory is bounded by largest document.
+
+            :param stream: yaml content | opened yaml file.
+            :type stream: <str> | <bytes> | <file>
+            :param safe: enable/disable safe mode (standard tags only).
+            :type safe: <bool>
+            :return: generator of configuration objects.
+            :rtype: <generator>
+            :exceptions: yaml.YAMLError
+        '''
+        from yaml import load_all
+        return load_all(stream, Loader=YamlBackend.loader(safe))
+
+    @staticmethod
+    def dump(configuration, stream=None, safe=False, **options):
+        '''
+            Dump object to yaml with active backend.
+
+            :param configuration: configuration object.
+            :type configuration: <Python object(s)>
+            :param stream: opened yaml file | None (return content).
+            :type stream: <file> | <NoneType>
+            :param safe: enable/disable safe mode (standard tags only).
+            :type safe: <bool>
+            :param options: options for yaml emitter.
+            :type options: <dict>
+            :return: yaml content | None (written to stream).
+            :rtype: <str> | <NoneType>
+            :exceptions: yaml.YAMLError
+        '''
+        from yaml import dump
+        return dump(
+            configuration, stream, Dumper=YamlBackend.dumper(safe), **options
+        )
+
+    @staticmethod
+    def iter_dump(documents, safe=False, chunk_size=CHUNK_SIZE, **options):
+        '''
+            Dump documents to chunks of yaml stream with active backend.
+            One dumper (emitter) serializes all documents, output is
+            yielded in chunks, documents are consumed lazily.
+
+            :param documents: configuration objects.
+            :type documents: <Python object(s)>
+            :param safe: enable/disable safe mode (standard tags only).
+            :type safe: <bool>
+            :param chunk_size: size of chunk of yaml stream.
+            :type chunk_size: <int>
+            :param options: options for yaml emitter.
+            :type options: <dict>
+            :return: generator of chunks of yaml stream.
+            :rtype: <generator>
+            :exceptions: yaml.YAMLError
+        '''
+        from io import StringIO
+        buffer = StringIO()
+        dumper = YamlBackend.dumper(safe)(buffer, **options)
+        try:
+            dumper.open()
+            for document in documents:
+                dumper.represent(document)
+                if buffer.tell() >= chunk_size:
+                    yield buffer.getvalue()
+                    buffer.seek(0)
+                    buffer.truncate()
+            dumper.close()
+        finally:
+            dumper.dispose()
+        yield buffer.getvalue()
+
+    @staticmethod
+    def __resolve():
+        '''
+            Import PyYAML, detect libyaml, select backend (once).
+            Backend from environment variable is used when available.
+            Resolved backend is published last, loaders/dumpers are
+            complete for any thread which sees backend.
+
+            :exceptions: None
+        '''
+        if YamlBackend.__backend is not None:
+            return
+        with YamlBackend.__lock:
+            if YamlBackend.__backend is not None:
+                return
+            import yaml
+            libyaml = YamlBackend.LIBYAML, YamlBackend.PYTHON
+            dumpers = {
+                (libyaml[0], False): getattr(yaml, 'CDumper', None),
+                (libyaml[0], True): getattr(yaml, 'CSafeDumper', None),
+                (libyaml[1], False): yaml.Dumper,
+                (libyaml[1], True): yaml.SafeDumper
+            }
+            loaders = {
+                (libyaml[0], False): getattr(yaml, 'CFullLoader', None),
+                (libyaml[0], True): getattr(yaml, 'CSafeLoader', None),
+                (libyaml[1], False): yaml.FullLoader,
+                (libyaml[1], True): yaml.SafeLoader
+            }
+            available = [
+                name for name in libyaml if loaders[(name, False)] is not None
+            ]
+            backend = environ.get(YamlBackend.BACKEND_ENV)
+            if backend not in available:
+                backend = available[0]
+            YamlBackend.__DUMPERS.update(dumpers)
+            YamlBackend.__LOADERS.update(loaders)
+            YamlBackend.__backend = backend
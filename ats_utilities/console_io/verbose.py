@@ -23,7 +23,6 @@
 import sys
 
 try:
-    from colorama import init, Fore
     from ats_utilities.final import ATSFinal
     from ats_utilities.checker import ATSChecker
     from ats_utilities.exceptions.ats_type_error import ATSTypeError
@@ -87,6 +86,7 @@ class ATSVerbose:
             :type message: <str>
             :exceptions: None
         '''
+        from colorama import init, Fore
         init(autoreset=False)
         self.__message = '{0}{1}{2}'.format(
             Fore.BLUE, message, Fore.RESET
@@ -23,11 +23,8 @@
 import sys
 
 try:
-    from colorama import init, Fore
     from ats_utilities.final import ATSFinal
-    from ats_utilities.checker import ATSChecker
-    from ats_utilities.exceptions.ats_type_error import ATSTypeError
-    from ats_utilities.exceptions.ats_bad_call_error import ATSBadCallError
+    from ats_utilities.checker import checked
 except ImportError as ats_error_message:
     MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
     sys.exit(MESSAGE)  # Force close python ATS ##############################
@@ -88,6 +85,7 @@ class ATSWarning:
             :type message: <str>
             :exceptions: None
         '''
+        from colorama import init, Fore
         init(autoreset=False)
         self.__message = '{0}{1}{2}'.format(
             Fore.YELLOW, message, Fore.RESET
@@ -114,6 +112,7 @@ class ATSWarning:
         return '{0} ({1})'.format(self.__class__.__name__, self.__message)
 
 
+@checked('str:warning_path', 'tuple:message')
 def warning_message(warning_path, *message):
     '''
         Show warning message.
@@ -124,14 +123,6 @@ def warning_message(warning_path, *message):
         :type message: <tuple>
         :exceptions: ATSTypeError | ATSBadCallError
     '''
-    checker, error, status = ATSChecker(), None, False
-    error, status = checker.check_params([
-        ('str:warning_path', warning_path), ('tuple:message', message)
-    ])
-    if status == ATSChecker.TYPE_ERROR:
-        raise ATSTypeError(error)
-    if status == ATSChecker.VALUE_ERROR:
-        raise ATSBadCallError(error)
     message, warning = tuple([str(item) for item in message]), ATSWarning()
     warning.message = ' '.join(message)
     warning_message_log = '[{0}] {1}'.format(
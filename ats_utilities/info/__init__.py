@@ -24,7 +24,8 @@ import sys
 from datetime import datetime
 
 try:
-    from ats_utilities.checker import ATSChecker
+    from ats_utilities.schema import Schema
+    from ats_utilities.checker import checked
     from ats_utilities.info.ats_name import ATSName
     from ats_utilities.info.ats_info_ok import ATSInfoOk
     from ats_utilities.info.ats_version import ATSVersion
@@ -33,8 +34,6 @@ try:
     from ats_utilities.console_io.error import error_message
     from ats_utilities.info.ats_build_date import ATSBuildDate
     from ats_utilities.console_io.verbose import verbose_message
-    from ats_utilities.exceptions.ats_type_error import ATSTypeError
-    from ats_utilities.exceptions.ats_bad_call_error import ATSBadCallError
 except ImportError as ats_error_message:
     MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
     sys.exit(MESSAGE)  # Force close python ATS ##############################
@@ -62,6 +61,7 @@ class ATSInfo(ATSName, ATSVersion, ATSLicence, ATSBuildDate, ATSInfoOk):
                 | ATS_LICENCE - ATS licence key.
                 | ATS_BUILD_DATE - ATS build date key.
                 | ATS_BASE_INFO - ATS base information dict.
+                | ATS_INFO_SCHEMA - compiled schema of ATS informations.
                 | __verbose - enable/disable verbose option.
             :methods:
                 | __init__ - initial constructor.
@@ -81,7 +81,12 @@ class ATSInfo(ATSName, ATSVersion, ATSLicence, ATSBuildDate, ATSInfoOk):
         3: ATS_LICENCE,
         4: ATS_BUILD_DATE,
     }
+    ATS_INFO_SCHEMA = Schema({
+        'type': 'dict', 'additional': False,
+        'keys': dict.fromkeys(ATS_BASE_INFO.values(), 'any')
+    })
 
+    @checked('dict:info')
     def __init__(self, info, verbose=False):
         '''
             Initial constructor.
@@ -92,12 +97,6 @@ class ATSInfo(ATSName, ATSVersion, ATSLicence, ATSBuildDate, ATSInfoOk):
             :type verbose: <bool>
             :exceptions: ATSTypeError | ATSBadCallError
         '''
-        checker, error, status = ATSChecker(), None, False
-        error, status = checker.check_params([('dict:info', info)])
-        if status == ATSChecker.TYPE_ERROR:
-            raise ATSTypeError(error)
-        if status == ATSChecker.VALUE_ERROR:
-            raise ATSBadCallError(error)
         ATSName.__init__(self)
         ATSVersion.__init__(self)
         ATSLicence.__init__(self)
@@ -128,6 +127,7 @@ class ATSInfo(ATSName, ATSVersion, ATSLicence, ATSBuildDate, ATSInfoOk):
                 )
             )
 
+    @checked('dict:informations')
     def is_correct(self, informations, verbose=False):
         '''
             Check information structure.
@@ -136,26 +136,22 @@ class ATSInfo(ATSName, ATSVersion, ATSLicence, ATSBuildDate, ATSInfoOk):
             :type informations: <dict>
             :param verbose: enable/disable verbose option.
             :type verbose: <bool>
+            :return: True (expected keys only) | False.
+            :rtype: <bool>
             :exceptions: ATSTypeError | ATSBadCallError
         '''
-        checker, error, status = ATSChecker(), None, False
-        error, status = checker.check_params([
-            ('dict:informations', informations)
-        ])
-        if status == ATSChecker.TYPE_ERROR:
-            raise ATSTypeError(error)
-        if status == ATSChecker.VALUE_ERROR:
-            raise ATSBadCallError(error)
         verbose_message(
             ATSInfo.VERBOSE, verbose, 'check ATS informations', informations
         )
-        for info_key in informations.keys():
-            if info_key not in ATSInfo.ATS_BASE_INFO.values():
-                message = '{0} [{1}]'.format('key not expected', info_key)
-                error_message(ATSInfo.VERBOSE, message)
-                self.__statuses.append(False)
-            else:
-                self.__statuses.append(True)
+        errors = ATSInfo.ATS_INFO_SCHEMA.validate(informations)
+        if errors:
+            error_message(
+                ATSInfo.VERBOSE, '{0} {1}'.format(
+                    'keys not expected', [path for path, _ in errors]
+                )
+            )
+        self.__statuses.append(not errors)
+        return not errors
 
     def __str__(self):
         '''
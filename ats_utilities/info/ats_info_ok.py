@@ -24,10 +24,8 @@ import sys
 
 try:
     from ats_utilities import VerboseRoot
-    from ats_utilities.checker import ATSChecker
+    from ats_utilities.checker import checked
     from ats_utilities.console_io.verbose import verbose_message
-    from ats_utilities.exceptions.ats_type_error import ATSTypeError
-    from ats_utilities.exceptions.ats_bad_call_error import ATSBadCallError
 except ImportError as ats_error_message:
     MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
     sys.exit(MESSAGE)  # Force close python ATS ##############################
@@ -83,6 +81,7 @@ class ATSInfoOk:
         return self.__ats_info_ok
 
     @ats_info_ok.setter
+    @checked('bool:ats_info_ok')
     def ats_info_ok(self, ats_info_ok):
         '''
             Property method for setting ATS information status.
@@ -91,14 +90,6 @@ class ATSInfoOk:
             :type ats_info_ok: <bool>
             :exceptions: ATSTypeError | ATSBadCallError
         '''
-        checker, error, status = ATSChecker(), None, False
-        error, status = checker.check_params([
-            ('bool:ats_info_ok', ats_info_ok)
-        ])
-        if status == ATSChecker.TYPE_ERROR:
-            raise ATSTypeError(error)
-        if status == ATSChecker.VALUE_ERROR:
-            raise ATSBadCallError(error)
         self.__ats_info_ok = ats_info_ok
         verbose_message(ATSInfoOk.VERBOSE, self.__verbose, str(ats_info_ok))
 
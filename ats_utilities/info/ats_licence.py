@@ -24,10 +24,8 @@ import sys
 
 try:
     from ats_utilities import VerboseRoot
-    from ats_utilities.checker import ATSChecker
+    from ats_utilities.checker import checked
     from ats_utilities.console_io.verbose import verbose_message
-    from ats_utilities.exceptions.ats_type_error import ATSTypeError
-    from ats_utilities.exceptions.ats_bad_call_error import ATSBadCallError
 except ImportError as ats_error_message:
     MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
     sys.exit(MESSAGE)  # Force close python ATS ##############################
@@ -84,6 +82,7 @@ class ATSLicence:
         return self.__licence
 
     @licence.setter
+    @checked('str:licence')
     def licence(self, licence):
         '''
             Property method for setting ATS licence.
@@ -92,12 +91,6 @@ class ATSLicence:
             :type licence: <str>
             :exceptions: ATSTypeError | ATSBadCallError
         '''
-        checker, error, status = ATSChecker(), None, False
-        error, status = checker.check_params([('str:licence', licence)])
-        if status == ATSChecker.TYPE_ERROR:
-            raise ATSTypeError(error)
-        if status == ATSChecker.VALUE_ERROR:
-            raise ATSBadCallError(error)
         self.__licence = licence
         verbose_message(ATSLicence.VERBOSE, self.__verbose, licence)
 
@@ -0,0 +1,108 @@
+# -*- coding: UTF-8 -*-
+
+'''
+ Module
+     __init__.py
+ Copyright
+     Copyright (C) 2017 Vladimir Roncevic <elektron.ronca@gmail.com>
+     ats_utilities is free software: you can redistribute it and/or modify it
+     under the terms of the GNU General Public License as published by the
+     Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+     ats_utilities is distributed in the hope that it will be useful, but
+     WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+     See the GNU General Public License for more details.
+     You should have received a copy of the GNU General Public License along
+     with this program. If not, see <http://www.gnu.org/licenses/>.
+ Info
+     Defined class LazyAttributes with attribute(s) and method(s).
+     Created API for lazily resolved module attributes (PEP 562).
+'''
+
+import sys
+from importlib import import_module
+
+try:
+    from ats_utilities.final import ATSFinal
+except ImportError as ats_error_message:
+    MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
+    sys.exit(MESSAGE)  # Force close python ATS ##############################
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = 'Copyright 2017, https://vroncevic.github.io/ats_utilities'
+__credits__ = ['Vladimir Roncevic']
+__license__ = 'https://github.com/vroncevic/ats_utilities/blob/dev/LICENSE'
+__version__ = '1.8.8'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+
+class LazyAttributes:
+    '''
+        Defined class LazyAttributes with attribute(s) and method(s).
+        Created API for lazily resolved module attributes (PEP 562).
+        Instance is used as module level __getattr__, submodule is imported
+        on first access of attribute and value is stored in module globals,
+        so next access does not go through __getattr__.
+        It defines:
+
+            :attributes:
+                | __metaclass__ - setting class LazyAttributes as final.
+                | __module_name - name of module with lazy attributes.
+                | __attributes - attribute name to submodule name mapping.
+            :methods:
+                | __init__ - initial constructor.
+                | __call__ - resolve attribute of module.
+                | __str__ - dunder method for LazyAttributes.
+    '''
+
+    __metaclass__ = ATSFinal
+
+    def __init__(self, module_name, attributes):
+        '''
+            Initial constructor.
+
+            :param module_name: name of module with lazy attributes.
+            :type module_name: <str>
+            :param attributes: attribute name to submodule name mapping.
+            :type attributes: <dict>
+            :exceptions: None
+        '''
+        self.__module_name = module_name
+        self.__attributes = dict(attributes)
+
+    def __call__(self, name):
+        '''
+            Resolve attribute of module (import submodule on first use).
+
+            :param name: attribute name.
+            :type name: <str>
+            :return: value of attribute.
+            :rtype: <Python object(s)>
+            :exceptions: AttributeError
+        '''
+        submodule = self.__attributes.get(name)
+        if submodule is None:
+            raise AttributeError(
+                'module {0} has no attribute {1}'.format(
+                    self.__module_name, name
+                )
+            )
+        value = getattr(import_module(submodule), name)
+        setattr(sys.modules[self.__module_name], name, value)
+        return value
+
+    def __str__(self):
+        '''
+            Dunder method for LazyAttributes.
+
+            :return: object in a human-readable format.
+            :rtype: <str>
+            :exceptions: None
+        '''
+        return '{0} ({1}, {2})'.format(
+            self.__class__.__name__, self.__module_name,
+            str(sorted(self.__attributes))
+        )
@@ -27,16 +27,14 @@ from logging import (
 
 try:
     from pathlib import Path
-    from ats_utilities.checker import ATSChecker
+    from ats_utilities.checker import checked
     from ats_utilities.cooperative import CooperativeMeta
     from ats_utilities.console_io.error import error_message
     from ats_utilities.console_io.verbose import verbose_message
     from ats_utilities.logging.ats_logger_file import ATSLoggerFile
     from ats_utilities.logging.ats_logger_name import ATSLoggerName
     from ats_utilities.exceptions.ats_file_error import ATSFileError
-    from ats_utilities.exceptions.ats_type_error import ATSTypeError
     from ats_utilities.logging.ats_logger_status import ATSLoggerStatus
-    from ats_utilities.exceptions.ats_bad_call_error import ATSBadCallError
 except ImportError as ats_error_message:
     MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
     sys.exit(MESSAGE)  # Force close python ATS ##############################
@@ -80,6 +78,7 @@ class ATSLogger(ATSLoggerName, ATSLoggerFile, ATSLoggerStatus):
         DEBUG, WARNING, CRITICAL, ERROR, INFO
     )
 
+    @checked('str:ats_name', 'str:ats_log_file')
     def __init__(self, ats_name, ats_log_file, verbose=False):
         '''
             Initial constructor.
@@ -92,14 +91,6 @@ class ATSLogger(ATSLoggerName, ATSLoggerFile, ATSLoggerStatus):
             :type verbose: <bool>
             :exceptions: ATSTypeError | ATSBadCallError | ATSFileError
         '''
-        checker, error, status = ATSChecker(), None, False
-        error, status = checker.check_params([
-            ('str:ats_name', ats_name), ('str:ats_log_file', ats_log_file)
-        ])
-        if status == ATSChecker.TYPE_ERROR:
-            raise ATSTypeError(error)
-        if status == ATSChecker.VALUE_ERROR:
-            raise ATSBadCallError(error)
         ATSLoggerName.__init__(self, verbose=verbose)
         ATSLoggerFile.__init__(self, verbose=verbose)
         ATSLoggerStatus.__init__(self, verbose=verbose)
@@ -125,6 +116,7 @@ class ATSLogger(ATSLoggerName, ATSLoggerFile, ATSLoggerStatus):
             raise ATSFileError(error)
         verbose_message(ATSLogger.VERBOSE, verbose, 'init ATS logger')
 
+    @checked('str:message', 'int:ctrl')
     def write_log(self, message, ctrl, verbose=False):
         '''
             Write message to log file.
@@ -139,14 +131,6 @@ class ATSLogger(ATSLoggerName, ATSLoggerFile, ATSLoggerStatus):
             :rtype: <bool>
             :exceptions: ATSTypeError | ATSBadCallError
         '''
-        checker, error, status = ATSChecker(), None, False
-        error, status = checker.check_params([
-            ('str:message', message), ('int:ctrl', ctrl)
-        ])
-        if status == ATSChecker.TYPE_ERROR:
-            raise ATSTypeError(error)
-        if status == ATSChecker.VALUE_ERROR:
-            raise ATSBadCallError(error)
         status = False
         verbose_message(
             ATSLogger.VERBOSE, self.__verbose or verbose, message, ctrl
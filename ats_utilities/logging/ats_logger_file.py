@@ -24,10 +24,8 @@ import sys
 
 try:
     from ats_utilities import VerboseRoot
-    from ats_utilities.checker import ATSChecker
+    from ats_utilities.checker import checked
     from ats_utilities.console_io.verbose import verbose_message
-    from ats_utilities.exceptions.ats_type_error import ATSTypeError
-    from ats_utilities.exceptions.ats_bad_call_error import ATSBadCallError
 except ImportError as ats_error_message:
     MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
     sys.exit(MESSAGE)  # Force close python ATS ##############################
@@ -83,6 +81,7 @@ class ATSLoggerFile:
         return self.__logger_file
 
     @logger_file.setter
+    @checked('str:logger_file')
     def logger_file(self, logger_file):
         '''
             Property method for setting log file path.
@@ -91,14 +90,6 @@ class ATSLoggerFile:
             :type logger_file: <str>
             :exceptions: ATSTypeError | ATSBadCallError
         '''
-        checker, error, status = ATSChecker(), None, False
-        error, status = checker.check_params([
-            ('str:logger_file', logger_file)
-        ])
-        if status == ATSChecker.TYPE_ERROR:
-            raise ATSTypeError(error)
-        if status == ATSChecker.VALUE_ERROR:
-            raise ATSBadCallError(error)
         self.__logger_file = logger_file
         verbose_message(ATSLoggerFile.VERBOSE, self.__verbose, logger_file)
 
@@ -24,10 +24,8 @@ import sys
 
 try:
     from ats_utilities import VerboseRoot
-    from ats_utilities.checker import ATSChecker
+    from ats_utilities.checker import checked
     from ats_utilities.console_io.verbose import verbose_message
-    from ats_utilities.exceptions.ats_type_error import ATSTypeError
-    from ats_utilities.exceptions.ats_bad_call_error import ATSBadCallError
 except ImportError as ats_error_message:
     MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
     sys.exit(MESSAGE)  # Force close python ATS ##############################
@@ -83,6 +81,7 @@ class ATSLoggerStatus:
         return self.__log_status
 
     @logger_status.setter
+    @checked('bool:log_status')
     def logger_status(self, log_status):
         '''
             Property method for setting logger status.
@@ -91,12 +90,6 @@ class ATSLoggerStatus:
             :type log_status: <bool>
             :exceptions: ATSTypeError | ATSBadCallError
         '''
-        checker, error, status = ATSChecker(), None, False
-        error, status = checker.check_params([('bool:log_status', log_status)])
-        if status == ATSChecker.TYPE_ERROR:
-            raise ATSTypeError(error)
-        if status == ATSChecker.VALUE_ERROR:
-            raise ATSBadCallError(error)
         self.__log_status = log_status
         verbose_message(ATSLoggerStatus.VERBOSE, self.__verbose, log_status)
 
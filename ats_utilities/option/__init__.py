@@ -25,10 +25,8 @@ from argparse import ArgumentParser
 
 try:
     from ats_utilities import VerboseRoot
-    from ats_utilities.checker import ATSChecker
+    from ats_utilities.checker import checked
     from ats_utilities.console_io.verbose import verbose_message
-    from ats_utilities.exceptions.ats_type_error import ATSTypeError
-    from ats_utilities.exceptions.ats_bad_call_error import ATSBadCallError
 except ImportError as ats_error_message:
     MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
     sys.exit(MESSAGE)  # Force close python ATS ##############################
@@ -57,12 +55,14 @@ class ATSOptionParser:
             :methods:
                 | __init__ - initial constructor.
                 | add_operation - add option to ATS.
+                | update - update version and descriptions of ATS.
                 | parse_args - process arguments from start.
                 | __str__ - dunder method for ATSOptionParser.
     '''
 
     __metaclass__ = VerboseRoot
 
+    @checked('str:version', 'str:epilog', 'str:description')
     def __init__(self, version, epilog, description, verbose=False):
         '''
             Initial constructor.
@@ -77,15 +77,6 @@ class ATSOptionParser:
             :type verbose: <bool>
             :exceptions: ATSTypeError | ATSBadCallError
         '''
-        checker, error, status = ATSChecker(), None, False
-        error, status = checker.check_params([
-            ('str:version', version), ('str:epilog', epilog),
-            ('str:description', description)
-        ])
-        if status == ATSChecker.TYPE_ERROR:
-            raise ATSTypeError(error)
-        if status == ATSChecker.VALUE_ERROR:
-            raise ATSBadCallError(error)
         self.__verbose = verbose
         self.__opt_parser = ArgumentParser(version, epilog, description)
         verbose_message(
@@ -105,6 +96,29 @@ class ATSOptionParser:
         '''
         self.__opt_parser.add_argument(*args, **kwargs)
 
+    @checked('str:version', 'str:epilog', 'str:description')
+    def update(self, version, epilog, description, verbose=False):
+        '''
+            Update version and descriptions of ATS (options are kept).
+
+            :param version: ATS version and build date.
+            :type version: <str>
+            :param epilog: ATS long description.
+            :type epilog: <str>
+            :param description: ATS author and license.
+            :type description: <str>
+            :param verbose: enable/disable verbose option.
+            :type verbose: <bool>
+            :exceptions: ATSTypeError | ATSBadCallError
+        '''
+        self.__opt_parser.prog = version
+        self.__opt_parser.usage = epilog
+        self.__opt_parser.description = description
+        verbose_message(
+            ATSOptionParser.VERBOSE, self.__verbose or verbose,
+            version, epilog, description
+        )
+
     def parse_args(self, arguments, verbose=False):
         '''
             Process arguments from start.
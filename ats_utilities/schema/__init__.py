@@ -0,0 +1,143 @@
+# -*- coding: UTF-8 -*-
+
+'''
+ Module
+     __init__.py
+ Copyright
+     Copyright (C) 2017 Vladimir Roncevic <elektron.ronca@gmail.com>
+     ats_utilities is free software: you can redistribute it and/or modify it
+     under the terms of the GNU General Public License as published by the
+     Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+     ats_utilities is distributed in the hope that it will be useful, but
+     WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+     See the GNU General Public License for more details.
+     You should have received a copy of the GNU General Public License along
+     with this program. If not, see <http://www.gnu.org/licenses/>.
+ Info
+     Defined class Schema with attribute(s) and method(s).
+     Created API for compiled validation of configuration structures.
+'''
+
+import sys
+
+try:
+    from ats_utilities.schema.compiler import (
+        KEYWORDS, TYPES, SIZED, compile_node
+    )
+    from ats_utilities.final import ATSFinal
+except ImportError as ats_error_message:
+    MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
+    sys.exit(MESSAGE)  # Force close python ATS ##############################
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = 'Copyright 2017, https://vroncevic.github.io/ats_utilities'
+__credits__ = ['Vladimir Roncevic']
+__license__ = 'https://github.com/vroncevic/ats_utilities/blob/dev/LICENSE'
+__version__ = '1.8.8'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+
+class Schema:
+    '''
+        Defined class Schema with attribute(s) and method(s).
+        Created API for compiled validation of configuration structures.
+        Declarative schema is compiled once to tree of validators (see
+        ats_utilities.schema.compiler), so
+        validation is one pass over configuration (dict, list, ConfigParser
+        or any mapping) which collects all errors without console output.
+        Node of schema is type name, type or dict with keywords:
+        type, nullable, required, min, max, enum, regex, keys, additional,
+        values, items (min/max bound length of str, list and dict).
+        It defines:
+
+            :attributes:
+                | __metaclass__ - setting class Schema as final.
+                | KEYWORDS - supported keywords of schema node.
+                | TYPES - supported type names and checked types.
+                | SIZED - type names with bounded length (min/max).
+                | __definition - declarative schema.
+                | __validator - compiled validator of root node.
+            :methods:
+                | __init__ - initial constructor.
+                | validate - validate configuration, collect errors.
+                | is_valid - check configuration against schema.
+                | __path - dotted path of value in configuration.
+                | __str__ - dunder method for Schema.
+    '''
+
+    __metaclass__ = ATSFinal
+    KEYWORDS = KEYWORDS
+    TYPES = TYPES
+    SIZED = SIZED
+
+    def __init__(self, definition):
+        '''
+            Initial constructor (compile schema).
+
+            :param definition: declarative schema.
+            :type definition: <dict> | <str> | <type>
+            :exceptions: ATSValueError
+        '''
+        self.__definition = definition
+        self.__validator = compile_node(definition)
+
+    def validate(self, configuration):
+        '''
+            Validate configuration, collect errors.
+
+            :param configuration: configuration object.
+            :type configuration: <Python object(s)>
+            :return: errors as (dotted path, message), empty if valid.
+            :rtype: <list>
+            :exceptions: None
+        '''
+        errors = []
+        self.__validator(configuration, None, errors)
+        return [(Schema.__path(trail), message) for trail, message in errors]
+
+    def is_valid(self, configuration):
+        '''
+            Check configuration against schema.
+
+            :param configuration: configuration object.
+            :type configuration: <Python object(s)>
+            :return: True (valid configuration) | False.
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        errors = []
+        self.__validator(configuration, None, errors)
+        return not errors
+
+    @staticmethod
+    def __path(trail):
+        '''
+            Dotted path of value in configuration ('' for root).
+
+            :param trail: linked (parent trail, key) pairs | None.
+            :type trail: <tuple> | <NoneType>
+            :return: dotted path of value.
+            :rtype: <str>
+            :exceptions: None
+        '''
+        keys = []
+        while trail is not None:
+            trail, key = trail
+            keys.append(str(key))
+        return '.'.join(reversed(keys))
+
+    def __str__(self):
+        '''
+            Dunder method for Schema.
+
+            :return: object in a human-readable format.
+            :rtype: <str>
+            :exceptions: None
+        '''
+        return '{0} ({1})'.format(
+            self.__class__.__name__, str(self.__definition)
+        )
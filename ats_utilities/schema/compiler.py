@@ -0,0 +1,300 @@
+# -*- coding: UTF-8 -*-
+
+'''
+ Module
+     compiler.py
+ Copyright
+     Copyright (C) 2017 Vladimir Roncevic <elektron.ronca@gmail.com>
+     ats_utilities is free software: you can redistribute it and/or modify it
+     under the terms of the GNU General Public License as published by the
+     Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+     ats_utilities is distributed in the hope that it will be useful, but
+     WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+     See the GNU General Public License for more details.
+     You should have received a copy of the GNU General Public License along
+     with this program. If not, see <http://www.gnu.org/licenses/>.
+ Info
+     Defined compiler of declarative schema to tree of validator closures
+     (precompiled regexes, frozenset enums and key tables of schema nodes).
+'''
+
+import sys
+from re import compile as re_compile
+
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+try:
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+except ImportError as ats_error_message:
+    MESSAGE = '\n{0}\n{1}\n'.format(__file__, ats_error_message)
+    sys.exit(MESSAGE)  # Force close python ATS ##############################
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = 'Copyright 2017, https://vroncevic.github.io/ats_utilities'
+__credits__ = ['Vladimir Roncevic']
+__license__ = 'https://github.com/vroncevic/ats_utilities/blob/dev/LICENSE'
+__version__ = '1.8.8'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+STRINGS = (str, type(u''))
+KEYWORDS = frozenset([
+    'type', 'nullable', 'required', 'min', 'max', 'enum', 'regex',
+    'keys', 'additional', 'values', 'items'
+])
+TYPES = {
+    'any': (object,), 'bool': (bool,), 'int': (int,),
+    'float': (float,), 'number': (int, float), 'str': STRINGS,
+    'list': (list, tuple), 'dict': (Mapping,)
+}
+SIZED = frozenset(['str', 'list', 'dict'])
+
+
+def compile_node(node, location=''):
+    '''
+        Compile schema node to validator.
+
+        :param node: schema node.
+        :type node: <dict> | <str> | <type>
+        :param location: dotted location of node in schema.
+        :type location: <str>
+        :return: validator(value, trail, errors).
+        :rtype: <function>
+        :exceptions: ATSValueError
+    '''
+    if isinstance(node, STRINGS + (type,)):
+        node = {'type': node}
+    if not isinstance(node, dict):
+        raise ATSValueError('{0} [{1}]'.format(
+            'not valid schema node', location or '<root>'
+        ))
+    unknown = set(node).difference(KEYWORDS)
+    if unknown:
+        raise ATSValueError('{0} {1} [{2}]'.format(
+            'not supported keywords', sorted(unknown), location or '<root>'
+        ))
+    type_name, types = node_type(node, location)
+    checks = [
+        check for check in [
+            compile_bounds(node, type_name, location),
+            compile_enum(node),
+            compile_regex(node, type_name, location),
+            compile_mapping(node, location),
+            compile_items(node, location)
+        ] if check is not None
+    ]
+    nullable = node.get('nullable', False)
+    strict_int = type_name in ('int', 'number')
+    expected = 'expected {0}, got '.format(type_name)
+
+    def validator(value, trail, errors):
+        if value is None and nullable:
+            return
+        if not isinstance(value, types) or (
+            strict_int and value.__class__ is bool
+        ):
+            errors.append((trail, expected + type(value).__name__))
+            return
+        for check in checks:
+            check(value, trail, errors)
+    return validator
+
+
+def node_type(node, location):
+    '''
+        Type name and checked types of schema node.
+
+        :param node: schema node.
+        :type node: <dict>
+        :param location: dotted location of node in schema.
+        :type location: <str>
+        :return: type name and tuple of checked types.
+        :rtype: <tuple>
+        :exceptions: ATSValueError
+    '''
+    type_name = node.get('type')
+    if type_name is None:
+        if 'keys' in node or 'values' in node:
+            type_name = 'dict'
+        elif 'items' in node:
+            type_name = 'list'
+        else:
+            type_name = 'any'
+    if isinstance(type_name, type):
+        type_name = type_name.__name__
+    if type_name not in TYPES:
+        raise ATSValueError('{0} {1} [{2}]'.format(
+            'not supported type', type_name, location or '<root>'
+        ))
+    return type_name, TYPES[type_name]
+
+
+def compile_bounds(node, type_name, location):
+    '''
+        Compile min/max check (length for str, list and dict).
+
+        :param node: schema node.
+        :type node: <dict>
+        :param type_name: type name of schema node.
+        :type type_name: <str>
+        :param location: dotted location of node in schema.
+        :type location: <str>
+        :return: check(value, trail, errors) | None.
+        :rtype: <function> | <NoneType>
+        :exceptions: ATSValueError
+    '''
+    low, high = node.get('min'), node.get('max')
+    if low is None and high is None:
+        return None
+    if low is not None and high is not None and low > high:
+        raise ATSValueError('{0} [{1}]'.format(
+            'min is greater than max', location or '<root>'
+        ))
+    sized = type_name in SIZED
+    subject = 'length' if sized else 'value'
+
+    def check(value, trail, errors):
+        try:
+            measure = len(value) if sized else value
+            if low is not None and measure < low:
+                errors.append((trail, '{0} {1} is less than {2}'.format(
+                    subject, measure, low
+                )))
+            elif high is not None and measure > high:
+                errors.append((trail, '{0} {1} is greater than {2}'.format(
+                    subject, measure, high
+                )))
+        except TypeError:
+            errors.append((trail, '{0} {1!r} is not comparable'.format(
+                subject, value
+            )))
+    return check
+
+
+def compile_enum(node):
+    '''
+        Compile enum check (frozenset lookup for hashable values).
+
+        :param node: schema node.
+        :type node: <dict>
+        :return: check(value, trail, errors) | None.
+        :rtype: <function> | <NoneType>
+        :exceptions: None
+    '''
+    if 'enum' not in node:
+        return None
+    choices = list(node['enum'])
+    try:
+        allowed = frozenset(choices)
+    except TypeError:
+        allowed = tuple(choices)
+    message = 'value {0!r} not in ' + repr(choices)
+
+    def check(value, trail, errors):
+        try:
+            if value in allowed:
+                return
+        except TypeError:
+            pass
+        errors.append((trail, message.format(value)))
+    return check
+
+
+def compile_regex(node, type_name, location):
+    '''
+        Compile regex check (pattern is searched in value).
+
+        :param node: schema node.
+        :type node: <dict>
+        :param type_name: type name of schema node.
+        :type type_name: <str>
+        :param location: dotted location of node in schema.
+        :type location: <str>
+        :return: check(value, trail, errors) | None.
+        :rtype: <function> | <NoneType>
+        :exceptions: ATSValueError
+    '''
+    if 'regex' not in node:
+        return None
+    if type_name not in ('str', 'any'):
+        raise ATSValueError('{0} [{1}]'.format(
+            'regex for not str type', location or '<root>'
+        ))
+    pattern = node['regex']
+    if isinstance(pattern, STRINGS):
+        pattern = re_compile(pattern)
+    search = pattern.search
+    message = 'value {0!r} not matched ' + repr(pattern.pattern)
+
+    def check(value, trail, errors):
+        if not isinstance(value, STRINGS) or search(value) is None:
+            errors.append((trail, message.format(value)))
+    return check
+
+
+def compile_mapping(node, location):
+    '''
+        Compile check of mapping keys (required, known, additional).
+
+        :param node: schema node.
+        :type node: <dict>
+        :param location: dotted location of node in schema.
+        :type location: <str>
+        :return: check(value, trail, errors) | None.
+        :rtype: <function> | <NoneType>
+        :exceptions: ATSValueError
+    '''
+    keys, additional = node.get('keys', {}), node.get('additional', True)
+    if not keys and additional and 'values' not in node:
+        return None
+    prefix = '{0}.'.format(location) if location else ''
+    children, required = {}, []
+    for key, child in keys.items():
+        children[key] = compile_node(child, '{0}{1}'.format(prefix, key))
+        if isinstance(child, dict) and child.get('required', False):
+            required.append(key)
+    required = frozenset(required)
+    extra = None
+    if 'values' in node:
+        extra = compile_node(node['values'], '{0}*'.format(prefix))
+    children_get = children.get
+
+    def check(value, trail, errors):
+        for key, item in value.items():
+            validator = children_get(key, extra)
+            if validator is not None:
+                validator(item, (trail, key), errors)
+            elif not additional:
+                errors.append(((trail, key), 'key not expected'))
+        if required:
+            for key in sorted(required.difference(value), key=str):
+                errors.append(((trail, key), 'key required'))
+    return check
+
+
+def compile_items(node, location):
+    '''
+        Compile check of list items.
+
+        :param node: schema node.
+        :type node: <dict>
+        :param location: dotted location of node in schema.
+        :type location: <str>
+        :return: check(value, trail, errors) | None.
+        :rtype: <function> | <NoneType>
+        :exceptions: ATSValueError
+    '''
+    if 'items' not in node:
+        return None
+    validator = compile_node(node['items'], '{0}[]'.format(location))
+
+    def check(value, trail, errors):
+        for index, item in enumerate(value):
+            validator(item, (trail, index), errors)
+    return check
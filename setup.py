@@ -81,10 +81,18 @@ setup(
         'ats_utilities.exceptions',
         'ats_utilities.final',
         'ats_utilities.info',
+        'ats_utilities.lazy',
         'ats_utilities.logging',
         'ats_utilities.option',
         'ats_utilities.register',
+        'ats_utilities.schema',
         'ats_utilities.singleton'
     ],
+    entry_points={
+        'console_scripts': [
+            'ats-convert = ats_utilities.config_io.converter:main',
+            'ats-snapshot = ats_utilities.config_io.snapshot_cli:main'
+        ]
+    },
     install_requires=['colorama', 'bs4', 'PyYAML', 'configparser', 'pathlib']
 )
@@ -26,7 +26,10 @@ import sys
 import unittest
 
 try:
-    from ats_utilities.checker import ATSChecker
+    from ats_utilities.checker import ATSChecker, checked
+    from ats_utilities.exceptions.ats_type_error import ATSTypeError
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from ats_utilities.exceptions.ats_bad_call_error import ATSBadCallError
 except ImportError as test_error_message:
     MESSAGE = '\n{0}\n{1}\n'.format(__file__, test_error_message)
     sys.exit(MESSAGE)  # Force close python test ############################
@@ -41,6 +44,12 @@ __email__ = 'elektron.ronca@gmail.com'
 __status__ = 'Updated'
 
 
+@checked('str:name', 'list:items')
+def checked_function(name, items=None, verbose=False):
+    '''Simple function for checking decorator checked.'''
+    return name, items
+
+
 class ATSCheckerTestCase(unittest.TestCase):
     '''
         Defined class ATSCheckerTestCase with attribute(s) and method(s).
@@ -69,6 +78,15 @@ class ATSCheckerTestCase(unittest.TestCase):
                 | test_object_parameter - test for object param checking.
                 | test_type_error - test for type param checking.
                 | test_value_error - test for value param checking.
+                | test_no_report_for_valid - test for skipped usage report.
+                | test_report_for_invalid - test for usage report on error.
+                | test_checked_params - test for decorator checked.
+                | test_checked_type_error - test for checked type error.
+                | test_checked_value_error - test for checked value error.
+                | test_validation_level_off - test for disabled checking.
+                | test_validation_level_failures - test for checking without
+                |     usage report.
+                | test_validation_level_wrong - test for not supported level.
     '''
 
     def setUp(self):
@@ -79,6 +97,7 @@ class ATSCheckerTestCase(unittest.TestCase):
 
     def tearDown(self):
         '''Call after every test case.'''
+        ATSChecker.set_validation_level(ATSChecker.FULL)
         self.error = None
         self.status = -1
 
@@ -202,5 +221,65 @@ class ATSCheckerTestCase(unittest.TestCase):
         ])
         self.assertEqual(self.status, 2)
 
+    def test_no_report_for_valid(self):
+        '''Test for skipped usage report.'''
+        simple_var = {'apple': 1}
+        self.error, self.status = self.checker.check_params([
+            ('dict:simple_var', simple_var)
+        ])
+        self.assertEqual(self.status, 0)
+        self.assertIsNone(self.error)
+
+    def test_report_for_invalid(self):
+        '''Test for usage report on error.'''
+        simple_var = 8
+        self.error, self.status = self.checker.check_params([
+            ('str:simple_var', simple_var)
+        ])
+        self.assertEqual(self.status, 1)
+        self.assertIn('test_report_for_invalid', self.error)
+        self.assertIn('wrong type', self.error)
+
+    def test_checked_params(self):
+        '''Test for decorator checked.'''
+        self.assertEqual(
+            checked_function('test', items=[1, 2]), ('test', [1, 2])
+        )
+
+    def test_checked_type_error(self):
+        '''Test for checked type error.'''
+        with self.assertRaises(ATSTypeError):
+            checked_function(8, [1, 2])
+
+    def test_checked_value_error(self):
+        '''Test for checked value error.'''
+        with self.assertRaises(ATSBadCallError):
+            checked_function('test', items=[])
+
+    def test_validation_level_off(self):
+        '''Test for disabled checking.'''
+        ATSChecker.set_validation_level(ATSChecker.OFF)
+        self.error, self.status = self.checker.check_params([
+            ('str:simple_var', 8)
+        ])
+        self.assertEqual(self.status, 0)
+        self.assertEqual(checked_function(8, []), (8, []))
+
+    def test_validation_level_failures(self):
+        '''Test for checking without usage report.'''
+        ATSChecker.set_validation_level(ATSChecker.FAILURES_ONLY)
+        self.error, self.status = self.checker.check_params([
+            ('list:simple_var', []), ('str:other_var', 8)
+        ])
+        self.assertEqual(self.status, 1)
+        self.assertEqual(self.error, 'str:other_var wrong type')
+        with self.assertRaises(ATSBadCallError):
+            checked_function('test', items=[])
+
+    def test_validation_level_wrong(self):
+        '''Test for not supported level.'''
+        with self.assertRaises(ATSValueError):
+            ATSChecker.set_validation_level('fast')
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,1639 @@
+# -*- coding: UTF-8 -*-
+
+'''
+ Module
+     ats_config_io_test.py
+ Copyright
+     Copyright (C) 2017 Vladimir Roncevic <elektron.ronca@gmail.com>
+     ats_utilities is free software: you can redistribute it and/or modify it
+     under the terms of the GNU General Public License as published by the
+     Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+     ats_utilities is distributed in the hope that it will be useful, but
+     WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+     See the GNU General Public License for more details.
+     You should have received a copy of the GNU General Public License along
+     with this program. If not, see <http://www.gnu.org/licenses/>.
+ Info
+     Defined classes ConfigCacheTestCase, PathMetadataCacheTestCase,
+     JsonBackendTestCase, YamlBackendTestCase, BaseWriteConfigTestCase,
+     BulkReadTestCase, AsyncReadConfigTestCase, ConfigSnapshotTestCase,
+     ConverterTestCase, JsonIndexTestCase, LayeredConfigTestCase,
+     IniMappingTestCase, XmlBackendTestCase, Object2XmlTestCase,
+     MappedReadTestCase, IterElementsTestCase, ConfigWatcherTestCase,
+     IterConfigurationTestCase.
+     Created test cases for checking functionalities of config_io support.
+ Execute
+     python -m unittest -v ats_config_io_test
+'''
+
+import sys
+import unittest
+from mmap import mmap
+from time import sleep
+from threading import Event
+from asyncio import new_event_loop, ensure_future, gather, sleep as wait
+from io import BytesIO
+from json import loads, dumps
+from pickle import PicklingError
+from configparser import ConfigParser
+from xml.etree.ElementTree import fromstring
+from os import remove, fdopen, chmod, listdir, stat
+from os.path import basename, dirname
+from shutil import rmtree
+from tempfile import mkstemp, mkdtemp
+
+try:
+    from yaml import YAMLError, __version__ as yaml_version
+    from ats_utilities.config_io.config_cache import ConfigCache
+    from ats_utilities.config_io.path_cache import PathMetadataCache
+    from ats_utilities.config_io.snapshot import ConfigSnapshot
+    from ats_utilities.config_io.snapshot_cli import main
+    from ats_utilities.config_io.snapshot_file import SnapshotFile
+    from ats_utilities.config_io.layered import LayeredConfig
+    from ats_utilities.config_io.converter import convert_files
+    from ats_utilities.config_io.config_pairs import (
+        element_value, group_pairs, iter_chunks, iter_pairs
+    )
+    from ats_utilities.config_io.base_read import BaseReadConfig
+    from ats_utilities.config_io.base_write import BaseWriteConfig
+    from ats_utilities.config_io import ConfigFile
+    from ats_utilities.config_io.cfg.cfg2object import Cfg2Object
+    from ats_utilities.config_io import bulk_read
+    from ats_utilities.config_io.bulk_read import read_many, iter_many
+    from ats_utilities.config_io.async_read import AsyncReadConfig
+    from ats_utilities.config_io.watcher import ConfigWatcher
+    from ats_utilities.config_io.cfg import CfgBase
+    from ats_utilities.config_io.cfg.object2cfg import Object2Cfg
+    from ats_utilities.info import ATSInfo
+    from ats_utilities.option import ATSOptionParser
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from ats_utilities.config_io.json.json_index import JsonIndex
+    from ats_utilities.config_io.ini.ini_mapping import parse_ini
+    from ats_utilities.config_io.ini.ini2object import Ini2Object
+    from ats_utilities.config_io.json.json_backend import JsonBackend
+    from ats_utilities.config_io.json.json2object import Json2Object
+    from ats_utilities.config_io.json.object2json import Object2Json
+    from ats_utilities.exceptions.ats_key_error import ATSKeyError
+    from ats_utilities.config_io.yaml.yaml_backend import YamlBackend
+    from ats_utilities.config_io.yaml.yaml2object import Yaml2Object
+    from ats_utilities.config_io.yaml.object2yaml import Object2Yaml
+    from ats_utilities.config_io.xml.xml_backend import XmlBackend
+    from ats_utilities.config_io.xml.object2xml import Object2Xml
+    from ats_utilities.config_io.xml.xml2object import Xml2Object
+except ImportError as test_error_message:
+    MESSAGE = '\n{0}\n{1}\n'.format(__file__, test_error_message)
+    sys.exit(MESSAGE)  # Force close python test ############################
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = 'Copyright 2017, https://vroncevic.github.io/ats_utilities'
+__credits__ = ['Vladimir Roncevic']
+__license__ = 'https://github.com/vroncevic/ats_utilities/blob/dev/LICENSE'
+__version__ = '1.8.8'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+
+def temp_file(content, suffix='.cfg'):
+    '''Create temporary file with content.'''
+    file_descriptor, file_path = mkstemp(suffix=suffix)
+    with fdopen(file_descriptor, 'w') as temp:
+        temp.write(content)
+    return file_path
+
+
+def verbose_root(test_case, *classes):
+    '''Set verbose path of classes for test (VerboseRoot of Python 2).'''
+    for root_type in classes:
+        for base in root_type.__mro__:
+            module = base.__module__
+            if module.startswith('ats_utilities') and not hasattr(
+                base, 'VERBOSE'
+            ):
+                base.VERBOSE = module.replace('.', '::')
+                test_case.addCleanup(delattr, base, 'VERBOSE')
+
+
+class ConfigCacheTestCase(unittest.TestCase):
+    '''
+        Defined class ConfigCacheTestCase with attribute(s) and method(s).
+        Created test cases for checking functionalities of ConfigCache.
+        It defines:
+
+            :attributes:
+                | cache - API for caching parsed configurations.
+                | file_path - temporary configuration file path.
+                | parsed - number of parser calls.
+            :methods:
+                | setUp - call before test case.
+                | tearDown - call after test case.
+                | parser - simple configuration parser.
+                | test_cache_hit - test for reading unchanged file.
+                | test_cache_changed - test for reading changed file.
+                | test_cache_lru - test for evicting entries.
+                | test_cache_opt_in - test for not shared configurations.
+    '''
+
+    def setUp(self):
+        '''Call before test case.'''
+        self.cache = ConfigCache(max_entries=2)
+        self.file_path = temp_file('ats_name = simple\n')
+        self.parsed = 0
+
+    def tearDown(self):
+        '''Call after test case.'''
+        remove(self.file_path)
+        self.cache = None
+
+    def parser(self):
+        '''Simple configuration parser.'''
+        self.parsed += 1
+        with open(self.file_path) as cfg:
+            return cfg.read()
+
+    def test_cache_hit(self):
+        '''Test for reading unchanged file.'''
+        first = self.cache.read(self.file_path, self.parser)
+        second = self.cache.read(self.file_path, self.parser)
+        self.assertIs(first, second)
+        self.assertEqual(self.parsed, 1)
+        self.assertEqual(self.cache.statistics()['hits'], 1)
+
+    def test_cache_changed(self):
+        '''Test for reading changed file.'''
+        self.cache.read(self.file_path, self.parser)
+        with open(self.file_path, 'a') as cfg:
+            cfg.write('ats_version = 1.0.0\n')
+        config = self.cache.read(self.file_path, self.parser)
+        self.assertIn('ats_version', config)
+        self.assertEqual(self.parsed, 2)
+
+    def test_cache_lru(self):
+        '''Test for evicting entries.'''
+        for parser_key in range(3):
+            self.cache.read(self.file_path, self.parser, parser_key)
+        self.assertEqual(len(self.cache), 2)
+        self.cache.invalidate(self.file_path)
+        self.assertEqual(len(self.cache), 0)
+
+    def test_cache_opt_in(self):
+        '''Test for not shared configurations of readers by default.'''
+        verbose_root(self, Cfg2Object, ConfigFile)
+        self.assertFalse(BaseReadConfig.CACHE.is_enabled())
+        config = Cfg2Object(self.file_path).read_configuration()
+        config['ats_name'] = 'changed'
+        self.assertEqual(
+            Cfg2Object(self.file_path).read_configuration(),
+            {'ats_name': 'simple'}
+        )
+        self.cache.configure(enabled=False)
+        first = self.cache.read(self.file_path, self.parser)
+        self.assertIsNot(first, self.cache.read(self.file_path, self.parser))
+        self.assertEqual(self.parsed, 2)
+
+
+class PathMetadataCacheTestCase(unittest.TestCase):
+    '''
+        Defined class PathMetadataCacheTestCase with attribute(s) and
+        method(s). Created test cases for checking functionalities of
+        PathMetadataCache.
+        It defines:
+
+            :attributes:
+                | cache - API for caching path metadata.
+                | file_path - temporary configuration file path.
+            :methods:
+                | setUp - call before test case.
+                | tearDown - call after test case.
+                | test_path_hit - test for cached metadata of path.
+                | test_path_invalidate - test for invalidating path.
+                | test_path_ttl - test for disabled cache (TTL 0).
+                | test_path_missing - test for not cached missing path.
+                | test_path_lru - test for evicting least recently used.
+                | test_path_threads - test for lookups from thread pool.
+    '''
+
+    def setUp(self):
+        '''Call before test case.'''
+        self.cache = PathMetadataCache(ttl=60)
+        self.file_path = temp_file('ats_name = simple\n')
+
+    def tearDown(self):
+        '''Call after test case.'''
+        if self.cache.is_file(self.file_path):
+            remove(self.file_path)
+        self.cache = None
+
+    def test_path_hit(self):
+        '''Test for cached metadata of path.'''
+        self.assertTrue(self.cache.is_file(self.file_path))
+        self.assertEqual(self.cache.extension(self.file_path), 'cfg')
+        self.assertEqual(self.cache.statistics()['misses'], 1)
+        self.assertEqual(self.cache.statistics()['hits'], 1)
+
+    def test_path_invalidate(self):
+        '''Test for invalidating path.'''
+        self.assertTrue(self.cache.is_file(self.file_path))
+        remove(self.file_path)
+        self.assertTrue(self.cache.is_file(self.file_path))
+        self.cache.invalidate(self.file_path)
+        self.assertFalse(self.cache.is_file(self.file_path))
+
+    def test_path_ttl(self):
+        '''Test for disabled cache (TTL 0).'''
+        self.cache.configure(ttl=0)
+        self.cache.is_file(self.file_path)
+        self.cache.is_file(self.file_path)
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.statistics()['misses'], 2)
+
+    def test_path_missing(self):
+        '''Test for not cached missing path.'''
+        file_path = '{0}.new'.format(self.file_path)
+        self.assertFalse(self.cache.is_file(file_path))
+        self.assertEqual(len(self.cache), 0)
+        with open(file_path, 'w') as cfg:
+            cfg.write('ats_name = new\n')
+        try:
+            self.assertTrue(self.cache.is_file(file_path))
+        finally:
+            remove(file_path)
+
+    def test_path_lru(self):
+        '''Test for evicting least recently used entry.'''
+        self.cache.configure(max_entries=2)
+        file_path = temp_file('ats_name = other\n')
+        try:
+            self.cache.is_file(self.file_path)
+            self.cache.is_file(file_path)
+            self.cache.is_file(self.file_path)
+            self.cache.is_file(__file__)
+            self.assertEqual(len(self.cache), 2)
+            misses = self.cache.statistics()['misses']
+            self.cache.is_file(self.file_path)
+            self.assertEqual(self.cache.statistics()['misses'], misses)
+            self.cache.is_file(file_path)
+            self.assertEqual(self.cache.statistics()['misses'], misses + 1)
+        finally:
+            remove(file_path)
+
+    def test_path_threads(self):
+        '''Test for lookups from thread pool.'''
+        from concurrent.futures import ThreadPoolExecutor
+        self.cache.configure(max_entries=4)
+        file_paths = [self.file_path, __file__, 'ats_missing.cfg'] * 200
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(self.cache.is_file, file_paths))
+        self.assertEqual(results, [True, True, False] * 200)
+        self.assertLessEqual(len(self.cache), 2)
+
+
+class JsonBackendTestCase(unittest.TestCase):
+    '''
+        Defined class JsonBackendTestCase with attribute(s) and method(s).
+        Created test cases for checking functionalities of JsonBackend.
+        It defines:
+
+            :attributes:
+                | content - json content with edge cases.
+            :methods:
+                | setUp - call before test case.
+                | tearDown - call after test case.
+                | test_backend_decoders - test for decoding semantics.
+                | test_backend_encoder - test for encoding semantics.
+                | test_backend_wrong - test for selecting wrong backend.
+    '''
+
+    def setUp(self):
+        '''Call before test case.'''
+        self.content = (
+            '{"b": [1.0, 0.1, 1e-05, -0.0, 18446744073709551616], '
+            '"a": {"ats": "\\u010d", "nan": NaN}, "c": null}'
+        )
+
+    def tearDown(self):
+        '''Call after test case.'''
+        JsonBackend.select()
+
+    def test_backend_decoders(self):
+        '''Test for decoding semantics.'''
+        for backend in JsonBackend.available():
+            JsonBackend.select(backend)
+            for content in [self.content, self.content.encode('utf-8')]:
+                config = JsonBackend.loads(content)
+                self.assertEqual(list(config), ['b', 'a', 'c'])
+                self.assertEqual(dumps(config), dumps(loads(self.content)))
+
+    def test_backend_encoder(self):
+        '''Test for encoding semantics.'''
+        config = loads(self.content)
+        content = JsonBackend.dumps(config)
+        self.assertEqual(dumps(loads(content)), dumps(config))
+
+    def test_backend_wrong(self):
+        '''Test for selecting wrong backend.'''
+        with self.assertRaises(ATSValueError):
+            JsonBackend.select('wrong_backend')
+        self.assertIn(JsonBackend.STDLIB, JsonBackend.available())
+
+
+
+class YamlBackendTestCase(unittest.TestCase):
+    '''
+        Defined class YamlBackendTestCase with attribute(s) and method(s).
+        Created test cases for checking functionalities of YamlBackend.
+        It defines:
+
+            :attributes:
+                | backend - backend selected before test case.
+            :methods:
+                | setUp - call before test case.
+                | tearDown - call after test case.
+                | test_backend_same - test for same result of backends.
+                | test_backend_safe - test for safe mode.
+                | test_backend_documents - test for multi-document stream.
+                | test_backend_files - test for multi-document yaml file.
+                | test_backend_wrong - test for selecting wrong backend.
+    '''
+
+    def setUp(self):
+        '''Call before test case.'''
+        self.backend = YamlBackend.active()
+
+    def tearDown(self):
+        '''Call after test case.'''
+        YamlBackend.select(self.backend)
+
+    def test_backend_same(self):
+        '''Test for same result of backends.'''
+        content, results = 'ats: [1, 2.5, {name: simple}]\n', []
+        for backend in YamlBackend.available():
+            YamlBackend.select(backend)
+            self.assertEqual(YamlBackend.active(), backend)
+            config = YamlBackend.load(content)
+            results.append((config, YamlBackend.dump(config, safe=True)))
+        self.assertEqual(len(set([str(result) for result in results])), 1)
+
+    def test_backend_safe(self):
+        '''Test for safe mode.'''
+        content = '!!python/tuple [1, 2]'
+        self.assertEqual(YamlBackend.load(content), (1, 2))
+        with self.assertRaises(YAMLError):
+            YamlBackend.load(content, safe=True)
+
+    def test_backend_documents(self):
+        '''Test for multi-document stream (lazy load, chunked dump).'''
+        def documents():
+            for index in range(500):
+                yield {'host': 'host_{0}'.format(index), 'port': index}
+        for backend in YamlBackend.available():
+            YamlBackend.select(backend)
+            chunks = list(YamlBackend.iter_dump(
+                documents(), safe=True, chunk_size=1024,
+                default_flow_style=False, explicit_start=True
+            ))
+            self.assertGreater(len(chunks), 5)
+            loaded = YamlBackend.load_all(''.join(chunks), safe=True)
+            self.assertEqual(next(loaded), {'host': 'host_0', 'port': 0})
+            self.assertEqual(list(loaded), list(documents())[1:])
+            self.assertEqual(
+                list(YamlBackend.load_all('--- 1\n--- [2]\n')), [1, [2]]
+            )
+
+    def test_backend_files(self):
+        '''Test for multi-document yaml file (write, lazy read).'''
+        verbose_root(self, Yaml2Object, Object2Yaml, ConfigFile)
+        documents = [
+            {'host': 'host_{0}'.format(index), 'port': index}
+            for index in range(100)
+        ]
+        file_path = temp_file('', suffix='.yaml')
+        try:
+            for backend in YamlBackend.available():
+                YamlBackend.select(backend)
+                writer = Object2Yaml(file_path, safe=True)
+                self.assertEqual(
+                    writer.write_documents(iter(documents)),
+                    BaseWriteConfig.STATUS_WRITTEN
+                )
+                self.assertEqual(
+                    writer.write_documents(iter(documents)),
+                    BaseWriteConfig.STATUS_SKIPPED
+                )
+                self.assertEqual(
+                    writer.write_documents(None),
+                    BaseWriteConfig.STATUS_FAILED
+                )
+                loaded = Yaml2Object(file_path, safe=True).iter_documents()
+                self.assertEqual(next(loaded), documents[0])
+                self.assertEqual(list(loaded), documents[1:])
+                remove(file_path)
+                open(file_path, 'w').close()
+        finally:
+            remove(file_path)
+
+    def test_backend_wrong(self):
+        '''Test for selecting wrong backend.'''
+        with self.assertRaises(ATSValueError):
+            YamlBackend.select('wrong_backend')
+
+
+class XmlBackendTestCase(unittest.TestCase):
+    '''
+        Defined class XmlBackendTestCase with attribute(s) and method(s).
+        Created test cases for checking functionalities of XmlBackend.
+        It defines:
+
+            :attributes:
+                | content - xml content.
+            :methods:
+                | setUp - call before test case.
+                | tearDown - call after test case.
+                | test_backend_default - test for default backend.
+                | test_backend_same - test for same data of backends.
+                | test_backend_wrong - test for selecting wrong backend.
+                | test_backend_namespaces - test for local names of tags.
+    '''
+
+    def setUp(self):
+        '''Call before test case.'''
+        self.content = b''.join([
+            b'<?xml version="1.0" encoding="UTF-8"?>\n<configuration>',
+            b'<server id="1"><name> a </name><port>80</port></server>',
+            b'<!-- comment --><server><name>b</name></server>',
+            b'<empty/></configuration>'
+        ])
+
+    def tearDown(self):
+        '''Call after test case.'''
+        XmlBackend.select()
+
+    def test_backend_default(self):
+        '''Test for default backend.'''
+        XmlBackend.select()
+        self.assertEqual(XmlBackend.active(), XmlBackend.available()[0])
+        self.assertIn(XmlBackend.ETREE, XmlBackend.available())
+        if XmlBackend.BS4 in XmlBackend.available():
+            self.assertEqual(XmlBackend.active(), XmlBackend.BS4)
+
+    def test_backend_same(self):
+        '''Test for same data of backends.'''
+        expected = {'configuration': {
+            'server': [{'name': 'a', 'port': '80'}, {'name': 'b'}],
+            'empty': ''
+        }}
+        for backend in XmlBackend.available():
+            tree = XmlBackend.parse(BytesIO(self.content), backend)
+            self.assertEqual(XmlBackend.to_data(tree), expected)
+        root = XmlBackend.parse(BytesIO(self.content), XmlBackend.ETREE)
+        self.assertEqual(root.find('server').get('id'), '1')
+
+    def test_backend_wrong(self):
+        '''Test for selecting wrong backend.'''
+        with self.assertRaises(ATSValueError):
+            XmlBackend.select('wrong_backend')
+        with self.assertRaises(ATSValueError):
+            XmlBackend.parse(BytesIO(self.content), 'wrong_backend')
+
+    def test_backend_namespaces(self):
+        '''Test for local names of tags (namespaces are dropped).'''
+        content = b''.join([
+            b'<c xmlns="urn:d" xmlns:x="urn:x">',
+            b'<x:r>1</x:r><r>2</r></c>'
+        ])
+        for backend in XmlBackend.available():
+            tree = XmlBackend.parse(BytesIO(content), backend)
+            self.assertEqual(
+                XmlBackend.to_data(tree), {'c': {'r': ['1', '2']}}
+            )
+
+
+class Object2XmlTestCase(unittest.TestCase):
+    '''
+        Defined class Object2XmlTestCase with attribute(s) and method(s).
+        Created test cases for checking streaming writer of Object2Xml.
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | test_iter_chunks - test for document from dict.
+                | test_iter_chunks_pairs - test for generator of pairs.
+                | test_iter_chunks_wrong - test for not valid names/text.
+    '''
+
+    def test_iter_chunks(self):
+        '''Test for document from dict.'''
+        configuration = {'inventory': {
+            'host': [{'name': 'a<b', 'port': 80}, {'name': 'c&d'}],
+            'empty': None
+        }}
+        content = ''.join(Object2Xml.iter_chunks(configuration))
+        self.assertEqual(content, '\n'.join([
+            '<?xml version="1.0" encoding="UTF-8"?>', '<inventory>',
+            '    <host>', '        <name>a&lt;b</name>',
+            '        <port>80</port>', '    </host>', '    <host>',
+            '        <name>c&amp;d</name>', '    </host>', '    <empty/>',
+            '</inventory>', ''
+        ]))
+        root = XmlBackend.parse(BytesIO(content.encode()), XmlBackend.ETREE)
+        self.assertEqual(XmlBackend.to_data(root), {'inventory': {
+            'host': [{'name': 'a<b', 'port': '80'}, {'name': 'c&d'}],
+            'empty': ''
+        }})
+
+    def test_iter_chunks_pairs(self):
+        '''Test for generator of pairs (constant memory chunks).'''
+        def hosts():
+            for index in range(1000):
+                yield 'host', {'id': index, 'tags': (tag for tag in 'ab')}
+        chunks = list(Object2Xml.iter_chunks(hosts(), 'hosts', 1024))
+        self.assertGreater(len(chunks), 10)
+        self.assertTrue(all([len(chunk) < 2048 for chunk in chunks]))
+        root = fromstring(''.join(chunks).encode())
+        self.assertEqual(root.tag, 'hosts')
+        self.assertEqual(len(root), 1000)
+        self.assertEqual(root[999].find('id').text, '999')
+        self.assertEqual(len(root[0].findall('tags')), 2)
+
+    def test_iter_chunks_wrong(self):
+        '''Test for not valid names and text.'''
+        for configuration in [
+            {'a b': 1}, {'a': {1: 2}}, {'a': 'x\x01'}, {'a': 'x\x00'},
+            {'a': ['x\x0b']}, {'a': 'x\ud800'}, [{'a': 1, 'b': 2}],
+            [{'a': 1, 'b': 2, 'c': 3}], [('a', 1, 2)], ['ab']
+        ]:
+            with self.assertRaises(ATSValueError):
+                list(Object2Xml.iter_chunks(configuration))
+        content = ''.join(Object2Xml.iter_chunks({'a': '\t\r\n\u00e9'}))
+        self.assertEqual(
+            fromstring(content.encode()).find('a').text, '\t\n\u00e9'
+        )
+
+
+
+class BaseWriteConfigTestCase(unittest.TestCase):
+    '''
+        Defined class BaseWriteConfigTestCase with attribute(s) and method(s).
+        Created test cases for checking functionalities of BaseWriteConfig.
+        It defines:
+
+            :attributes:
+                | file_path - temporary configuration file path.
+                | writer - writer of configuration file.
+            :methods:
+                | setUp - call before test case.
+                | tearDown - call after test case.
+                | temp_files - temporary files of writer.
+                | test_fsync_policy - test for setting fsync policy.
+                | test_fsync_policy_wrong - test for wrong fsync policy.
+                | test_write_statistics - test for statistics of writes.
+                | test_write_atomic - test for atomic replace of file.
+                | test_write_failed - test for failed serialization.
+    '''
+
+    def setUp(self):
+        '''Call before test case.'''
+        verbose_root(self, Object2Cfg, ConfigFile)
+        self.file_path = temp_file('ats_name = simple\n')
+        chmod(self.file_path, 0o640)
+        self.writer = Object2Cfg(self.file_path)
+
+    def tearDown(self):
+        '''Call after test case.'''
+        BaseWriteConfig.set_fsync_policy(BaseWriteConfig.FSYNC_FILE)
+        BaseWriteConfig.set_skip_unchanged(True)
+        remove(self.file_path)
+
+    def temp_files(self):
+        '''Temporary files of writer.'''
+        prefix = '.{0}.'.format(basename(self.file_path))
+        return [
+            name for name in listdir(dirname(self.file_path))
+            if name.startswith(prefix)
+        ]
+
+    def test_fsync_policy(self):
+        '''Test for setting fsync policy.'''
+        BaseWriteConfig.set_fsync_policy(BaseWriteConfig.FSYNC_DIR)
+        self.assertEqual(
+            BaseWriteConfig.get_fsync_policy(), BaseWriteConfig.FSYNC_DIR
+        )
+
+    def test_fsync_policy_wrong(self):
+        '''Test for wrong fsync policy.'''
+        with self.assertRaises(ATSValueError):
+            BaseWriteConfig.set_fsync_policy('always')
+
+    def test_write_statistics(self):
+        '''Test for statistics of writes (unchanged content is skipped).'''
+        statistics = BaseWriteConfig.write_statistics()
+        self.assertEqual(
+            sorted(statistics), ['failed', 'skipped', 'written']
+        )
+        expected = dict(statistics)
+        for content, status, counter in [
+            ('ats_name = one\n', BaseWriteConfig.STATUS_WRITTEN, 'written'),
+            ('ats_name = one\n', BaseWriteConfig.STATUS_SKIPPED, 'skipped'),
+            (iter(['ats_name', ' = one\n']),
+             BaseWriteConfig.STATUS_SKIPPED, 'skipped'),
+            ('ats_name = two\n', BaseWriteConfig.STATUS_WRITTEN, 'written')
+        ]:
+            self.assertEqual(self.writer.write_atomic(content, 'cfg'), status)
+            expected[counter] += 1
+            self.assertEqual(BaseWriteConfig.write_statistics(), expected)
+        BaseWriteConfig.set_skip_unchanged(False)
+        status = self.writer.write_atomic('ats_name = two\n', 'cfg')
+        self.assertEqual(status, BaseWriteConfig.STATUS_WRITTEN)
+        expected['written'] += 1
+        self.assertEqual(BaseWriteConfig.write_statistics(), expected)
+        with open(self.file_path) as cfg:
+            self.assertEqual(cfg.read(), 'ats_name = two\n')
+
+    def test_write_atomic(self):
+        '''Test for atomic replace of file (permissions are kept).'''
+        inode = stat(self.file_path).st_ino
+        status = self.writer.write_atomic(
+            (chunk for chunk in ['ats_name = ', 'atomic\n']), 'cfg'
+        )
+        self.assertEqual(status, BaseWriteConfig.STATUS_WRITTEN)
+        self.assertNotEqual(stat(self.file_path).st_ino, inode)
+        self.assertEqual(stat(self.file_path).st_mode & 0o777, 0o640)
+        with open(self.file_path) as cfg:
+            self.assertEqual(cfg.read(), 'ats_name = atomic\n')
+        self.assertEqual(self.temp_files(), [])
+
+    def test_write_failed(self):
+        '''Test for failed serialization (file and temp file).'''
+        def chunks():
+            yield 'ats_name = '
+            raise RuntimeError('serialization failed')
+        with self.assertRaises(RuntimeError):
+            self.writer.write_atomic(chunks(), 'cfg')
+        with open(self.file_path) as cfg:
+            self.assertEqual(cfg.read(), 'ats_name = simple\n')
+        self.assertEqual(self.temp_files(), [])
+
+
+
+class BulkReadTestCase(unittest.TestCase):
+    '''
+        Defined class BulkReadTestCase with attribute(s) and method(s).
+        Created test cases for checking functionalities of bulk reading.
+        It defines:
+
+            :attributes:
+                | file_paths - paths of not supported configuration files.
+            :methods:
+                | setUp - call before test case.
+                | test_read_many - test for ordered results.
+                | test_iter_many - test for results in completion order.
+                | test_executor_wrong - test for wrong executor.
+                | test_read_process - test for results of process pool.
+    '''
+
+    def setUp(self):
+        '''Call before test case.'''
+        self.file_paths = [
+            'ats_{0}.txt'.format(index) for index in range(10)
+        ]
+
+    def tearDown(self):
+        '''Call after test case.'''
+        XmlBackend.select()
+
+    def test_read_many(self):
+        '''Test for ordered results.'''
+        for executor in ['thread', 'process']:
+            results = read_many(
+                self.file_paths + self.file_paths[:2], workers=3,
+                executor=executor
+            )
+            self.assertEqual(list(results), self.file_paths)
+            self.assertFalse(any([
+                result.is_ok() for result in results.values()
+            ]))
+
+    def test_iter_many(self):
+        '''Test for results in completion order.'''
+        file_paths = sorted([
+            result.file_path for result in iter_many(self.file_paths)
+        ])
+        self.assertEqual(file_paths, sorted(self.file_paths))
+
+    def test_executor_wrong(self):
+        '''Test for wrong executor.'''
+        with self.assertRaises(ATSValueError):
+            read_many(self.file_paths, executor='cluster')
+
+    def test_read_process(self):
+        '''Test for results of process pool (plain xml, worker errors).'''
+        verbose_root(self, Xml2Object, Json2Object, ConfigFile)
+        file_paths = [
+            temp_file('<r><k>1</k><k>2</k></r>', suffix='.xml'),
+            temp_file('{"a": 1}', suffix='.json')
+        ]
+        read_files = bulk_read.read_files
+
+        def broken_worker(*args):
+            '''Worker with result which can not be pickled.'''
+            raise PicklingError('can not pickle result')
+
+        try:
+            for backend in XmlBackend.available():
+                XmlBackend.select(backend)
+                results = list(read_many(
+                    file_paths, workers=1, executor='process'
+                ).values())
+                self.assertEqual(
+                    results[0].configuration, {'r': {'k': ['1', '2']}}
+                )
+                self.assertEqual(results[1].configuration, {'a': 1})
+            bulk_read.read_files = broken_worker
+            results = read_many(file_paths, workers=1, executor='thread')
+            self.assertEqual(sorted(results), sorted(file_paths))
+            for result in results.values():
+                self.assertFalse(result.is_ok())
+                self.assertIn('PicklingError', result.error)
+        finally:
+            bulk_read.read_files = read_files
+            for file_path in file_paths:
+                remove(file_path)
+
+
+class SlowReader(object):
+    '''Simple reader with slow reading of configuration.'''
+
+    def __init__(self, mode=None):
+        '''Initial constructor.'''
+        self.file_path = 'ats_slow.cfg'
+        self.mode = mode
+        self.parsed = 0
+
+    def parser_key(self):
+        '''Key of parser (mode of reader).'''
+        return self.mode
+
+    def read_configuration(self, verbose=False):
+        '''Slow reading of configuration.'''
+        self.parsed += 1
+        sleep(0.1)
+        return {'ats_name': 'slow', 'mode': self.mode}
+
+
+class AsyncReadConfigTestCase(unittest.TestCase):
+    '''
+        Defined class AsyncReadConfigTestCase with attribute(s) and method(s).
+        Created test cases for checking functionalities of AsyncReadConfig.
+        It defines:
+
+            :attributes:
+                | loop - event loop for test case.
+                | reader - simple reader with slow reading.
+            :methods:
+                | setUp - call before test case.
+                | tearDown - call after test case.
+                | test_single_flight - test for sharing one parse.
+                | test_cancel - test for cancelling one await.
+                | test_single_flight_modes - test for not shared modes.
+    '''
+
+    def setUp(self):
+        '''Call before test case.'''
+        self.loop = new_event_loop()
+        self.reader = SlowReader()
+
+    def tearDown(self):
+        '''Call after test case.'''
+        self.loop.close()
+
+    def test_single_flight(self):
+        '''Test for sharing one parse.'''
+        async def read():
+            return await gather(*[
+                AsyncReadConfig(self.reader).read_configuration()
+                for _ in range(5)
+            ])
+        configurations = self.loop.run_until_complete(read())
+        self.assertEqual(self.reader.parsed, 1)
+        self.assertEqual(len(configurations), 5)
+
+    def test_cancel(self):
+        '''Test for cancelling one await.'''
+        async def read():
+            reads = [
+                ensure_future(
+                    AsyncReadConfig(self.reader).read_configuration()
+                ) for _ in range(2)
+            ]
+            await wait(0.01)
+            reads[0].cancel()
+            return await gather(*reads, return_exceptions=True)
+        configurations = self.loop.run_until_complete(read())
+        self.assertEqual(
+            configurations[1], {'ats_name': 'slow', 'mode': None}
+        )
+        self.assertEqual(self.reader.parsed, 1)
+
+    def test_single_flight_modes(self):
+        '''Test for not shared parse of readers in different modes.'''
+        readers = [SlowReader(True), SlowReader(False)]
+        async def read():
+            return await gather(*[
+                AsyncReadConfig(reader).read_configuration()
+                for reader in readers * 2
+            ])
+        configurations = self.loop.run_until_complete(read())
+        self.assertEqual([reader.parsed for reader in readers], [1, 1])
+        self.assertEqual(
+            [config['mode'] for config in configurations],
+            [True, False, True, False]
+        )
+        verbose_root(self, Yaml2Object)
+        file_path = temp_file('ats: 1\n', suffix='.yaml')
+        try:
+            self.assertNotEqual(
+                Yaml2Object(file_path, safe=True).parser_key(),
+                Yaml2Object(file_path).parser_key()
+            )
+        finally:
+            remove(file_path)
+
+
+class ConfigSnapshotTestCase(unittest.TestCase):
+    '''
+        Defined class ConfigSnapshotTestCase with attribute(s) and method(s).
+        Created test cases for checking functionalities of ConfigSnapshot.
+        It defines:
+
+            :attributes:
+                | cache_dir - temporary snapshot cache directory.
+                | snapshots - API for binary snapshots of configurations.
+                | file_path - temporary configuration file path.
+                | parsed - number of parser calls.
+            :methods:
+                | setUp - call before test case.
+                | tearDown - call after test case.
+                | parser - simple configuration parser.
+                | test_snapshot_hit - test for loading unchanged file.
+                | test_snapshot_stale - test for loading changed file.
+                | test_snapshot_corrupt - test for corrupt snapshot.
+                | test_snapshot_missing_dir - test for not written snapshot.
+                | test_snapshot_libraries - test for parser libraries.
+    '''
+
+    def setUp(self):
+        '''Call before test case.'''
+        self.cache_dir = mkdtemp()
+        self.snapshots = ConfigSnapshot(enabled=True, cache_dir=self.cache_dir)
+        self.file_path = temp_file('ats_name = simple\n')
+        self.parsed = 0
+
+    def tearDown(self):
+        '''Call after test case.'''
+        remove(self.file_path)
+        rmtree(self.cache_dir)
+
+    def parser(self):
+        '''Simple configuration parser.'''
+        self.parsed += 1
+        with open(self.file_path) as cfg:
+            return dict([cfg.read().strip().split(' = ')])
+
+    def test_snapshot_hit(self):
+        '''Test for loading unchanged file.'''
+        first = self.snapshots.load(self.file_path, self.parser, 'cfg')
+        second = self.snapshots.load(self.file_path, self.parser, 'cfg')
+        self.assertEqual(first, {'ats_name': 'simple'})
+        self.assertEqual(first, second)
+        self.assertEqual(self.parsed, 1)
+        self.assertEqual(self.snapshots.statistics()['hits'], 1)
+        self.snapshots.load(self.file_path, self.parser, 'cfg:2')
+        self.assertEqual(self.parsed, 2)
+
+    def test_snapshot_stale(self):
+        '''Test for loading changed file.'''
+        self.snapshots.load(self.file_path, self.parser, 'cfg')
+        with open(self.file_path, 'w') as cfg:
+            cfg.write('ats_name = changed\n')
+        config = self.snapshots.load(self.file_path, self.parser, 'cfg')
+        self.assertEqual(config, {'ats_name': 'changed'})
+        self.assertEqual(self.parsed, 2)
+
+    def test_snapshot_corrupt(self):
+        '''Test for corrupt snapshot.'''
+        self.snapshots.load(self.file_path, self.parser, 'cfg')
+        snapshot_path = self.snapshots.path(self.file_path, 'cfg')
+        with open(snapshot_path, 'r+b') as snapshot:
+            snapshot.seek(-4, 2)
+            snapshot.write(b'\x00\x00\x00\x00')
+        config = self.snapshots.load(self.file_path, self.parser, 'cfg')
+        self.assertEqual(config, {'ats_name': 'simple'})
+        self.assertEqual(self.parsed, 2)
+        self.assertEqual(self.snapshots.statistics()['errors'], 1)
+
+    def test_snapshot_missing_dir(self):
+        '''Test for not written snapshot (missing cache directory).'''
+        cache_dir = '{0}/missing'.format(self.cache_dir)
+        self.snapshots.configure(cache_dir=cache_dir)
+        config = self.snapshots.load(self.file_path, self.parser, 'cfg')
+        self.assertEqual(config, {'ats_name': 'simple'})
+        self.assertEqual(self.snapshots.statistics()['errors'], 1)
+        verbose_root(self, Cfg2Object, ConfigFile)
+        try:
+            self.assertEqual(main([self.file_path, '-d', cache_dir]), 1)
+            self.assertEqual(main([self.file_path, '-d', self.cache_dir]), 0)
+        finally:
+            BaseReadConfig.SNAPSHOTS.configure(enabled=False, cache_dir='')
+
+    def test_snapshot_libraries(self):
+        '''Test for parser libraries (versions, not picklable trees).'''
+        verbose_root(self, Xml2Object, Yaml2Object, ConfigFile)
+        yaml_path = temp_file('a: 1\n', suffix='.yaml')
+        xml_path = temp_file('<r><k>1</k></r>', suffix='.xml')
+        reader = Yaml2Object(yaml_path)
+        self.assertEqual(reader.parser_libraries(), ['yaml'])
+        self.assertEqual(
+            SnapshotFile.library_version('yaml'),
+            'yaml-{0}'.format(yaml_version)
+        )
+        BaseReadConfig.SNAPSHOTS.configure(
+            enabled=True, cache_dir=self.cache_dir
+        )
+        try:
+            self.assertEqual(reader.read_configuration(), {'a': 1})
+            self.assertEqual(len(listdir(self.cache_dir)), 1)
+            if XmlBackend.LXML in XmlBackend.available():
+                errors = BaseReadConfig.SNAPSHOTS.statistics()['errors']
+                config = Xml2Object(xml_path).read_configuration(
+                    backend=XmlBackend.LXML
+                )
+                self.assertEqual(config.tag, 'r')
+                self.assertEqual(len(listdir(self.cache_dir)), 1)
+                self.assertEqual(
+                    BaseReadConfig.SNAPSHOTS.statistics()['errors'], errors
+                )
+        finally:
+            BaseReadConfig.SNAPSHOTS.configure(enabled=False, cache_dir='')
+            remove(yaml_path)
+            remove(xml_path)
+
+
+class ConverterTestCase(unittest.TestCase):
+    '''
+        Defined class ConverterTestCase with attribute(s) and method(s).
+        Created test cases for checking functionalities of converter.
+        It defines:
+
+            :attributes:
+                | file_path - temporary json lines file path.
+            :methods:
+                | setUp - call before test case.
+                | tearDown - call after test case.
+                | test_jsonl_pairs - test for streaming json lines pairs.
+                | test_element_value - test for value of xml element.
+                | test_streaming_chunks - test for chunks of target formats.
+                | test_convert_errors - test for errors of converted files.
+                | test_convert_repeated - test for repeated keys of pairs.
+    '''
+
+    def setUp(self):
+        '''Call before test case.'''
+        self.file_path = temp_file(
+            '{"a": 1}\n\n{"b": {"c": "d & e"}}\n', suffix='.jsonl'
+        )
+
+    def tearDown(self):
+        '''Call after test case.'''
+        remove(self.file_path)
+
+    def test_jsonl_pairs(self):
+        '''Test for streaming json lines pairs.'''
+        self.assertEqual(
+            list(iter_pairs(self.file_path)),
+            [('a', 1), ('b', {'c': 'd & e'})]
+        )
+
+    def test_element_value(self):
+        '''Test for value of xml element.'''
+        element = fromstring('<i><k>1</k><k>2</k><n> x </n></i>')
+        self.assertEqual(
+            element_value(element), {'k': ['1', '2'], 'n': 'x'}
+        )
+
+    def test_streaming_chunks(self):
+        '''Test for chunks of target formats.'''
+        pairs = list(iter_pairs(self.file_path))
+        cfg = ''.join(iter_chunks(pairs, 'cfg'))
+        self.assertEqual(cfg.splitlines()[0], 'a = 1')
+        self.assertEqual(loads(cfg.splitlines()[1][4:]), {'c': 'd & e'})
+        jsonl = ''.join(iter_chunks(pairs, 'jsonl')).splitlines()
+        self.assertEqual([loads(line) for line in jsonl], [
+            {'a': 1}, {'b': {'c': 'd & e'}}
+        ])
+        xml = fromstring(''.join(iter_chunks(pairs, 'xml')).encode())
+        self.assertEqual(element_value(xml), {
+            'a': '1', 'b': {'c': 'd & e'}
+        })
+        with self.assertRaises(ATSValueError):
+            list(iter_chunks(pairs, 'yaml'))
+
+    def test_convert_errors(self):
+        '''Test for errors of converted files.'''
+        verbose_root(self, BaseWriteConfig, Cfg2Object, ConfigFile)
+        target = '{0}.cfg'.format(self.file_path)
+        wrong = temp_file('{"a": 1}\n{"b"\n', suffix='.jsonl')
+        try:
+            results = convert_files([
+                (self.file_path, target), (wrong, target),
+                (self.file_path, '{0}.txt'.format(self.file_path))
+            ])
+            self.assertEqual(results[0], (
+                self.file_path, BaseWriteConfig.STATUS_WRITTEN, None
+            ))
+            self.assertEqual(results[1][:2], (
+                wrong, BaseWriteConfig.STATUS_FAILED
+            ))
+            self.assertIn('Error', results[1][2])
+            self.assertEqual(results[2][1], BaseWriteConfig.STATUS_FAILED)
+            self.assertTrue(results[2][2].startswith('ATSValueError: '))
+            with open(target) as cfg_file:
+                self.assertEqual(cfg_file.readline(), 'a = 1\n')
+        finally:
+            remove(wrong)
+            remove(target)
+
+    def test_convert_repeated(self):
+        '''Test for repeated keys of pairs (grouped, not dropped).'''
+        verbose_root(
+            self, BaseWriteConfig, Object2Json, Xml2Object, Yaml2Object,
+            ConfigFile
+        )
+        self.assertEqual(
+            group_pairs([('a', [1]), ('b', 2), ('a', 3), ('a', [4])]),
+            {'a': [[1], 3, [4]], 'b': 2}
+        )
+        source = temp_file(
+            '<configuration><item>1</item><item>2</item><item>3</item>'
+            '<name>x</name></configuration>', suffix='.xml'
+        )
+        dated = temp_file('when: 2020-01-01\n', suffix='.yaml')
+        target = '{0}.json'.format(source)
+        try:
+            results = convert_files([
+                (source, target), (dated, target),
+                (dated, '{0}.jsonl'.format(dated))
+            ])
+            self.assertEqual(results[0], (
+                source, BaseWriteConfig.STATUS_WRITTEN, None
+            ))
+            with open(target) as json_file:
+                self.assertEqual(loads(json_file.read()), {
+                    'item': ['1', '2', '3'], 'name': 'x'
+                })
+            for _, status, error in results[1:]:
+                self.assertEqual(status, BaseWriteConfig.STATUS_FAILED)
+                self.assertTrue(error.startswith(
+                    ('TypeError: ', 'JSONEncodeError: ')
+                ))
+        finally:
+            remove(source)
+            remove(dated)
+            remove(target)
+
+
+class JsonIndexTestCase(unittest.TestCase):
+    '''
+        Defined class JsonIndexTestCase with attribute(s) and method(s).
+        Created test cases for checking functionalities of JsonIndex.
+        It defines:
+
+            :attributes:
+                | configuration - json configuration.
+                | file_path - temporary json file path.
+            :methods:
+                | setUp - call before test case.
+                | tearDown - call after test case.
+                | test_index_pointers - test for indexed json pointers.
+                | test_index_get - test for reading values by json pointer.
+                | test_index_stale - test for rebuilding stale index.
+    '''
+
+    def setUp(self):
+        '''Call before test case.'''
+        self.configuration = {
+            'servers': [{'name': 'a,]}'}, {'name': 'b', 'ports': [1]}],
+            'a/b': {'~': None}, 'empty': [], 'wide': 2 ** 70
+        }
+        self.file_path = temp_file(
+            dumps(self.configuration, indent=2), suffix='.json'
+        )
+
+    def tearDown(self):
+        '''Call after test case.'''
+        remove(self.file_path)
+        remove('{0}{1}'.format(self.file_path, JsonIndex.EXTENSION))
+
+    def test_index_pointers(self):
+        '''Test for indexed json pointers.'''
+        self.assertEqual(JsonIndex(self.file_path).pointers(), [
+            '/a~1b', '/empty', '/servers', '/wide'
+        ])
+        self.assertEqual(len(JsonIndex(self.file_path, depth=2).pointers()), 7)
+
+    def test_index_get(self):
+        '''Test for reading values by json pointer.'''
+        index = JsonIndex(self.file_path)
+        self.assertEqual(index.get('/servers/1/ports/0'), 1)
+        self.assertEqual(index.get('/servers/0/name'), 'a,]}')
+        self.assertIsNone(index.get('/a~1b/~0'))
+        self.assertEqual(index.get('/wide'), 2 ** 70)
+        self.assertEqual(index.get(''), self.configuration)
+        with self.assertRaises(ATSKeyError):
+            index.get('/servers/2')
+        with self.assertRaises(ATSKeyError):
+            index.get('/missing/0')
+        with self.assertRaises(ATSValueError):
+            index.get('servers')
+
+    def test_index_stale(self):
+        '''Test for rebuilding stale index.'''
+        JsonIndex(self.file_path).build()
+        self.assertTrue(JsonIndex(self.file_path).load())
+        with open(self.file_path, 'w') as json_file:
+            json_file.write(dumps({'servers': ['c']}))
+        index = JsonIndex(self.file_path)
+        self.assertFalse(index.load())
+        self.assertEqual(index.get('/servers/0'), 'c')
+
+
+class LayeredConfigTestCase(unittest.TestCase):
+    '''
+        Defined class LayeredConfigTestCase with attribute(s) and method(s).
+        Created test cases for checking functionalities of LayeredConfig.
+        It defines:
+
+            :attributes:
+                | config - API for layered configuration.
+            :methods:
+                | setUp - call before test case.
+                | test_layered_lookup - test for merged dotted key lookups.
+                | test_layered_update - test for replacing one layer.
+                | test_layered_shadow - test for scalar replacing subtree.
+    '''
+
+    def setUp(self):
+        '''Call before test case.'''
+        self.config = LayeredConfig([
+            {'db': {'pool': {'size': 5, 'timeout': 30}, 'host': 'a'}},
+            {'db': {'pool': {'size': 10}}}
+        ])
+
+    def test_layered_lookup(self):
+        '''Test for merged dotted key lookups.'''
+        self.assertEqual(self.config['db.pool.size'], 10)
+        self.assertEqual(self.config['db.pool.timeout'], 30)
+        self.assertEqual(self.config.source_of('db.pool.size'), 'layer1')
+        self.assertEqual(self.config['db.pool'], {'size': 10, 'timeout': 30})
+        self.assertIn('db', self.config)
+        self.assertIsNone(self.config.get('db.port'))
+        with self.assertRaises(ATSKeyError):
+            self.config['db.port']
+
+    def test_layered_update(self):
+        '''Test for replacing one layer.'''
+        self.config.update_layer('layer1', {'db': {'host': 'b'}})
+        self.assertEqual(self.config['db.pool.size'], 5)
+        self.assertEqual(self.config['db.host'], 'b')
+        self.assertEqual(len(self.config), 3)
+
+    def test_layered_shadow(self):
+        '''Test for scalar replacing subtree.'''
+        self.config.add_layer({'db': 'sqlite'}, 'host')
+        self.assertEqual(self.config.keys(), ['db'])
+        self.config.update_layer('host', {})
+        self.assertEqual(self.config.as_dict(), {
+            'db': {'pool': {'size': 10, 'timeout': 30}, 'host': 'a'}
+        })
+
+
+class IniMappingTestCase(unittest.TestCase):
+    '''
+        Defined class IniMappingTestCase with attribute(s) and method(s).
+        Created test cases for checking parsing of ini to plain dicts.
+        It defines:
+
+            :attributes:
+                | content - ini content.
+            :methods:
+                | setUp - call before test case.
+                | test_parse_ini - test for same values as ConfigParser.
+                | test_parse_ini_raw - test for disabled interpolation.
+                | test_parse_ini_errors - test for not valid content.
+                | test_read_mapping - test for not shared mapping of reader.
+    '''
+
+    def setUp(self):
+        '''Call before test case.'''
+        self.content = '\n'.join([
+            '# comment', '[DEFAULT]', 'root = /opt', '', '[paths]',
+            'Bin = %(root)s/bin', 'log: 100%%', 'tags = alpha', '    beta',
+            '', '; comment', '[empty]', ''
+        ])
+
+    def test_parse_ini(self):
+        '''Test for same values as ConfigParser.'''
+        config = ConfigParser()
+        config.read_string(self.content)
+        expected = dict(
+            (section, dict(config[section])) for section in config
+        )
+        mapping = parse_ini(self.content.splitlines())
+        self.assertEqual(mapping, expected)
+        self.assertEqual(list(mapping), ['DEFAULT', 'paths', 'empty'])
+        self.assertEqual(mapping['paths']['tags'], 'alpha\nbeta')
+        self.assertEqual(mapping['empty'], {'root': '/opt'})
+
+    def test_parse_ini_raw(self):
+        '''Test for disabled interpolation.'''
+        mapping = parse_ini(self.content.splitlines(), interpolation=False)
+        self.assertEqual(mapping['paths']['bin'], '%(root)s/bin')
+        self.assertEqual(mapping['paths']['log'], '100%%')
+
+    def test_parse_ini_errors(self):
+        '''Test for not valid content.'''
+        for content in [
+            'key = value', '[a]\nkey', '[a]\n= value', '[a]\n[a]',
+            '[a]\nkey = 1\nKey = 2', '[a]\nkey = %(missing)s',
+            '[a]\nkey = 100%', '[a]\nkey = %(key)s'
+        ]:
+            with self.assertRaises(ATSValueError):
+                parse_ini(content.splitlines())
+
+    def test_read_mapping(self):
+        '''Test for not shared mapping of reader with enabled cache.'''
+        verbose_root(self, Ini2Object, ConfigFile)
+        file_path = temp_file(self.content, suffix='.ini')
+        BaseReadConfig.CACHE.configure(enabled=True)
+        try:
+            mapping = Ini2Object(file_path).read_mapping()
+            mapping['paths']['bin'] = 'changed'
+            mapping['new'] = {}
+            mapping = Ini2Object(file_path).read_mapping()
+            self.assertEqual(mapping['paths']['bin'], '/opt/bin')
+            self.assertNotIn('new', mapping)
+            frozen = Ini2Object(file_path).read_mapping(frozen=True)
+            with self.assertRaises(TypeError):
+                frozen['paths']['bin'] = 'changed'
+        finally:
+            BaseReadConfig.CACHE.configure(enabled=False)
+            remove(file_path)
+
+
+class MappedReadTestCase(unittest.TestCase):
+    '''
+        Defined class MappedReadTestCase with attribute(s) and method(s).
+        Created test cases for checking memory-mapped read mode.
+        It defines:
+
+            :attributes:
+                | mapped_size - file size for memory-mapped read.
+                | file_paths - temporary configuration file paths.
+            :methods:
+                | setUp - call before test case.
+                | tearDown - call after test case.
+                | test_mapped_file - test for memory map of config file.
+                | test_mapped_read - test for same result of mapped read.
+    '''
+
+    def setUp(self):
+        '''Call before test case.'''
+        verbose_root(self, ConfigFile, Cfg2Object, Json2Object, Xml2Object)
+        self.mapped_size = BaseReadConfig.MAPPED_SIZE
+        BaseReadConfig.MAPPED_SIZE = 1
+        self.file_paths = {
+            'cfg': temp_file('ats_name = \u010dvor\nats = 1\n'),
+            'json': temp_file('{"ats": [1, "\u010d"]}', suffix='.json'),
+            'xml': temp_file(
+                '<c><ats>1</ats><ats>\u010d</ats></c>', suffix='.xml'
+            )
+        }
+
+    def tearDown(self):
+        '''Call after test case.'''
+        BaseReadConfig.MAPPED_SIZE = self.mapped_size
+        JsonBackend.select()
+        XmlBackend.select()
+        for file_path in self.file_paths.values():
+            remove(file_path)
+
+    def test_mapped_file(self):
+        '''Test for memory map of configuration file.'''
+        file_path = self.file_paths['cfg']
+        with ConfigFile(file_path, 'r', 'cfg', mapped=True) as cfg:
+            self.assertIsInstance(cfg, mmap)
+            self.assertEqual(cfg[:4], b'ats_')
+            self.assertEqual(cfg.readline().decode('utf-8').strip(), (
+                'ats_name = \u010dvor'
+            ))
+        with ConfigFile(file_path, 'w', 'cfg', mapped=True) as cfg:
+            self.assertIsNone(cfg)
+
+    def test_mapped_read(self):
+        '''Test for same result of mapped and not mapped read.'''
+        reader = Cfg2Object(self.file_paths['cfg'])
+        self.assertTrue(reader.is_mapped_read())
+        self.assertEqual(reader.read_configuration(), {
+            'ats_name': '\u010dvor', 'ats': '1'
+        })
+        for backend in JsonBackend.available():
+            JsonBackend.select(backend)
+            self.assertEqual(
+                Json2Object(self.file_paths['json']).read_configuration(),
+                {'ats': [1, '\u010d']}
+            )
+        for backend in XmlBackend.available():
+            XmlBackend.select(backend)
+            reader = Xml2Object(self.file_paths['xml'])
+            self.assertEqual(
+                XmlBackend.to_data(reader.read_configuration()),
+                {'c': {'ats': ['1', '\u010d']}}
+            )
+            self.assertEqual(
+                reader.read_data(), {'c': {'ats': ['1', '\u010d']}}
+            )
+
+
+class IterElementsTestCase(unittest.TestCase):
+    '''
+        Defined class IterElementsTestCase with attribute(s) and method(s).
+        Created test cases for checking streaming of xml elements.
+        It defines:
+
+            :attributes:
+                | file_path - temporary xml file path.
+            :methods:
+                | setUp - call before test case.
+                | tearDown - call after test case.
+                | test_iter_children - test for children of root element.
+                | test_iter_tags - test for tag filter.
+                | test_iter_path - test for path filter.
+                | test_iter_early_stop - test for stopping iteration.
+    '''
+
+    def setUp(self):
+        '''Call before test case.'''
+        verbose_root(self, ConfigFile, Xml2Object)
+        self.file_path = temp_file(''.join([
+            '<c><a id="1"><b>x</b><b>y</b></a><d><a id="2"><b>z</b></a></d>',
+            '<b>w</b></c>'
+        ]), suffix='.xml')
+
+    def tearDown(self):
+        '''Call after test case.'''
+        remove(self.file_path)
+
+    def test_iter_children(self):
+        '''Test for children of root element.'''
+        elements = list(Xml2Object(self.file_path).iter_elements())
+        self.assertEqual([element.tag for element in elements], [
+            'a', 'd', 'b'
+        ])
+        self.assertEqual(elements[1].find('a/b').text, 'z')
+
+    def test_iter_tags(self):
+        '''Test for tag filter (yielded elements stay complete).'''
+        elements = list(Xml2Object(self.file_path).iter_elements(tags=['a']))
+        self.assertEqual([element.get('id') for element in elements], [
+            '1', '2'
+        ])
+        self.assertEqual(
+            [child.text for child in elements[0]], ['x', 'y']
+        )
+        elements = Xml2Object(self.file_path).iter_elements(tags={'a', 'b'})
+        self.assertEqual([element.tag for element in elements], [
+            'a', 'a', 'b'
+        ])
+
+    def test_iter_path(self):
+        '''Test for path filter.'''
+        elements = list(Xml2Object(self.file_path).iter_elements(
+            path='/c/d/a/b'
+        ))
+        self.assertEqual([element.text for element in elements], ['z'])
+        elements = Xml2Object(self.file_path).iter_elements(
+            tags=['b'], path='c/b'
+        )
+        self.assertEqual([element.text for element in elements], ['w'])
+
+    def test_iter_early_stop(self):
+        '''Test for stopping iteration (file is closed).'''
+        elements = Xml2Object(self.file_path).iter_elements(tags=['b'])
+        self.assertEqual(next(elements).text, 'x')
+        elements.close()
+        self.assertIsNone(elements.gi_frame)
+        with self.assertRaises(StopIteration):
+            next(elements)
+
+
+class ConfigWatcherTestCase(unittest.TestCase):
+    '''
+        Defined class ConfigWatcherTestCase with attribute(s) and method(s).
+        Created test cases for checking functionalities of ConfigWatcher.
+        It defines:
+
+            :attributes:
+                | file_path - temporary configuration file path.
+                | reloaded - reloaded configurations.
+                | changed - event for reloaded configuration.
+                | watcher - API for hot reload (polling backend).
+            :methods:
+                | setUp - call before test case.
+                | tearDown - call after test case.
+                | callback - collect reloaded configuration.
+                | write - write configuration file (new stat signature).
+                | test_watch_change - test for reloading changed file.
+                | test_watch_delete - test for deleted and restored file.
+                | test_watch_stop - test for stopped watcher.
+                | test_watch_tool - test for refreshed tool state.
+                | test_watch_malformed - test for not valid saved content.
+    '''
+
+    def setUp(self):
+        '''Call before test case.'''
+        verbose_root(
+            self, Cfg2Object, Object2Cfg, ConfigFile, ConfigWatcher,
+            CfgBase, ATSInfo, ATSOptionParser
+        )
+        self.file_path = temp_file('ats_name = simple\n')
+        self.reloaded, self.changed = [], Event()
+        self.watcher = ConfigWatcher(
+            Cfg2Object(self.file_path), self.callback, debounce=0.05,
+            interval=0.05, backend=ConfigWatcher.POLLING
+        )
+
+    def tearDown(self):
+        '''Call after test case.'''
+        self.watcher.stop()
+        remove(self.file_path)
+
+    def callback(self, configuration):
+        '''Collect reloaded configuration.'''
+        self.reloaded.append(configuration)
+        self.changed.set()
+
+    def write(self, content):
+        '''Write configuration file (new stat signature).'''
+        with open(self.file_path, 'w') as cfg:
+            cfg.write(content)
+
+    def test_watch_change(self):
+        '''Test for reloading changed file.'''
+        self.assertTrue(self.watcher.start())
+        self.assertEqual(self.watcher.backend, ConfigWatcher.POLLING)
+        self.assertEqual(self.watcher.configuration, {'ats_name': 'simple'})
+        self.write('ats_name = changed\nats_version = 1.0.0\n')
+        self.assertTrue(self.changed.wait(5))
+        self.assertEqual(self.watcher.configuration, {
+            'ats_name': 'changed', 'ats_version': '1.0.0'
+        })
+        self.assertEqual(self.reloaded, [self.watcher.configuration])
+
+    def test_watch_delete(self):
+        '''Test for deleted and restored file.'''
+        self.watcher.start()
+        remove(self.file_path)
+        self.assertFalse(self.changed.wait(0.3))
+        self.assertFalse(self.watcher.check())
+        self.assertEqual(self.watcher.configuration, {'ats_name': 'simple'})
+        self.write('ats_name = restored, again\n')
+        self.assertTrue(self.changed.wait(5))
+        self.assertEqual(self.reloaded, [{'ats_name': 'restored, again'}])
+
+    def test_watch_stop(self):
+        '''Test for stopped watcher.'''
+        self.watcher.start()
+        self.watcher.stop()
+        self.write('ats_name = changed\n')
+        self.assertFalse(self.changed.wait(0.3))
+        self.assertEqual(self.watcher.configuration, {'ats_name': 'simple'})
+        self.assertTrue(self.watcher.check())
+        self.assertEqual(self.reloaded, [{'ats_name': 'changed'}])
+        with self.assertRaises(ATSValueError):
+            ConfigWatcher(Cfg2Object(self.file_path), backend='kqueue')
+
+    def test_watch_tool(self):
+        '''Test for refreshed tool state (informations and options).'''
+        informations = [
+            'ats_name = ats_watch', 'ats_version = 1.0.0',
+            'ats_build_date = 24 Apr 2021', 'ats_licence = GPL'
+        ]
+        self.write('\n'.join(informations) + '\n')
+        tool = CfgBase(self.file_path)
+        self.assertTrue(tool.is_tool_ok())
+        option_parser = tool.option_parser
+        self.watcher.stop()
+        self.watcher = tool.watch(self.callback)
+        self.write('\n'.join(informations + ['ats_wrong = 1']) + '\n')
+        self.assertTrue(self.changed.wait(5))
+        self.assertFalse(tool.is_tool_ok())
+        self.changed.clear()
+        self.write('\n'.join(informations).replace('1.0.0', '2.0.0'))
+        self.assertTrue(self.changed.wait(5))
+        self.assertTrue(tool.is_tool_ok())
+        self.assertIs(tool.option_parser, option_parser)
+        self.assertIn('2.0.0', str(tool.option_parser))
+
+    def test_watch_malformed(self):
+        '''Test for not valid saved content (parser error is skipped).'''
+        verbose_root(self, Json2Object)
+        json_path = temp_file('{"a": 1}', suffix='.json')
+        self.watcher.stop()
+        self.watcher = ConfigWatcher(
+            Json2Object(json_path), self.callback, debounce=0.05,
+            interval=0.05, backend=ConfigWatcher.POLLING
+        )
+        try:
+            self.watcher.start()
+            with open(json_path, 'w') as json_file:
+                json_file.write('{"a": ')
+            self.assertFalse(self.changed.wait(0.5))
+            self.assertEqual(self.watcher.configuration, {'a': 1})
+            with open(json_path, 'w') as json_file:
+                json_file.write('{"a": 2}')
+            self.assertTrue(self.changed.wait(5))
+            self.assertEqual(self.reloaded, [{'a': 2}])
+        finally:
+            self.watcher.stop()
+            remove(json_path)
+
+
+class IterConfigurationTestCase(unittest.TestCase):
+    '''
+        Defined class IterConfigurationTestCase with attribute(s) and
+        method(s). Created test cases for checking streaming of cfg pairs.
+        It defines:
+
+            :attributes:
+                | mapped_size - file size for memory-mapped read.
+                | file_path - temporary configuration file path.
+            :methods:
+                | setUp - call before test case.
+                | tearDown - call after test case.
+                | test_iter_chunks - test for lines split across chunks.
+                | test_iter_multibyte - test for character split by chunk.
+                | test_iter_close - test for closing generator early.
+    '''
+
+    def setUp(self):
+        '''Call before test case.'''
+        verbose_root(self, Cfg2Object, ConfigFile)
+        self.mapped_size = BaseReadConfig.MAPPED_SIZE
+        self.file_path = temp_file(
+            'a = 1\nbb = x=y\n\nccc = \u010d\u0107\nd = \u20ac', suffix='.cfg'
+        )
+
+    def tearDown(self):
+        '''Call after test case.'''
+        BaseReadConfig.MAPPED_SIZE = self.mapped_size
+        remove(self.file_path)
+
+    def test_iter_chunks(self):
+        '''Test for lines split across chunk boundaries.'''
+        expected = [
+            ('a', '1'), ('bb', 'x=y'), ('ccc', '\u010d\u0107'),
+            ('d', '\u20ac')
+        ]
+        reader = Cfg2Object(self.file_path)
+        for chunk_size in range(1, 8):
+            self.assertEqual(
+                list(reader.iter_configuration(chunk_size)), expected
+            )
+        self.assertEqual(reader.read_configuration(), dict(expected))
+
+    def test_iter_multibyte(self):
+        '''Test for multibyte character split by chunk (mapped read).'''
+        BaseReadConfig.MAPPED_SIZE = 1
+        reader = Cfg2Object(self.file_path)
+        self.assertTrue(reader.is_mapped_read())
+        for chunk_size in range(1, 8):
+            pairs = dict(reader.iter_configuration(chunk_size))
+            self.assertEqual(pairs['ccc'], '\u010d\u0107')
+            self.assertEqual(pairs['d'], '\u20ac')
+
+    def test_iter_close(self):
+        '''Test for closing generator early.'''
+        for mapped_size in [self.mapped_size, 1]:
+            BaseReadConfig.MAPPED_SIZE = mapped_size
+            pairs = Cfg2Object(self.file_path).iter_configuration(2)
+            self.assertEqual(next(pairs), ('a', '1'))
+            pairs.close()
+            self.assertIsNone(pairs.gi_frame)
+            with self.assertRaises(StopIteration):
+                next(pairs)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+# -*- coding: UTF-8 -*-
+
+'''
+ Module
+     ats_import_test.py
+ Copyright
+     Copyright (C) 2017 Vladimir Roncevic <elektron.ronca@gmail.com>
+     ats_utilities is free software: you can redistribute it and/or modify it
+     under the terms of the GNU General Public License as published by the
+     Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+     ats_utilities is distributed in the hope that it will be useful, but
+     WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+     See the GNU General Public License for more details.
+     You should have received a copy of the GNU General Public License along
+     with this program. If not, see <http://www.gnu.org/licenses/>.
+ Info
+     Defined class ImportTimeTestCase.
+     Created test cases for checking import time of ats_utilities.
+ Execute
+     python -m unittest -v ats_import_test
+'''
+
+import sys
+import unittest
+from os import environ
+from subprocess import check_output, STDOUT
+from os.path import abspath, dirname
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = 'Copyright 2017, https://vroncevic.github.io/ats_utilities'
+__credits__ = ['Vladimir Roncevic']
+__license__ = 'https://github.com/vroncevic/ats_utilities/blob/dev/LICENSE'
+__version__ = '1.8.8'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+
+def import_time(module):
+    '''Import module in new interpreter (-X importtime).'''
+    environment = dict(environ)
+    environment['PYTHONPATH'] = dirname(dirname(abspath(__file__)))
+    output = check_output([
+        sys.executable, '-X', 'importtime', '-c',
+        'import {0}'.format(module)
+    ], stderr=STDOUT, env=environment).decode('utf-8')
+    modules = {}
+    for line in output.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        if cumulative.strip().isdigit():
+            modules[name.strip()] = int(cumulative)
+    return modules
+
+
+@unittest.skipIf(sys.version_info < (3, 7), 'requires -X importtime')
+class ImportTimeTestCase(unittest.TestCase):
+    '''
+        Defined class ImportTimeTestCase with attribute(s) and method(s).
+        Created test cases for checking import time of ats_utilities.
+        It defines:
+
+            :attributes:
+                | BUDGET_US - import time budget (microseconds, ~2x cost).
+                | HEAVY - modules imported on first use only.
+                | CLI - CLI modules with lightweight import.
+            :methods:
+                | test_heavy_deferred - test for deferred heavy imports.
+                | test_import_budget - test for import time budget.
+                | test_lazy_attributes - test for lazy package attributes.
+    '''
+
+    BUDGET_US = 150000
+    HEAVY = [
+        'bs4', 'yaml', 'colorama', 'inspect', 'tempfile', 'ctypes',
+        'asyncio', 'concurrent.futures'
+    ]
+    CLI = [
+        'ats_utilities.cli.cfg_cli', 'ats_utilities.cli.ini_cli',
+        'ats_utilities.cli.json_cli', 'ats_utilities.cli.xml_cli',
+        'ats_utilities.cli.yaml_cli'
+    ]
+
+    def test_heavy_deferred(self):
+        '''Test for deferred heavy imports.'''
+        for module in ImportTimeTestCase.CLI:
+            imported = import_time(module)
+            self.assertIn(module, imported)
+            for heavy in ImportTimeTestCase.HEAVY:
+                self.assertNotIn(heavy, imported, module)
+
+    def test_import_budget(self):
+        '''Test for import time budget.'''
+        for module in ImportTimeTestCase.CLI:
+            imported = import_time(module)
+            self.assertLess(imported[module], ImportTimeTestCase.BUDGET_US)
+
+    def test_lazy_attributes(self):
+        '''Test for lazy package attributes.'''
+        environment = dict(environ)
+        environment['PYTHONPATH'] = dirname(dirname(abspath(__file__)))
+        output = check_output([
+            sys.executable, '-c', '; '.join([
+                'import sys', 'import ats_utilities.config_io as config_io',
+                'config_io.ConfigCache', 'print(sorted(sys.modules))'
+            ])
+        ], env=environment).decode('utf-8')
+        self.assertIn('ats_utilities.config_io.config_cache', output)
+        self.assertNotIn('ats_utilities.config_io.bulk_read', output)
+        self.assertNotIn('ats_utilities.config_io.watcher', output)
+
+if __name__ == '__main__':
+    unittest.main()
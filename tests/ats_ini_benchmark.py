@@ -0,0 +1,104 @@
+# -*- coding: UTF-8 -*-
+
+'''
+ Module
+     ats_ini_benchmark.py
+ Copyright
+     Copyright (C) 2017 Vladimir Roncevic <elektron.ronca@gmail.com>
+     ats_utilities is free software: you can redistribute it and/or modify it
+     under the terms of the GNU General Public License as published by the
+     Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+     ats_utilities is distributed in the hope that it will be useful, but
+     WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+     See the GNU General Public License for more details.
+     You should have received a copy of the GNU General Public License along
+     with this program. If not, see <http://www.gnu.org/licenses/>.
+ Info
+     Benchmark for ini readers (ConfigParser and plain dicts), load and
+     lookup on test configuration and on large synthetic configuration.
+ Execute
+     python ats_ini_benchmark.py [number of synthetic sections]
+'''
+
+import sys
+from timeit import Timer
+from os.path import dirname, join
+from configparser import ConfigParser
+
+try:
+    from ats_utilities.config_io.ini.ini_mapping import parse_ini
+except ImportError as test_error_message:
+    MESSAGE = '\n{0}\n{1}\n'.format(__file__, test_error_message)
+    sys.exit(MESSAGE)  # Force close python test ############################
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = 'Copyright 2017, https://vroncevic.github.io/ats_utilities'
+__credits__ = ['Vladimir Roncevic']
+__license__ = 'https://github.com/vroncevic/ats_utilities/blob/dev/LICENSE'
+__version__ = '1.8.8'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+CONFIGURATION = join(dirname(__file__), 'config', 'ats_cli_ini_api.ini')
+
+
+def synthetic(sections):
+    '''Create large synthetic ini configuration.'''
+    lines = ['[DEFAULT]', 'ats_root = /opt/ats', '']
+    for index in range(sections):
+        lines.extend([
+            '[ats_section_{0}]'.format(index),
+            'ats_name = record_{0}'.format(index),
+            'ats_value = {0}'.format(index * 0.5),
+            'ats_enabled = {0}'.format(index % 2 == 0),
+            'ats_path = %(ats_root)s/record_{0}'.format(index),
+            'ats_tags = alpha', '    beta', '    gamma', ''
+        ])
+    return '\n'.join(lines)
+
+
+def config_parser(content):
+    '''Load content with ConfigParser.'''
+    config = ConfigParser()
+    config.read_string(content)
+    return config
+
+
+def mapping(content):
+    '''Load content to plain dicts (interpolation resolved).'''
+    return parse_ini(content.splitlines())
+
+
+def lookup(config):
+    '''Read every option of every section.'''
+    for section in config:
+        options = config[section]
+        for option in options:
+            options[option]
+
+
+def benchmark(name, content, repeat):
+    '''Print load and lookup times of ini readers.'''
+    print('{0} ({1} bytes), load | lookup'.format(name, len(content)))
+    base_load = base_lookup = None
+    for reader, load in [('configparser', config_parser), ('dict', mapping)]:
+        config = load(content)
+        load_time = min(Timer(lambda: load(content)).repeat(3, repeat))
+        lookup_time = min(Timer(lambda: lookup(config)).repeat(3, repeat))
+        load_time, lookup_time = load_time / repeat, lookup_time / repeat
+        base_load = base_load or load_time
+        base_lookup = base_lookup or lookup_time
+        print('    {0:<12} {1:10.6f}s x{2:6.2f} | {3:10.6f}s x{4:6.2f}'.format(
+            reader, load_time, base_load / load_time,
+            lookup_time, base_lookup / lookup_time
+        ))
+
+
+if __name__ == '__main__':
+    SECTIONS = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    with open(CONFIGURATION) as ini_file:
+        benchmark(CONFIGURATION, ini_file.read(), 2000)
+    benchmark('synthetic', synthetic(SECTIONS), 3)
@@ -0,0 +1,92 @@
+# -*- coding: UTF-8 -*-
+
+'''
+ Module
+     ats_json_benchmark.py
+ Copyright
+     Copyright (C) 2017 Vladimir Roncevic <elektron.ronca@gmail.com>
+     ats_utilities is free software: you can redistribute it and/or modify it
+     under the terms of the GNU General Public License as published by the
+     Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+     ats_utilities is distributed in the hope that it will be useful, but
+     WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+     See the GNU General Public License for more details.
+     You should have received a copy of the GNU General Public License along
+     with this program. If not, see <http://www.gnu.org/licenses/>.
+ Info
+     Benchmark for json backends (decode/encode) on test configurations
+     and on large synthetic configuration.
+ Execute
+     python ats_json_benchmark.py [number of synthetic records]
+'''
+
+import sys
+from json import dumps
+from timeit import Timer
+from os.path import dirname, join
+
+try:
+    from ats_utilities.config_io.json.json_backend import JsonBackend
+except ImportError as test_error_message:
+    MESSAGE = '\n{0}\n{1}\n'.format(__file__, test_error_message)
+    sys.exit(MESSAGE)  # Force close python test ############################
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = 'Copyright 2017, https://vroncevic.github.io/ats_utilities'
+__credits__ = ['Vladimir Roncevic']
+__license__ = 'https://github.com/vroncevic/ats_utilities/blob/dev/LICENSE'
+__version__ = '1.8.8'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+CONFIGURATION = join(dirname(__file__), 'config', 'ats_cli_json_api.json')
+
+
+def synthetic(records):
+    '''Create large synthetic json configuration.'''
+    return dumps({
+        'ats_records': [
+            {
+                'ats_name': 'record_{0}'.format(index),
+                'ats_value': index * 0.5, 'ats_enabled': index % 2 == 0,
+                'ats_tags': ['alpha', 'beta', 'gamma'],
+                'ats_options': {'depth': index % 7, 'path': '/opt/ats'}
+            } for index in range(records)
+        ]
+    })
+
+
+def measure(content, repeat):
+    '''Best time of decode and encode for active backend.'''
+    config = JsonBackend.loads(content)
+    decode = min(Timer(lambda: JsonBackend.loads(content)).repeat(3, repeat))
+    encode = min(Timer(lambda: JsonBackend.dumps(config)).repeat(3, repeat))
+    return decode / repeat, encode / repeat
+
+
+def benchmark(name, content, repeat):
+    '''Print times and speedup of registered backends.'''
+    print('{0} ({1} bytes), decode | encode'.format(name, len(content)))
+    JsonBackend.select(JsonBackend.STDLIB)
+    base_decode, base_encode = measure(content, repeat)
+    for backend in JsonBackend.available():
+        JsonBackend.select(backend)
+        decode, encode = measure(content, repeat)
+        print('    {0:<10} {1:10.6f}s x{2:5.2f} | {3:10.6f}s x{4:5.2f}'.format(
+            backend, decode, base_decode / decode,
+            encode, base_encode / encode
+        ))
+    JsonBackend.select()
+
+
+if __name__ == '__main__':
+    RECORDS = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    with open(CONFIGURATION) as json_file:
+        benchmark(CONFIGURATION, json_file.read(), 10000)
+    benchmark('synthetic', synthetic(RECORDS), 5)
+    print('auto selection (decoder, encoder): {0}'.format(
+        JsonBackend.active()
+    ))
@@ -0,0 +1,132 @@
+# -*- coding: UTF-8 -*-
+
+'''
+ Module
+     ats_schema_test.py
+ Copyright
+     Copyright (C) 2017 Vladimir Roncevic <elektron.ronca@gmail.com>
+     ats_utilities is free software: you can redistribute it and/or modify it
+     under the terms of the GNU General Public License as published by the
+     Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+     ats_utilities is distributed in the hope that it will be useful, but
+     WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+     See the GNU General Public License for more details.
+     You should have received a copy of the GNU General Public License along
+     with this program. If not, see <http://www.gnu.org/licenses/>.
+ Info
+     Defined class SchemaTestCase with attribute(s) and method(s).
+     Created test cases for checking functionalities of Schema.
+ Execute
+     python -m unittest -v ats_schema_test
+'''
+
+import sys
+import unittest
+from configparser import ConfigParser
+
+try:
+    from ats_utilities.schema import Schema
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+except ImportError as test_error_message:
+    MESSAGE = '\n{0}\n{1}\n'.format(__file__, test_error_message)
+    sys.exit(MESSAGE)  # Force close python test ############################
+
+__author__ = 'Vladimir Roncevic'
+__copyright__ = 'Copyright 2017, https://vroncevic.github.io/ats_utilities'
+__credits__ = ['Vladimir Roncevic']
+__license__ = 'https://github.com/vroncevic/ats_utilities/blob/dev/LICENSE'
+__version__ = '1.8.8'
+__maintainer__ = 'Vladimir Roncevic'
+__email__ = 'elektron.ronca@gmail.com'
+__status__ = 'Updated'
+
+
+class SchemaTestCase(unittest.TestCase):
+    '''
+        Defined class SchemaTestCase with attribute(s) and method(s).
+        Created test cases for checking functionalities of Schema.
+        It defines:
+
+            :attributes:
+                | schema - compiled schema of server configuration.
+            :methods:
+                | setUp - call before test case.
+                | tearDown - call after test case.
+                | test_valid - test valid configuration.
+                | test_errors - test collecting of all errors.
+                | test_mapping - test validation of ConfigParser.
+                | test_not_valid_schema - test compile errors.
+    '''
+
+    def setUp(self):
+        '''Call before test case.'''
+        self.schema = Schema({
+            'additional': False,
+            'keys': {
+                'name': {'type': 'str', 'required': True, 'regex': r'^\w+$'},
+                'port': {'type': 'int', 'min': 1, 'max': 65535},
+                'mode': {'enum': ['master', 'slave']},
+                'debug': 'bool',
+                'tags': {'items': {'type': 'str', 'max': 8}},
+                'limits': {'values': {'type': 'number', 'nullable': True}}
+            }
+        })
+
+    def tearDown(self):
+        '''Call after test case.'''
+        self.schema = None
+
+    def test_valid(self):
+        '''Test valid configuration.'''
+        configuration = {
+            'name': 'server', 'port': 8080, 'mode': 'master',
+            'debug': False, 'tags': ['web'], 'limits': {'cpu': 0.5, 'io': None}
+        }
+        self.assertEqual(self.schema.validate(configuration), [])
+        self.assertTrue(self.schema.is_valid(configuration))
+
+    def test_errors(self):
+        '''Test collecting of all errors.'''
+        errors = self.schema.validate({
+            'port': True, 'mode': 'other', 'debug': 'no',
+            'tags': ['web', 'long_tag_name', 1], 'limits': {'cpu': 'x'},
+            'extra': 1
+        })
+        self.assertEqual(sorted([path for path, _ in errors]), [
+            'debug', 'extra', 'limits.cpu', 'mode', 'name', 'port',
+            'tags.1', 'tags.2'
+        ])
+        self.assertFalse(self.schema.is_valid({'name': 'not valid'}))
+        self.assertFalse(self.schema.is_valid({'name': 'a', 'port': 0}))
+        self.assertFalse(self.schema.is_valid([]))
+
+    def test_mapping(self):
+        '''Test validation of ConfigParser.'''
+        config = ConfigParser()
+        config.read_string(u'[server]\nport = 8080\nhost = local\n')
+        schema = Schema({'values': {
+            'keys': {'port': {'type': 'str', 'regex': r'^\d+$'}},
+            'values': 'str'
+        }})
+        self.assertTrue(schema.is_valid(config))
+        config.set('server', 'port', 'http')
+        self.assertEqual(
+            [path for path, _ in schema.validate(config)], ['server.port']
+        )
+
+    def test_not_valid_schema(self):
+        '''Test compile errors.'''
+        with self.assertRaises(ATSValueError):
+            Schema({'type': 'text'})
+        with self.assertRaises(ATSValueError):
+            Schema({'keys': {'port': {'minimum': 1}}})
+        with self.assertRaises(ATSValueError):
+            Schema({'type': 'int', 'min': 2, 'max': 1})
+        with self.assertRaises(ATSValueError):
+            Schema({'type': 'int', 'regex': '^1'})
+
+
+if __name__ == '__main__':
+    unittest.main()